@@ -61,7 +61,7 @@ import os
 import queue
 import time
 import shutil
-from typing import Optional, Callable, List, Dict, Any
+from typing import Optional, Callable, List, Dict, Any, Union
 from enum import Enum
 from .logging_config import get_logger
 from .path_validation import get_sandbox, safe_read_audio_file, create_safe_temp_file
@@ -743,8 +743,9 @@ class AudioManager:
             if status:
                 logger.warning(f"Audio callback status: {status}")
             
-            # Convert numpy array to bytes
-            audio_data = indata.copy()
+            # tobytes() below already copies out of the stream's buffer, so the
+            # block is read in place rather than copied first
+            audio_data = indata
             
             # Debug: Check the shape and type of input data (only log occasionally)
             if hasattr(self, '_callback_count'):
@@ -758,12 +759,10 @@ class AudioManager:
             audio_bytes = audio_data.tobytes()
             
             # Debug: Check if we're receiving actual audio data
+            rms = 0.0
             if len(audio_bytes) > 0:
-                # Calculate RMS to check if there's actual audio content
-                if audio_data.dtype == np.float32:
-                    rms = np.sqrt(np.mean(audio_data ** 2))
-                else:
-                    rms = np.sqrt(np.mean(audio_data.astype(np.float32) ** 2))
+                # RMS serves both the debug log and the visualization level below
+                rms = self._block_rms(audio_data)
                 
                 # Only log audio level occasionally to avoid spam
                 if self._callback_count % 200 == 1:  # Log every 200th callback
@@ -790,12 +789,7 @@ class AudioManager:
             # Calculate audio level for visualization (thread-safe)
             if self.on_audio_level:
                 try:
-                    # Calculate RMS (Root Mean Square) as a measure of audio level
-                    if audio_data.dtype == np.float32:
-                        rms = np.sqrt(np.mean(audio_data ** 2))
-                    else:
-                        rms = np.sqrt(np.mean(audio_data.astype(np.float32) ** 2))
-                    # Normalize to 0-1 range (adjust sensitivity as needed)
+                    # Normalize the block RMS to 0-1 range (adjust sensitivity as needed)
                     level = min(1.0, rms / 0.1)  # Adjust divisor for float32 sensitivity
                     self.on_audio_level(level)
                 except Exception as e:
@@ -811,6 +805,22 @@ class AudioManager:
         except Exception as e:
             logger.error(f"Error in audio callback: {e}")
     
+    @staticmethod
+    def _block_rms(samples: np.ndarray) -> float:
+        """
+        Calculate the RMS of one audio block without allocating a squared copy.
+        
+        Args:
+            samples: Audio block from the stream callback (float32 normally)
+            
+        Returns:
+            Root mean square of the samples
+        """
+        flat = samples.reshape(-1)  # A view for the contiguous blocks the stream delivers
+        if flat.dtype != np.float32:
+            flat = flat.astype(np.float32)
+        return float(np.sqrt(np.dot(flat, flat) / flat.size))
+    
     def _cleanup_stream(self) -> None:
         """Clean up audio stream"""
         try:
@@ -823,12 +833,12 @@ class AudioManager:
             self.stream = None
             self.is_recording = False
     
-    def save_audio_to_file(self, frames: List[bytes], filename: str) -> bool:
+    def save_audio_to_file(self, frames: Union[List[bytes], bytes], filename: str) -> bool:
         """
         Save recorded audio frames to a WAV file using sandboxed operations.
         
         Args:
-            frames: List of audio frames (bytes)
+            frames: List of audio frames (bytes), or the frames already joined
             filename: Output filename
             
         Returns:
@@ -850,16 +860,23 @@ class AudioManager:
             
             # Save directly to the requested filename
             logger.info(f"Saving audio to: {filename}")
-            logger.info(f"Audio data: {len(frames)} frames, total bytes: {sum(len(f) for f in frames)}")
-            
-            with wave.open(str(filename), 'wb') as wf:
+            pcm_bytes = frames if isinstance(frames, (bytes, bytearray)) else b''.join(frames)
+            logger.info(f"Audio data: {len(pcm_bytes)} bytes")
+            
+            # An existing file (the controller's persistent recording path) is truncated
+            # and rewritten in place, avoiding a create/rename per utterance; its reader
+            # only opens it after this returns. New files are written next to the
+            # target and renamed into place so they never appear half-written.
+            in_place = os.path.exists(filename)
+            write_filename = str(filename) if in_place else f"{filename}.tmp"
+            with open(write_filename, 'wb') as f, wave.open(f, 'wb') as wf:
                 wf.setnchannels(self.channels)
                 wf.setsampwidth(2)  # int16 = 2 bytes per sample (WAV standard)
                 wf.setframerate(self.sample_rate)
                 
                 # Convert float32 data to int16 for WAV format
                 import numpy as np
-                audio_data = np.frombuffer(b''.join(frames), dtype=np.float32)
+                audio_data = np.frombuffer(pcm_bytes, dtype=np.float32)
                 logger.info(f"Audio data shape: {audio_data.shape}, dtype: {audio_data.dtype}")
                 logger.info(f"Audio data range: min={audio_data.min():.6f}, max={audio_data.max():.6f}")
                 
@@ -869,11 +886,21 @@ class AudioManager:
                 logger.info(f"Converted audio range: min={audio_int16.min()}, max={audio_int16.max()}")
                 
                 wf.writeframes(audio_int16.tobytes())
-                logger.info(f"WAV file written successfully to {filename}")
+                # Finalize the header, then flush to disk before anyone reads it
+                wf.close()
+                f.flush()
+                os.fsync(f.fileno())
+            if not in_place:
+                os.replace(write_filename, str(filename))
+            logger.info(f"WAV file written successfully to {filename}")
             return True
             
         except Exception as e:
             logger.error(f"Error saving audio to {filename}: {e}")
+            try:
+                os.unlink(f"{filename}.tmp")
+            except OSError:
+                pass
             return False
     
     def test_device(self, device_index: Optional[int] = None) -> bool:
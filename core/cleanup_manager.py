@@ -9,7 +9,7 @@ verification, and timeout protection to ensure proper resource management
 during application shutdown.
 
 Features:
-    - Ordered cleanup phases
+    - Ordered cleanup phases (independent phases run concurrently)
     - Verification of cleanup success
     - Timeout protection
     - Detailed logging and error reporting
@@ -22,6 +22,8 @@ Last Updated: December 2024
 import time
 import threading
 import logging
+import concurrent.futures
+from collections import Counter
 from typing import Dict, List, Callable, Optional, Any, Tuple
 from enum import Enum
 from dataclasses import dataclass
@@ -42,6 +44,21 @@ class CleanupPhase(Enum):
     SYSTEM_RESOURCES = "system_resources"
     FINAL_CLEANUP = "final_cleanup"
 
+# Phases grouped into stages; stages run in order, phases within a stage are
+# independent and their tasks run concurrently so one slow teardown (e.g. the
+# model worker) does not serialize behind the others
+CLEANUP_STAGES: Tuple[Tuple[CleanupPhase, ...], ...] = (
+    (CleanupPhase.UI_WIDGETS,),
+    (CleanupPhase.AUDIO_RESOURCES, CleanupPhase.HOTKEY_RESOURCES,
+     CleanupPhase.MODEL_RESOURCES, CleanupPhase.NETWORK_RESOURCES),
+    (CleanupPhase.FILE_RESOURCES,),
+    (CleanupPhase.SYSTEM_RESOURCES,),
+    (CleanupPhase.FINAL_CLEANUP,),
+)
+
+# Upper bound on cleanup tasks executed at the same time within a stage
+MAX_PARALLEL_CLEANUP_TASKS = 4
+
 class CleanupStatus(Enum):
     """Status of cleanup operations"""
     PENDING = "pending"
@@ -92,6 +109,9 @@ class CleanupManager:
         self._cleanup_lock = threading.Lock()
         self._cleanup_started = False
         self._cleanup_completed = False
+        # Summary of finished results; only cached once cleanup has completed
+        # (results are final from then on) and dropped on register/reset
+        self._summary_cache: Optional[Dict[str, Any]] = None
         
         logger.info(f"Cleanup manager initialized with {global_timeout}s timeout")
     
@@ -106,6 +126,7 @@ class CleanupManager:
             self.results.clear()
             self._cleanup_started = False
             self._cleanup_completed = False
+            self._summary_cache = None
             logger.debug("Cleanup manager reset for testing")
     
     def register_task(self, task: CleanupTask) -> None:
@@ -125,6 +146,7 @@ class CleanupManager:
                 status=CleanupStatus.PENDING,
                 duration=0.0
             )
+            self._summary_cache = None
             
             logger.debug(f"Registered cleanup task: {task.name} (phase: {task.phase.value})")
     
@@ -155,7 +177,7 @@ class CleanupManager:
     
     def cleanup_all(self) -> Dict[str, CleanupResult]:
         """
-        Execute all cleanup tasks in ordered phases.
+        Execute all cleanup tasks in ordered stages of independent phases.
         
         Returns:
             Dictionary of cleanup results
@@ -171,24 +193,25 @@ class CleanupManager:
             logger.info("Starting comprehensive cleanup process")
         
         try:
-            # Execute cleanup phases in order
-            phases = list(CleanupPhase)
-            for phase in phases:
+            # Execute cleanup stages in order
+            for stage in CLEANUP_STAGES:
                 phase_start_time = time.time()
-                logger.info(f"Starting cleanup phase: {phase.value}")
+                stage_name = "+".join(phase.value for phase in stage)
                 
-                # Get tasks for this phase
-                phase_tasks = [task for task in self.tasks.values() if task.phase == phase]
+                # Get tasks for this stage
+                phase_tasks = [task for task in self.tasks.values() if task.phase in stage]
                 
                 if not phase_tasks:
-                    logger.debug(f"No tasks for phase: {phase.value}")
+                    logger.debug(f"No tasks for phase: {stage_name}")
                     continue
                 
-                # Execute tasks in this phase
+                logger.info(f"Starting cleanup phase: {stage_name}")
+                
+                # Execute tasks in this stage
                 phase_success = self._execute_phase(phase_tasks)
                 
                 phase_duration = time.time() - phase_start_time
-                logger.info(f"Phase {phase.value} completed in {phase_duration:.2f}s (success: {phase_success})")
+                logger.info(f"Phase {stage_name} completed in {phase_duration:.2f}s (success: {phase_success})")
                 
                 # Check global timeout
                 total_duration = time.time() - cleanup_start_time
@@ -220,10 +243,26 @@ class CleanupManager:
         return self.results.copy()
     
     def _execute_phase(self, tasks: List[CleanupTask]) -> bool:
-        """Execute all tasks in a phase"""
+        """Execute all tasks in a phase; tasks without dependencies run concurrently"""
         phase_success = True
         
-        for task in tasks:
+        independent = [task for task in tasks if not task.dependencies]
+        sequential = [task for task in tasks if task.dependencies]
+        
+        if len(independent) > 1:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(MAX_PARALLEL_CLEANUP_TASKS, len(independent)),
+                thread_name_prefix="whiz-cleanup"
+            ) as executor:
+                outcomes = list(executor.map(self._execute_task, independent))
+            for task, task_success in zip(independent, outcomes):
+                if not task_success and task.critical:
+                    phase_success = False
+        else:
+            sequential = independent + sequential
+        
+        # Tasks with dependencies run afterwards, in registration order
+        for task in sequential:
             # Check dependencies
             if not self._check_dependencies(task):
                 logger.warning(f"Skipping task {task.name} due to failed dependencies")
@@ -342,23 +381,35 @@ class CleanupManager:
     
     def get_cleanup_summary(self) -> Dict[str, Any]:
         """Get a summary of cleanup results"""
-        total_tasks = len(self.results)
-        completed_tasks = sum(1 for r in self.results.values() if r.status == CleanupStatus.COMPLETED)
-        failed_tasks = sum(1 for r in self.results.values() if r.status == CleanupStatus.FAILED)
-        timeout_tasks = sum(1 for r in self.results.values() if r.status == CleanupStatus.TIMEOUT)
+        cached = self._summary_cache
+        if cached is not None:
+            return dict(cached)
         
-        total_duration = sum(r.duration for r in self.results.values())
+        completed = self._cleanup_completed
+        status_counts = Counter()
+        total_duration = 0.0
+        for r in list(self.results.values()):
+            status_counts[r.status] += 1
+            total_duration += r.duration
         
-        return {
+        total_tasks = sum(status_counts.values())
+        completed_tasks = status_counts[CleanupStatus.COMPLETED]
+        summary = {
             'total_tasks': total_tasks,
             'completed_tasks': completed_tasks,
-            'failed_tasks': failed_tasks,
-            'timeout_tasks': timeout_tasks,
+            'failed_tasks': status_counts[CleanupStatus.FAILED],
+            'timeout_tasks': status_counts[CleanupStatus.TIMEOUT],
             'success_rate': completed_tasks / total_tasks if total_tasks > 0 else 0,
             'total_duration': total_duration,
             'cleanup_started': self._cleanup_started,
-            'cleanup_completed': self._cleanup_completed
+            'cleanup_completed': completed
         }
+        
+        if completed:
+            with self._cleanup_lock:
+                if self._cleanup_completed:
+                    self._summary_cache = summary
+        return dict(summary)
     
     def is_cleanup_complete(self) -> bool:
         """Check if cleanup process is complete"""
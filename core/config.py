@@ -54,7 +54,8 @@ class WhisperConfig:
     BEAM_SIZE: Final[int] = 5  # Beam search size
     VAD_FILTER: Final[bool] = True  # Voice activity detection
     COMPUTE_TYPE_CPU: Final[str] = "int8"  # CPU inference type
-    COMPUTE_TYPE_GPU: Final[str] = "float16"  # GPU inference type
+    COMPUTE_TYPE_GPU: Final[str] = "int8_float16"  # GPU inference type (INT8 weights, FP16 compute)
+    WARMUP_ON_LOAD: Final[bool] = True  # Run one throwaway decode after loading to absorb first-call latency
 
 # Singleton instances for easy access
 AUDIO_CONFIG = AudioConfig()
@@ -198,6 +198,8 @@ class HotkeyManager:
     def set_mode(self, mode: HotkeyMode) -> bool:
         """Set the hotkey operation mode"""
         with self._lock:
+            if self.mode == mode:
+                return True
             self.mode = mode
             logger.info(f"Hotkey mode set to: {mode.value}")
             return True
@@ -38,6 +38,7 @@ Last Updated: October 10, 2025
 
 import time
 import threading
+from collections import deque
 try:
     import psutil  # Optional dependency
     _PSUTIL_AVAILABLE = True
@@ -52,6 +53,11 @@ from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Number of samples kept per rolling history; older samples fall off the front
+CPU_MEMORY_HISTORY = 100
+TRANSCRIPTION_HISTORY = 50
+AUDIO_PROCESSING_HISTORY = 100
+
 
 class PerformanceMonitor:
     """
@@ -65,11 +71,11 @@ class PerformanceMonitor:
         """Initialize the performance monitor."""
         self.monitoring = False
         self.metrics = {
-            'cpu_usage': [],
-            'memory_usage': [],
-            'transcription_times': [],
+            'cpu_usage': deque(maxlen=CPU_MEMORY_HISTORY),
+            'memory_usage': deque(maxlen=CPU_MEMORY_HISTORY),
+            'transcription_times': deque(maxlen=TRANSCRIPTION_HISTORY),
             'model_load_times': [],
-            'audio_processing_times': [],
+            'audio_processing_times': deque(maxlen=AUDIO_PROCESSING_HISTORY),
             'startup_time': None,
             'total_transcriptions': 0,
             'average_transcription_time': 0.0
@@ -137,15 +143,10 @@ class PerformanceMonitor:
                 memory_info = process.memory_info()
                 memory_mb = memory_info.rss / (1024 * 1024)  # Convert to MB
                 
+                # Bounded deques drop the oldest sample themselves
                 with self._lock:
                     self.metrics['cpu_usage'].append(cpu_percent)
                     self.metrics['memory_usage'].append(memory_mb)
-                    
-                    # Keep only last 100 measurements to prevent memory growth
-                    if len(self.metrics['cpu_usage']) > 100:
-                        self.metrics['cpu_usage'] = self.metrics['cpu_usage'][-100:]
-                    if len(self.metrics['memory_usage']) > 100:
-                        self.metrics['memory_usage'] = self.metrics['memory_usage'][-100:]
                 
                 # Check for performance warnings
                 self._check_performance_warnings(cpu_percent, memory_mb)
@@ -194,17 +195,13 @@ class PerformanceMonitor:
         """
         with self._lock:
             if operation_name == "transcription":
-                self.metrics['transcription_times'].append(duration)
+                times = self.metrics['transcription_times']
+                times.append(duration)
                 self.metrics['total_transcriptions'] += 1
                 
-                # Update average transcription time
-                times = self.metrics['transcription_times']
+                # Average over the retained window (last TRANSCRIPTION_HISTORY runs)
                 self.metrics['average_transcription_time'] = sum(times) / len(times)
                 
-                # Keep only last 50 transcription times
-                if len(times) > 50:
-                    self.metrics['transcription_times'] = times[-50:]
-                
                 # Check for slow transcription warning
                 if duration > self.thresholds['transcription_time_warning']:
                     logger.warning(f"Slow transcription detected: {duration:.2f}s")
@@ -218,10 +215,6 @@ class PerformanceMonitor:
                     
             elif operation_name == "audio_processing":
                 self.metrics['audio_processing_times'].append(duration)
-                
-                # Keep only last 100 audio processing times
-                if len(self.metrics['audio_processing_times']) > 100:
-                    self.metrics['audio_processing_times'] = self.metrics['audio_processing_times'][-100:]
     
     def record_startup_time(self):
         """Record the application startup time."""
@@ -236,22 +229,30 @@ class PerformanceMonitor:
         Returns:
             Dictionary containing performance metrics
         """
+        # Copy the raw samples under the lock and aggregate outside it, so the
+        # sampling thread and timed operations are never held up by a reader
         with self._lock:
-            # Calculate current averages
-            current_cpu = self.metrics['cpu_usage'][-10:] if self.metrics['cpu_usage'] else [0]
-            current_memory = self.metrics['memory_usage'][-10:] if self.metrics['memory_usage'] else [0]
-            
-            return {
-                'current_cpu_usage': sum(current_cpu) / len(current_cpu) if current_cpu else 0,
-                'current_memory_usage_mb': sum(current_memory) / len(current_memory) if current_memory else 0,
-                'max_cpu_usage': max(self.metrics['cpu_usage']) if self.metrics['cpu_usage'] else 0,
-                'max_memory_usage_mb': max(self.metrics['memory_usage']) if self.metrics['memory_usage'] else 0,
-                'total_transcriptions': self.metrics['total_transcriptions'],
-                'average_transcription_time': self.metrics['average_transcription_time'],
-                'startup_time': self.metrics['startup_time'],
-                'uptime': time.time() - self._start_time,
-                'monitoring_active': self.monitoring
-            }
+            cpu_usage = tuple(self.metrics['cpu_usage'])
+            memory_usage = tuple(self.metrics['memory_usage'])
+            total_transcriptions = self.metrics['total_transcriptions']
+            average_transcription_time = self.metrics['average_transcription_time']
+            startup_time = self.metrics['startup_time']
+        
+        # Calculate current averages
+        current_cpu = cpu_usage[-10:] or (0,)
+        current_memory = memory_usage[-10:] or (0,)
+        
+        return {
+            'current_cpu_usage': sum(current_cpu) / len(current_cpu),
+            'current_memory_usage_mb': sum(current_memory) / len(current_memory),
+            'max_cpu_usage': max(cpu_usage, default=0),
+            'max_memory_usage_mb': max(memory_usage, default=0),
+            'total_transcriptions': total_transcriptions,
+            'average_transcription_time': average_transcription_time,
+            'startup_time': startup_time,
+            'uptime': time.time() - self._start_time,
+            'monitoring_active': self.monitoring
+        }
     
     def get_performance_report(self) -> str:
         """
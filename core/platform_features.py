@@ -6,6 +6,7 @@ enabling graceful degradation when features are unavailable.
 """
 
 import sys
+import importlib.util
 from typing import Dict, Any, Optional
 from enum import Enum
 
@@ -156,8 +157,13 @@ class PlatformFeatures:
         }
         
         try:
-            # Check for pyautogui
-            import pyautogui
+            # Check for pyautogui without importing it; the import probes the
+            # windowing system and is deferred until the first paste. A broken
+            # install (or no display) still passes here and fails at that
+            # import instead, where the auto-paste error is logged and the
+            # transcript stays in the history
+            if importlib.util.find_spec("pyautogui") is None:
+                raise ImportError("pyautogui is not installed")
             
             features["text_pasting"] = FeatureStatus.AVAILABLE
             
@@ -23,6 +23,7 @@ from typing import Any, Dict, List, Optional, Union, Callable
 from enum import Enum
 from dataclasses import dataclass
 from .logging_config import get_logger
+from .config import WHISPER_CONFIG
 
 logger = get_logger(__name__)
 
@@ -225,8 +226,8 @@ class SettingsSchema:
         self.schema["whisper/engine"] = SettingSchema(
             key="whisper/engine",
             type=SettingType.ENUM,
-            default="openai",
-            description="Whisper engine: 'openai' (stable, recommended) or 'faster' (experimental, may have compatibility issues)",
+            default=WHISPER_CONFIG.DEFAULT_ENGINE,
+            description="Whisper engine: 'faster' (CTranslate2, default) or 'openai' (reference PyTorch implementation, fallback)",
             allowed_values=["openai", "faster"],
             validator=self._validate_whisper_engine
         )
@@ -51,15 +51,19 @@ class SingleInstanceManager:
     Includes platform-specific window activation and cleanup integration.
     """
     
-    def __init__(self, app_name: str = "whiz", timeout_minutes: int = 5):
+    def __init__(self, app_name: str = "whiz", timeout_minutes: int = 5,
+                 use_qt: Optional[bool] = None):
         """
         Initialize single instance manager.
         
         Args:
             app_name: Application name for lock identifiers
             timeout_minutes: Lock file timeout in minutes (for stale lock detection)
+            use_qt: Use the Qt shared-memory lock; None uses it whenever PyQt5 is
+                available, False goes straight to the file-based lock
         """
         self.app_name = app_name
+        self._use_qt = QT_AVAILABLE if use_qt is None else (use_qt and QT_AVAILABLE)
         self.timeout_seconds = timeout_minutes * 60
         self.pid = os.getpid()
         self.lock_acquired = False
@@ -89,13 +93,14 @@ class SingleInstanceManager:
         """
         try:
             # Try Qt-based atomic lock first (primary mechanism)
-            if QT_AVAILABLE:
+            if self._use_qt:
                 qt_result = self._try_acquire_qt_lock()
                 if qt_result is not None:
                     return qt_result
+                
+                # Fallback to file-based lock if the Qt lock could not be used
+                logger.warning("Qt lock unavailable, falling back to file-based lock")
             
-            # Fallback to file-based lock if Qt is not available
-            logger.warning("Qt not available, falling back to file-based lock")
             return self._try_acquire_file_lock()
                 
         except Exception as e:
@@ -315,9 +320,11 @@ class SingleInstanceManager:
                 self._cleanup_qt_lock()
             
             # Force cleanup file lock
-            if self.lock_file_path.exists():
-                self.lock_file_path.unlink(missing_ok=True)
+            try:
+                self.lock_file_path.unlink()
                 logger.info("Single instance lock force-released")
+            except FileNotFoundError:
+                pass
             
             self.lock_acquired = False
         except Exception as e:
@@ -369,9 +376,6 @@ class SingleInstanceManager:
             Tuple of (pid, timestamp) or (None, None) if invalid
         """
         try:
-            if not self.lock_file_path.exists():
-                return None, None
-            
             content = self.lock_file_path.read_text(encoding='utf-8').strip()
             lines = content.split('\n')
             
@@ -384,7 +388,10 @@ class SingleInstanceManager:
             
             return pid, timestamp
             
-        except (ValueError, FileNotFoundError) as e:
+        except FileNotFoundError:
+            # No lock file; read it directly rather than stat-ing it first
+            return None, None
+        except ValueError as e:
             logger.warning(f"Error reading lock file: {e}")
             return None, None
         except Exception as e:
@@ -561,6 +568,6 @@ class SingleInstanceManager:
         
         if self.shared_memory:
             status["qt_shared_memory_key"] = self._qt_lock_key
-            status["qt_shared_memory_attached"] = self.shared_memory.isAttached() if self.shared_memory else False
+            status["qt_shared_memory_attached"] = self.shared_memory.isAttached()
         
         return status
@@ -7,8 +7,10 @@ to avoid threading/runtime conflicts while preserving a simple client API.
 
 from __future__ import annotations
 
+import importlib.util
 import logging
 import multiprocessing as mp
+import sys
 import time
 from queue import Empty
 from typing import Any, Callable, Dict, Optional
@@ -18,6 +20,23 @@ from core.config import TIMEOUT_CONFIG, WHISPER_CONFIG
 logger = logging.getLogger(__name__)
 
 
+def _warmup_model(model: Any) -> None:
+    """Run one throwaway decode so allocation and kernel selection happen before real requests."""
+    try:
+        import numpy as np
+
+        segments, _info = model.transcribe(
+            np.zeros(16000, dtype=np.float32),
+            beam_size=1,
+            vad_filter=False,
+            without_timestamps=True,
+        )
+        list(segments)
+    except Exception:
+        # Warmup is best effort; the first real request simply pays the cost instead
+        pass
+
+
 def _transcription_worker_main(
     request_queue: "mp.queues.Queue",
     response_queue: "mp.queues.Queue",
@@ -27,6 +46,7 @@ def _transcription_worker_main(
     model = None
 
     try:
+        # The real availability probe: available() only looked for a spec
         from faster_whisper import WhisperModel
 
         model = WhisperModel(
@@ -41,6 +61,10 @@ def _transcription_worker_main(
         response_queue.put({"type": "error", "error": f"Model init failed: {exc}"})
         return
 
+    # Requests that arrive meanwhile queue up behind the warmup
+    if config.get("warmup", WHISPER_CONFIG.WARMUP_ON_LOAD):
+        _warmup_model(model)
+
     while True:
         try:
             request = request_queue.get(timeout=0.5)
@@ -54,7 +78,10 @@ def _transcription_worker_main(
             break
 
         request_id = request.get("request_id")
-        audio_path = request.get("audio_path")
+        # In-memory float32 samples skip the WAV decode; fall back to the file path
+        audio = request.get("audio")
+        if audio is None:
+            audio = request.get("audio_path")
         language = request.get("language")
         temperature = request.get("temperature", WHISPER_CONFIG.DEFAULT_TEMPERATURE)
         speed_mode = request.get("speed_mode", True)
@@ -84,7 +111,7 @@ def _transcription_worker_main(
                 transcribe_params["language"] = language
 
             started_at = time.time()
-            segments, info = model.transcribe(audio_path, **transcribe_params)
+            segments, info = model.transcribe(audio, **transcribe_params)
             segments_list = list(segments) if segments is not None else []
             text = " ".join(
                 segment.text for segment in segments_list if segment is not None and hasattr(segment, "text")
@@ -119,6 +146,31 @@ def _transcription_worker_main(
 class TranscriptionService:
     """Client API for queue/process-based transcription."""
 
+    # A positive install probe is kept for the life of the process; a negative
+    # one is re-checked so installing faster-whisper mid-session is picked up
+    _faster_whisper_found = False
+
+    @classmethod
+    def available(cls) -> bool:
+        """
+        Return True if faster-whisper is installed for the worker process.
+        
+        This only checks that a module spec exists, so a broken install (for
+        example a CTranslate2 library that fails to load) still reports True.
+        The real import happens in the worker's startup handshake: it replies
+        with an error, start() returns False and SpeechController falls back
+        to openai-whisper.
+        """
+        if cls._faster_whisper_found:
+            return True
+        try:
+            found = importlib.util.find_spec("faster_whisper") is not None
+        except (ImportError, ValueError):
+            # Already imported without a module spec
+            found = "faster_whisper" in sys.modules
+        cls._faster_whisper_found = found
+        return found
+
     def __init__(
         self,
         model_name: str,
@@ -184,20 +236,51 @@ class TranscriptionService:
         timeout_seconds: float = TIMEOUT_CONFIG.TRANSCRIPTION_TIMEOUT,
     ) -> Optional[Dict[str, Any]]:
         """Send a transcription request and wait for matching response."""
+        return self._submit(
+            {
+                "type": "transcribe",
+                "audio_path": audio_path,
+                "language": language,
+                "temperature": temperature,
+                "speed_mode": speed_mode,
+            },
+            timeout_seconds,
+        )
+
+    def transcribe_array(
+        self,
+        samples: Any,
+        language: Optional[str],
+        temperature: float,
+        speed_mode: bool,
+        timeout_seconds: float = TIMEOUT_CONFIG.TRANSCRIPTION_TIMEOUT,
+    ) -> Optional[Dict[str, Any]]:
+        """Transcribe mono 16 kHz float32 samples without a WAV round-trip."""
+        return self._submit(
+            {
+                "type": "transcribe",
+                "audio": samples,
+                "language": language,
+                "temperature": temperature,
+                "speed_mode": speed_mode,
+            },
+            timeout_seconds,
+        )
+
+    def _submit(self, payload: Dict[str, Any], timeout_seconds: float) -> Optional[Dict[str, Any]]:
+        """
+        Enqueue a transcription request and wait for its matching response.
+
+        The caller builds the complete payload; only the request id is added
+        here, in place, so no second dict is built per request.
+        """
         if not self.is_ready or self.worker_process is None or not self.worker_process.is_alive():
             logger.error("Transcription worker not ready")
             return None
 
         self._request_counter += 1
         request_id = f"req_{self._request_counter}_{int(time.time() * 1000)}"
-        payload = {
-            "type": "transcribe",
-            "request_id": request_id,
-            "audio_path": audio_path,
-            "language": language,
-            "temperature": temperature,
-            "speed_mode": speed_mode,
-        }
+        payload["request_id"] = request_id
 
         try:
             self.request_queue.put(payload)
@@ -167,7 +167,8 @@ def main():
             auto_paste=settings.get("behavior/auto_paste", True),  # Use saved auto-paste setting
             language=settings.get("whisper/language", None),  # Use saved language or auto-detect
             temperature=settings.get("whisper/temperature", 0.0),  # Default to fastest temperature
-            engine=settings.get("whisper/engine", WHISPER_CONFIG.DEFAULT_ENGINE)
+            engine=settings.get("whisper/engine", WHISPER_CONFIG.DEFAULT_ENGINE),
+            preload=True  # Load the model while the window opens
         )
         
         # Check if controller initialized successfully
@@ -1,14 +1,15 @@
-import pyautogui
-# Disable PyAutoGUI fail-safe to prevent crashes when mouse moves to corners
-pyautogui.FAILSAFE = False
 import threading
+import concurrent.futures
+import queue
+import functools
+import weakref
+from collections import deque
 import time
 import sys
 import os
-import tempfile
-# whisper, faster_whisper, and torch imported lazily to avoid startup delays
-import wave
-from typing import Optional, Callable, List, Dict, Any
+# whisper, faster_whisper, torch and pyautogui imported lazily to avoid startup delays
+from types import MappingProxyType
+from typing import Optional, Callable, List, Dict, Any, Deque, Tuple, TypedDict
 from datetime import datetime
 
 # Import our abstraction layers
@@ -36,9 +37,181 @@ WHISPER_AVAILABLE = False
 FASTER_WHISPER_AVAILABLE = False
 CUDA_AVAILABLE = False
 
+# pyautogui probes the windowing system on import, so it is loaded on first use
+pyautogui = None
+
+
+def _get_pyautogui():
+    """Import pyautogui on first use and return the module."""
+    global pyautogui
+    if pyautogui is None:
+        import pyautogui as _pyautogui
+        # Disable PyAutoGUI fail-safe to prevent crashes when mouse moves to corners
+        _pyautogui.FAILSAFE = False
+        pyautogui = _pyautogui
+    return pyautogui
+
+
+class _DaemonWorker:
+    """
+    One daemon thread that runs submitted callables in submission order.
+    
+    ThreadPoolExecutor workers are joined at interpreter exit even after
+    shutdown(wait=False), so an in-flight model download or load would keep
+    the process alive after the window closes; a daemon thread does not.
+    Submitting after shutdown returns an already-cancelled future instead of
+    raising on the hotkey/UI thread.
+    """
+    
+    def __init__(self, name: str):
+        self._name = name
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._shut_down = False
+    
+    def submit(self, fn: Callable, *args, **kwargs) -> concurrent.futures.Future:
+        """Queue fn(*args, **kwargs) and return a future for its result."""
+        future = concurrent.futures.Future()
+        with self._lock:
+            if self._shut_down:
+                logger.debug(f"{self._name} is shut down, dropping {getattr(fn, '__name__', fn)}")
+                future.cancel()
+                return future
+            self._queue.put((future, fn, args, kwargs))
+            if self._thread is None:
+                # Started on first use so idle controllers (e.g. in tests) cost no thread
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+        return future
+    
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+    
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        """Stop accepting work; queued work still runs unless cancel_futures is set."""
+        with self._lock:
+            if self._shut_down:
+                return
+            self._shut_down = True
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    item[0].cancel()
+            self._queue.put(None)
+            thread = self._thread
+        if wait and thread is not None:
+            thread.join()
+
+# Resident openai-whisper model keyed by (model_size, device); loading another
+# size evicts it, so at most one model stays cached
+_openai_model_cache: Dict[tuple, Any] = {}
+# Models that already ran their warmup decode
+_warmed_openai_models: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def _load_openai_model(model_size: str, device: Optional[str] = None):
+    """
+    Load (or reuse) an openai-whisper model.
+    
+    Models are placed on the GPU with FP16 weights when CUDA is available and
+    kept resident in a module-level cache between transcriptions. Loading a
+    different size or device first evicts the cached model.
+    
+    Args:
+        model_size: Whisper model size
+        device: Target device, or None to pick CUDA when available
+    """
+    import whisper
+    
+    if device is None:
+        device = "cuda" if CUDA_AVAILABLE else "cpu"
+    
+    key = (model_size, device)
+    model = _openai_model_cache.get(key)
+    if model is None:
+        # Drop the old model before loading so the cache never holds two
+        _openai_model_cache.clear()
+        model = whisper.load_model(model_size, device=device)
+        if device == "cuda":
+            model = model.half()
+        _openai_model_cache[key] = model
+    return model
+
+# openai-whisper transcribe() parameter templates (temperature/language added per call)
+_OPENAI_SPEED_PARAMS = MappingProxyType({
+    "fp16": True,
+    "compression_ratio_threshold": 2.4,
+    "no_speech_threshold": 0.6,
+    "condition_on_previous_text": False,
+    "initial_prompt": None,
+    "word_timestamps": False,
+    "prepend_punctuations": "",
+    "append_punctuations": ""
+})
+# Standard parameters for better accuracy
+_OPENAI_ACCURATE_PARAMS = MappingProxyType({
+    "fp16": False,
+    "condition_on_previous_text": True,
+    "word_timestamps": False
+})
+
+class TranscriptEntry(TypedDict):
+    """One transcript history entry, as stored in SpeechController.transcript_log."""
+    timestamp: str  # "MM/DD HH:MM"
+    text: str
+
+
+# Recordings that queue up behind a running transcription are merged into one
+# request (up to this many), separated by a short stretch of silence
+MAX_COALESCED_RECORDINGS = 8
+COALESCE_GAP_SECONDS = 0.3
+
+# Status updates arriving closer together than this are coalesced to the latest one
+STATUS_COALESCE_SECONDS = 0.05
+
+# Statuses the UI reacts to; interned so the UI's comparisons usually match by identity
+STATUS_RECORDING = sys.intern("Recording...")
+STATUS_PROCESSING = sys.intern("Processing...")
+STATUS_IDLE = sys.intern("Idle")
+
+# (task name, phase, controller attribute, manager "still busy" flag, timeout, critical)
+_MANAGER_CLEANUP_SPECS = (
+    ("audio_manager_cleanup", CleanupPhase.AUDIO_RESOURCES, "audio_manager", "is_recording", 5.0, True),
+    ("hotkey_manager_cleanup", CleanupPhase.HOTKEY_RESOURCES, "hotkey_manager", "is_listening", 3.0, True),
+)
+
 class SpeechController:
     def __init__(self, hotkey: str = "alt gr", model_size: str = "tiny", auto_paste: bool = True, 
-                 language: str = None, temperature: float = 0.5, engine: str = None):
+                 language: str = None, temperature: float = 0.5, engine: str = None,
+                 preload: bool = False):
+        # Resources touched by cleanup and callbacks; defined first so they are
+        # safe to check even if construction fails partway through
+        self.audio_manager: Optional[AudioManager] = None
+        self.hotkey_manager: Optional[HotkeyManager] = None
+        self.transcription_service: Optional[TranscriptionService] = None
+        self.model = None  # Whisper model - lazy loaded on first use
+        self.cleanup_manager = None
+        self.audio_level_callback: Optional[Callable[[float], None]] = None
+        self.temp_dir: Optional[str] = None
+        self.audio_path: Optional[str] = None
+        self._audio_scratch = None  # Reused float32 buffer, see _frames_to_samples
+
         self.model_size = model_size
         self.auto_paste = auto_paste
         self.language = language if language is not None else "auto"
@@ -49,8 +222,12 @@ class SpeechController:
         self.listening = False
         self.listen_thread = None
         self.recording_frames = []
-        self.transcript_log: List[Dict] = []
+        # Newest first; bounded so long sessions keep O(1) inserts and flat memory
+        self.transcript_log: Deque[TranscriptEntry] = deque(maxlen=MEMORY_CONFIG.MAX_TRANSCRIPT_HISTORY)
         self.transcript_callback: Optional[Callable] = None
+        self._timestamp_cache: tuple = (None, "")  # (minute key, formatted timestamp)
+        self._transcripts_snapshot: Tuple[TranscriptEntry, ...] = ()
+        self._transcripts_snapshot_key: tuple = (0, None)
         self.recording_stream = None
         
         # Audio recording parameters
@@ -64,6 +241,10 @@ class SpeechController:
         # Initialize platform features detection (needed before hotkey registration)
         self.platform_features = PlatformFeatures()
         self.features = self.platform_features.detect_all_features()
+        # Paste through the clipboard when possible; cleared on first failure
+        self._clipboard_paste_available = self.platform_features.is_feature_available(
+            "autopaste.clipboard_access"
+        )
 
         # Initialize managers
         self.hotkey_manager = HotkeyManager()
@@ -80,8 +261,14 @@ class SpeechController:
         
         # Status callback for UI updates
         self.status_callback: Optional[Callable[[str], None]] = None
+        self._last_status: Optional[str] = None
+        self._last_status_time = 0.0
+        self._pending_status: Optional[str] = None
+        self._status_flush_timer: Optional[threading.Timer] = None
+        self._status_lock = threading.Lock()
         # Recording state callback (bool)
         self.recording_state_callback: Optional[Callable[[bool], None]] = None
+        self._notified_recording_state = False
 
         # Create temporary directory and audio file path using sandbox
         sandbox = get_sandbox()
@@ -91,18 +278,37 @@ class SpeechController:
         logger.info(f"Using sandboxed audio path: {self.audio_path}")
 
         # Whisper model - lazy loading for faster startup
-        self.model_size = model_size
-        self.model = None  # Will be loaded on first use
-        self.transcription_service: Optional[TranscriptionService] = None
         self.model_loading = False
         self.model_loaded = False
         self.model_load_error = None
+        # Set when the model size changes mid-load; the load restarts once it finishes
+        self._model_reload_pending = False
         
         # Thread safety for model loading
         self._model_lock = threading.Lock()
         self._model_condition = threading.Condition(self._model_lock)
         self._pending_transcriptions = []  # Queue for pending transcription requests
         
+        # Single worker for the save -> transcribe -> paste pipeline so the
+        # hotkey/UI thread returns as soon as recording stops
+        self._transcribe_pool = _DaemonWorker("whiz-transcribe")
+        # One reusable thread for background model loads
+        self._load_pool = _DaemonWorker("whiz-load")
+        # Recording state callbacks run here so a slow UI never blocks the hotkey thread;
+        # one worker keeps start/stop notifications in order
+        self._notify_pool = _DaemonWorker("whiz-notify")
+        # Clipboard restores after auto-paste wait here, off the transcription worker.
+        # A burst of pastes saves the user's clipboard once; each paste bumps the
+        # generation so only the restore queued by the latest paste puts it back
+        self._clipboard_pool = _DaemonWorker("whiz-clipboard")
+        self._clipboard_lock = threading.Lock()
+        self._paste_generation = 0
+        self._clipboard_restore_pending = False
+        self._saved_clipboard: Optional[str] = None
+        # Recordings waiting for the transcription worker
+        self._pending_recordings: Deque[List[bytes]] = deque()
+        self._pending_lock = threading.Lock()
+        
         logger.info(f"Whisper {model_size} model ({self.engine} engine) will be loaded on first recording.")
 
         # Set up audio manager
@@ -119,28 +325,23 @@ class SpeechController:
         self._register_cleanup_tasks()
         
         logger.info("SpeechController initialized successfully")
+        
+        # Start loading the model now so it is resident before the first hotkey release
+        if preload:
+            self.preload_model()
     
     def _register_cleanup_tasks(self):
         """Register cleanup tasks with the cleanup manager"""
-        # Audio resources cleanup
-        register_cleanup_task(
-            "audio_manager_cleanup",
-            CleanupPhase.AUDIO_RESOURCES,
-            self._cleanup_audio_manager,
-            self._verify_audio_cleanup,
-            timeout=5.0,
-            critical=True
-        )
-        
-        # Hotkey resources cleanup
-        register_cleanup_task(
-            "hotkey_manager_cleanup",
-            CleanupPhase.HOTKEY_RESOURCES,
-            self._cleanup_hotkey_manager,
-            self._verify_hotkey_cleanup,
-            timeout=3.0,
-            critical=True
-        )
+        # Audio and hotkey managers share one cleanup/verify pair
+        for name, phase, attr, busy_flag, timeout, critical in _MANAGER_CLEANUP_SPECS:
+            register_cleanup_task(
+                name,
+                phase,
+                functools.partial(self._cleanup_resource_manager, attr),
+                functools.partial(self._verify_resource_manager_idle, attr, busy_flag),
+                timeout=timeout,
+                critical=critical
+            )
         
         # Model resources cleanup
         register_cleanup_task(
@@ -252,7 +453,7 @@ class SpeechController:
     
     def _on_audio_level(self, level: float):
         """Handle audio level updates for visualization"""
-        if hasattr(self, 'audio_level_callback') and self.audio_level_callback:
+        if self.audio_level_callback is not None:
             self.audio_level_callback(level)
     
     def _setup_hotkey_manager(self):
@@ -365,13 +566,16 @@ class SpeechController:
                     self._update_status("Model loading failed")
                 
                 self.model_loading = False
+                reload_pending = self._model_reload_pending
                 
                 # Notify all waiting threads
                 self._model_condition.notify_all()
-                
-                return success
             finally:
                 self._model_condition.release()
+            
+            if reload_pending:
+                self._load_pool.submit(self._restart_faster_model)
+            return success
                 
         except Exception as e:
             # Re-acquire lock to update state
@@ -401,25 +605,12 @@ class SpeechController:
             logger.info(f"Loading {self.engine} Whisper {self.model_size} model... this may take a moment.")
             
             # Lazy import Whisper libraries to avoid startup delays
-            global WHISPER_AVAILABLE, FASTER_WHISPER_AVAILABLE, CUDA_AVAILABLE
+            global FASTER_WHISPER_AVAILABLE, CUDA_AVAILABLE
             
-            # Import whisper (OpenAI)
-            try:
-                import whisper
-                WHISPER_AVAILABLE = True
-                logger.debug("OpenAI Whisper imported successfully")
-            except ImportError as e:
-                logger.error(f"Failed to import OpenAI Whisper: {e}")
-                WHISPER_AVAILABLE = False
-            
-            # Import faster-whisper with fallback
-            try:
-                from faster_whisper import WhisperModel as FasterWhisperModel
-                FASTER_WHISPER_AVAILABLE = True
-                logger.debug("faster-whisper imported successfully")
-            except ImportError as e:
-                logger.debug(f"faster-whisper not available: {e}")
-                FASTER_WHISPER_AVAILABLE = False
+            # faster-whisper is only imported inside the worker process; just check it is installed
+            FASTER_WHISPER_AVAILABLE = TranscriptionService.available()
+            if not FASTER_WHISPER_AVAILABLE:
+                logger.debug("faster-whisper not available")
             
             # Check for CUDA availability
             try:
@@ -441,7 +632,8 @@ class SpeechController:
                 logger.warning("faster-whisper not available, falling back to openai-whisper")
                 self.engine = "openai"
             
-            if self.engine == "openai" and not WHISPER_AVAILABLE:
+            # openai-whisper is only imported when it is actually going to be used
+            if self.engine == "openai" and not self._import_openai_whisper():
                 raise ModelLoadingError("Neither faster-whisper nor OpenAI Whisper is available")
             
             # Check available memory before loading model
@@ -465,16 +657,16 @@ class SpeechController:
                     try:
                         if CUDA_AVAILABLE:
                             device = "cuda"
-                            compute_type = "float16"  # Use float16 for GPU
+                            compute_type = WHISPER_CONFIG.COMPUTE_TYPE_GPU
                             logger.info("Using GPU acceleration for faster-whisper")
                         else:
                             device = "cpu"
-                            compute_type = "int8"  # Use int8 for CPU
+                            compute_type = WHISPER_CONFIG.COMPUTE_TYPE_CPU
                             logger.info("Using CPU with int8 optimization for faster-whisper")
                     except Exception as e:
                         logger.warning(f"CUDA detection failed, falling back to CPU: {e}")
                         device = "cpu"
-                        compute_type = "int8"
+                        compute_type = WHISPER_CONFIG.COMPUTE_TYPE_CPU
                         logger.info("Using CPU with int8 optimization for faster-whisper (fallback)")
 
                     # Use process-based faster-whisper to isolate ONNX runtime from PyQt process
@@ -497,31 +689,26 @@ class SpeechController:
                         self.model = None
                         logger.info("Transcription worker started successfully")
                     except Exception as e:
-                        import traceback
-                        logger.error(f"Failed to start faster-whisper worker: {e}")
-                        logger.error(f"Traceback: {traceback.format_exc()}")
+                        logger.exception(f"Failed to start faster-whisper worker: {e}")
                         logger.info("Falling back to OpenAI Whisper...")
 
                         if self.transcription_service:
                             self.transcription_service.stop()
                             self.transcription_service = None
 
-                        if not WHISPER_AVAILABLE:
+                        if not self._import_openai_whisper():
                             raise ModelLoadingError("Failed to start worker and OpenAI Whisper is unavailable")
 
                         # Fallback to OpenAI Whisper
                         self.engine = "openai"
-                        self.model = whisper.load_model(
+                        self.model = _load_openai_model(
                             self.model_size,
                             device="cpu"  # Force CPU for stability
                         )
                 else:
-                    # Use original openai-whisper with error handling
-                    self.model = whisper.load_model(
-                        self.model_size,
-                        device="cpu",
-                        download_root=None  # Use default cache
-                    )
+                    # Use original openai-whisper (GPU/FP16 when CUDA is available)
+                    self.model = _load_openai_model(self.model_size)
+                    self._schedule_model_warmup()
                 
                 # Validate model was loaded (only needed for non-service paths)
                 if self.engine != "faster" and self.model is None:
@@ -542,6 +729,33 @@ class SpeechController:
             else:
                 raise ModelLoadingError(f"Unexpected error: {e}", e)
     
+    def _import_openai_whisper(self) -> bool:
+        """Import openai-whisper on demand and record its availability"""
+        global WHISPER_AVAILABLE
+        try:
+            import whisper  # noqa: F401
+            WHISPER_AVAILABLE = True
+            logger.debug("OpenAI Whisper imported successfully")
+        except ImportError as e:
+            logger.error(f"Failed to import OpenAI Whisper: {e}")
+            WHISPER_AVAILABLE = False
+        return WHISPER_AVAILABLE
+    
+    def _ensure_initialized(self) -> bool:
+        """
+        Check the controller can record and transcribe.
+        
+        Returns:
+            False if audio capture is unavailable or the model failed to load
+        """
+        if not self.audio_manager.is_available():
+            logger.warning("Controller not ready: audio capture is unavailable")
+            return False
+        if self.model_load_error:
+            logger.warning(f"Controller not ready: model failed to load ({self.model_load_error})")
+            return False
+        return True
+    
     def is_model_ready(self):
         """Check if the Whisper model is ready for use"""
         return self.model_loaded and (self.model is not None or self.transcription_service is not None)
@@ -558,13 +772,16 @@ class SpeechController:
             return "not_loaded"
     
     def preload_model(self):
-        """Preload the Whisper model in a background thread"""
+        """
+        Preload the Whisper model in a background thread.
+        
+        Idempotent: returns False without starting a load if the model is already
+        loaded, loading, or failed to load.
+        """
         with self._model_condition:
             if not self.model_loaded and not self.model_loading and not self.model_load_error:
-                # Start loading in a separate thread to avoid blocking
-                # Use daemon thread so it doesn't prevent app shutdown
-                load_thread = threading.Thread(target=self._background_load_model, daemon=True)
-                load_thread.start()
+                # Load on the shared background thread to avoid blocking
+                self._load_pool.submit(self._background_load_model)
                 
                 # Update state
                 self.model_loading = True
@@ -593,17 +810,26 @@ class SpeechController:
                     self._update_status("Model loading failed")
                 
                 self.model_loading = False
+                reload_pending = self._model_reload_pending
                 
                 # Notify all waiting threads
                 self._model_condition.notify_all()
+            
+            if reload_pending:
+                self._load_pool.submit(self._restart_faster_model)
+            
+            # Import the paste backend here rather than on the first paste
+            if success and self.auto_paste:
+                try:
+                    _get_pyautogui()
+                except Exception as e:
+                    logger.warning(f"pyautogui unavailable, auto-paste will not work: {e}")
                 
         except Exception as e:
-            import traceback
             with self._model_condition:
                 self.model_loading = False
                 self.model_load_error = f"Unexpected error: {e}"
-                logger.error(f"Unexpected error in background model loading: {e}")
-                logger.error(f"Full traceback: {traceback.format_exc()}")
+                logger.exception(f"Unexpected error in background model loading: {e}")
                 self._update_status(f"Error loading model: {e}")
                 
                 # Notify all waiting threads
@@ -612,13 +838,21 @@ class SpeechController:
     def set_status_callback(self, callback: Callable[[str], None]):
         """Set a callback function to update UI status"""
         self.status_callback = callback
+        with self._status_lock:
+            self._last_status = None
+            self._last_status_time = 0.0
 
     def set_recording_state_callback(self, callback: Callable[[bool], None]):
         """Set callback invoked when recording starts/stops."""
         self.recording_state_callback = callback
 
     def set_transcript_callback(self, callback: Callable[[], None]):
-        """Set callback function for transcript updates"""
+        """
+        Set callback function for transcript updates.
+        
+        The callback runs on the transcription thread and must only hand off to
+        the UI thread (e.g. emit a queued Qt signal) rather than redraw inline.
+        """
         self.transcript_callback = callback
 
     def set_audio_level_callback(self, callback: Callable[[float], None]):
@@ -626,7 +860,46 @@ class SpeechController:
         self.audio_level_callback = callback
 
     def _update_status(self, status: str):
-        """Update status and notify UI if callback is set"""
+        """
+        Update status and notify UI if callback is set.
+        
+        Each notification is a cross-thread UI event, so repeats of the current
+        status are dropped and bursts (e.g. an error immediately followed by
+        "Idle") are coalesced: the first update goes out at once, later ones within
+        STATUS_COALESCE_SECONDS are flushed together as the latest status.
+        """
+        with self._status_lock:
+            if status == self._last_status and self._pending_status is None:
+                return
+            now = time.monotonic()
+            since_last = now - self._last_status_time
+            if self._status_flush_timer is None and since_last >= STATUS_COALESCE_SECONDS:
+                self._last_status = status
+                self._last_status_time = now
+            else:
+                self._pending_status = status
+                if self._status_flush_timer is None:
+                    self._status_flush_timer = threading.Timer(
+                        max(0.0, STATUS_COALESCE_SECONDS - since_last), self._flush_status
+                    )
+                    self._status_flush_timer.daemon = True
+                    self._status_flush_timer.start()
+                return
+        self._notify_status(status)
+
+    def _flush_status(self):
+        """Send the latest coalesced status, if it differs from the last one sent."""
+        with self._status_lock:
+            status, self._pending_status = self._pending_status, None
+            self._status_flush_timer = None
+            if status is None or status == self._last_status:
+                return
+            self._last_status = status
+            self._last_status_time = time.monotonic()
+        self._notify_status(status)
+
+    def _notify_status(self, status: str):
+        """Log a status change and pass it to the UI callback."""
         logger.info(f"Status: {status}")
         if self.status_callback:
             self.status_callback(status)
@@ -677,12 +950,8 @@ class SpeechController:
         
         self.listening = True
         self.recording_frames = []
-        self._update_status("Recording...")
-        if self.recording_state_callback:
-            try:
-                self.recording_state_callback(True)
-            except Exception:
-                pass
+        self._update_status(STATUS_RECORDING)
+        self._notify_recording_state(True)
         
         # Start audio recording
         if self.audio_manager.start_recording():
@@ -691,6 +960,23 @@ class SpeechController:
             logger.error("Failed to start audio recording")
             self.listening = False
             self._update_status("Recording failed")
+            self._notify_recording_state(False)
+
+    def _notify_recording_state(self, is_recording: bool):
+        """Report a recording state change to the UI, skipping repeats of the last state"""
+        if is_recording == self._notified_recording_state:
+            return
+        self._notified_recording_state = is_recording
+        callback = self.recording_state_callback
+        if callback:
+            self._notify_pool.submit(self._run_recording_state_callback, callback, is_recording)
+
+    def _run_recording_state_callback(self, callback: Callable[[bool], None], is_recording: bool):
+        """Invoke a recording state callback, logging its failure instead of propagating it"""
+        try:
+            callback(is_recording)
+        except Exception:
+            logger.debug("Recording state callback failed", exc_info=True)
 
     def stop_recording(self):
         """Stop recording and process audio"""
@@ -698,21 +984,58 @@ class SpeechController:
             return
         
         self.listening = False
-        self._update_status("Processing...")
-        if self.recording_state_callback:
-            try:
-                self.recording_state_callback(False)
-            except Exception:
-                pass
+        self._update_status(STATUS_PROCESSING)
+        self._notify_recording_state(False)
         
-        # Stop audio recording and get frames
-        self.recording_frames = self.audio_manager.stop_recording()
+        # Stop audio recording and hand the frames off to the transcription worker
+        frames = self.audio_manager.stop_recording()
+        self.recording_frames = []
         
-        if self.recording_frames:
-            self.process_recorded_audio()
+        if frames:
+            with self._pending_lock:
+                self._pending_recordings.append(frames)
+            self._transcribe_pool.submit(self._process_pending_recordings)
         else:
             logger.warning("No audio recorded")
-            self._update_status("Idle")
+            self._update_status(STATUS_IDLE)
+
+    def _process_pending_recordings(self):
+        """
+        Transcribe the recordings queued since the worker last ran as one request.
+        
+        Normally there is exactly one. When the user records again while a
+        transcription is still running, the backlog shares a single Whisper call
+        instead of paying the per-call overhead once per recording.
+        """
+        with self._pending_lock:
+            count = min(len(self._pending_recordings), MAX_COALESCED_RECORDINGS)
+            batch = [self._pending_recordings.popleft() for _ in range(count)]
+        if not batch:
+            return  # Already picked up by an earlier task
+        
+        if len(batch) > 1:
+            # Don't pad the merged request with accidental taps that caught no speech
+            voiced = [recording for recording in batch if not self._is_silent_recording(recording)]
+            batch = voiced or batch[:1]  # All silent: let the usual gate report it
+        
+        if len(batch) == 1:
+            self.process_recorded_audio(batch[0])
+            return
+        
+        logger.info(f"Coalescing {len(batch)} queued recordings into one transcription")
+        # float32 silence, matching the captured frame format
+        gap = bytes(int(self.RATE * self.CHANNELS * COALESCE_GAP_SECONDS) * 4)
+        frames: List[bytes] = []
+        for recording in batch:
+            if frames:
+                frames.append(gap)
+            frames.extend(recording)
+        self.process_recorded_audio(frames)
+
+    def _is_silent_recording(self, recording: List[bytes]) -> bool:
+        """Check whether one queued recording is silent; unreadable audio counts as voiced."""
+        samples = self._pcm_to_samples(b"".join(recording))
+        return samples is not None and self._is_silent(samples)
 
     def toggle_recording(self):
         """Toggle between recording and idle states"""
@@ -723,59 +1046,199 @@ class SpeechController:
 
 
     def save_audio_to_file(self, frames, filename):
-        """Save recorded audio frames to a WAV file"""
+        """Save recorded audio frames (or pre-joined bytes) to a WAV file"""
         return self.audio_manager.save_audio_to_file(frames, filename)
 
-    def process_recorded_audio(self):
-        """Process recorded audio through Whisper and optionally paste text"""
+    def _schedule_model_warmup(self):
+        """
+        Queue a throwaway decode for a freshly loaded GPU openai-whisper model.
+        
+        The first CUDA transcription pays for kernel selection; running it on the
+        transcription thread right after loading keeps it off the first hotkey press.
+        The faster-whisper worker warms itself up after loading.
+        """
+        model = self.model
+        if not WHISPER_CONFIG.WARMUP_ON_LOAD or model is None or model in _warmed_openai_models:
+            return
+        if getattr(getattr(model, "device", None), "type", None) != "cuda":
+            return
+        _warmed_openai_models.add(model)
+        self._transcribe_pool.submit(self._warmup_openai_model, model)
+
+    def _warmup_openai_model(self, model):
+        """Run one second of silence through an openai-whisper model."""
+        import numpy as np
+        started_at = time.time()
         try:
-            if not self.recording_frames:
-                logger.warning("No audio frames to process")
-                self._update_status("No audio recorded")
-                return
+            model.transcribe(np.zeros(self.RATE, dtype=np.float32), fp16=True,
+                             language="en", condition_on_previous_text=False)
+            logger.info(f"Model warmup completed in {time.time() - started_at:.2f}s")
+        except Exception as e:
+            logger.warning(f"Model warmup failed: {e}")
+
+    def _transcript_timestamp(self) -> str:
+        """Format the current time for the transcript log, reusing it within the same minute."""
+        now = datetime.now()
+        key = (now.month, now.day, now.hour, now.minute)
+        if key != self._timestamp_cache[0]:
+            self._timestamp_cache = (key, f"{now.month:02d}/{now.day:02d} {now.hour:02d}:{now.minute:02d}")
+        return self._timestamp_cache[1]
 
+    def _pcm_to_samples(self, pcm_bytes: bytes):
+        """
+        View joined audio frames as float32 samples without copying.
+        
+        Args:
+            pcm_bytes: Joined raw float32 audio frames from the audio manager
+            
+        Returns:
+            Read-only float32 numpy array, or None if the bytes are not float32 PCM
+        """
+        import numpy as np
+        try:
+            return np.frombuffer(pcm_bytes, dtype=np.float32)
+        except ValueError:
+            return None
+
+    def _frames_to_samples(self, frames: List[bytes], total_bytes: int):
+        """
+        Copy raw float32 frames into the reusable scratch buffer.
+        
+        The buffer only grows, so back-to-back recordings reuse one allocation
+        instead of joining a fresh bytes object each time. The returned view is
+        overwritten by the next recording: it must be consumed (or copied) before
+        this method runs again. Only the single transcription worker calls it, and
+        both engines use the samples synchronously.
+        
+        Args:
+            frames: Raw float32 audio frames from the audio manager
+            total_bytes: Combined length of the frames in bytes
+            
+        Returns:
+            float32 numpy view of the samples, or None if the bytes are not float32 PCM
+        """
+        import numpy as np
+        if total_bytes % 4:
+            return None
+        count = total_bytes // 4
+        if self._audio_scratch is None or self._audio_scratch.size < count:
+            self._audio_scratch = np.empty(count, dtype=np.float32)
+        samples = self._audio_scratch[:count]
+        scratch_bytes = samples.view(np.uint8)
+        offset = 0
+        for frame in frames:
+            size = len(frame)
+            scratch_bytes[offset:offset + size] = np.frombuffer(frame, dtype=np.uint8)
+            offset += size
+        return samples
+
+    def _is_silent_or_too_short(self, samples) -> bool:
+        """
+        Check whether recorded float32 audio is too short or too quiet to transcribe.
+        
+        Args:
+            samples: float32 samples from _frames_to_samples
+            
+        Returns:
+            True if the recording should be skipped without running Whisper
+        """
+        duration = samples.size / (self.RATE * self.CHANNELS)
+        if duration < AUDIO_CONFIG.MIN_RECORDING_DURATION_SECONDS:
+            logger.info(f"Recording too short to transcribe ({duration:.2f}s)")
+            return True
+
+        return self._is_silent(samples)
+
+    def _is_silent(self, samples) -> bool:
+        """Check whether float32 audio stays below the configured RMS silence threshold."""
+        import numpy as np
+        if samples.size == 0:
+            return True
+        rms = float(np.sqrt(np.mean(np.square(samples, dtype=np.float64))))
+        if rms < AUDIO_CONFIG.SILENCE_THRESHOLD:
+            logger.info(f"Recording is silent (RMS {rms:.5f}), skipping transcription")
+            return True
+        return False
+
+    def _write_audio_file(self, pcm_bytes: bytes) -> Optional[int]:
+        """
+        Save audio to self.audio_path and validate the result.
+        
+        Args:
+            pcm_bytes: Joined raw float32 audio frames
+            
+        Returns:
+            Size of the written file in bytes, or None if saving failed
+        """
+        try:
+            if not self.save_audio_to_file(pcm_bytes, self.audio_path):
+                logger.error("Failed to save audio file")
+                self._update_status("Failed to save audio")
+                return None
+        except Exception as e:
+            logger.error(f"Error saving audio file: {e}")
+            self._update_status(f"Audio save error: {e}")
+            return None
+
+        logger.info(f"Audio saved to {self.audio_path}")
+
+        # Validate saved file (single stat call covers existence and size)
+        try:
+            try:
+                file_size = os.stat(self.audio_path).st_size
+            except FileNotFoundError:
+                logger.error(f"Audio file not created: {self.audio_path}")
+                self._update_status("Audio file not created")
+                return None
+
+            if file_size == 0:
+                logger.error(f"Audio file is empty: {self.audio_path}")
+                self._update_status("Audio file is empty")
+                return None
+            
+            # Check for reasonable file size (not too small, not too large)
+            if file_size < 1000:  # Less than 1KB is probably too small
+                logger.warning(f"Audio file seems too small: {file_size} bytes")
+            elif file_size > 50 * 1024 * 1024:  # More than 50MB is probably too large
+                logger.warning(f"Audio file seems too large: {file_size} bytes")
+                
+        except OSError as e:
+            logger.error(f"Error checking audio file: {e}")
+            self._update_status(f"File system error: {e}")
+            return None
+        return file_size
+
+    def process_recorded_audio(self, frames: Optional[List[bytes]] = None):
+        """
+        Process recorded audio through Whisper and optionally paste text.
+        
+        Args:
+            frames: Audio frames to process; defaults to (and takes ownership of)
+                self.recording_frames
+        """
+        if frames is None:
+            frames, self.recording_frames = self.recording_frames, []
+        try:
             # Validate audio frames
-            if not isinstance(self.recording_frames, list) or len(self.recording_frames) == 0:
+            if not isinstance(frames, list):
                 logger.error("Invalid audio frames")
                 self._update_status("Invalid audio data")
                 return
 
-            # Save audio file with error handling
-            try:
-                if not self.save_audio_to_file(self.recording_frames, self.audio_path):
-                    logger.error("Failed to save audio file")
-                    self._update_status("Failed to save audio")
-                    return
-            except Exception as e:
-                logger.error(f"Error saving audio file: {e}")
-                self._update_status(f"Audio save error: {e}")
+            total_bytes = sum(len(frame) for frame in frames)
+            if not total_bytes:
+                logger.warning("No audio frames to process")
+                self._update_status("No audio recorded")
                 return
 
-            logger.info(f"Audio saved to {self.audio_path}")
-            time.sleep(0.05)  # ensure FS flush on some systems
+            # Copy once into the reused scratch buffer; the silence gate and both
+            # engines share it. Only non-float32 frames fall back to a joined WAV.
+            samples = self._frames_to_samples(frames, total_bytes)
+            pcm_bytes = b''.join(frames) if samples is None else None
 
-            # Validate saved file
-            try:
-                if not os.path.exists(self.audio_path):
-                    logger.error(f"Audio file not created: {self.audio_path}")
-                    self._update_status("Audio file not created")
-                    return
-                
-                file_size = os.path.getsize(self.audio_path)
-                if file_size == 0:
-                    logger.error(f"Audio file is empty: {self.audio_path}")
-                    self._update_status("Audio file is empty")
-                    return
-                
-                # Check for reasonable file size (not too small, not too large)
-                if file_size < 1000:  # Less than 1KB is probably too small
-                    logger.warning(f"Audio file seems too small: {file_size} bytes")
-                elif file_size > 50 * 1024 * 1024:  # More than 50MB is probably too large
-                    logger.warning(f"Audio file seems too large: {file_size} bytes")
-                    
-            except OSError as e:
-                logger.error(f"Error checking audio file: {e}")
-                self._update_status(f"File system error: {e}")
+            # Skip accidental presses and silence before paying for a Whisper pass
+            if samples is not None and self._is_silent_or_too_short(samples):
+                self._update_status("No speech detected")
                 return
 
             try:
@@ -784,21 +1247,43 @@ class SpeechController:
                     logger.error("Model loading failed or timed out, cannot transcribe")
                     self._update_status("Transcription failed: Model not ready")
                     return
+
+                # Both engines take float32 samples directly; the WAV file is only
+                # written when the frames could not be viewed as samples
+                send_samples = samples is not None
+                if not send_samples:
+                    file_size = self._write_audio_file(pcm_bytes)
+                    if file_size is None:
+                        return
                 
                 # Transcribe using the selected engine with performance monitoring
                 logger.info(f"Using transcription engine: {self.engine}")
                 with self.performance_monitor.time_operation("transcription"):
                     try:
                         if self.engine == "faster":
-                            if self.transcription_service:
-                                logger.info(f"Transcribing audio via worker: {self.audio_path}")
-                                result = self.transcription_service.transcribe(
-                                    audio_path=self.audio_path,
-                                    language=self.language,
-                                    temperature=self.temperature,
-                                    speed_mode=self.speed_mode,
-                                    timeout_seconds=TIMEOUT_CONFIG.TRANSCRIPTION_TIMEOUT,
-                                )
+                            if not self.transcription_service:
+                                logger.error("faster engine selected but transcription worker is unavailable")
+                                self._update_status("Transcription engine unavailable")
+                                text = ""
+                            else:
+                                if send_samples:
+                                    logger.info(f"Transcribing {samples.size / self.RATE:.2f}s of audio via worker")
+                                    result = self.transcription_service.transcribe_array(
+                                        samples,
+                                        language=self.language,
+                                        temperature=self.temperature,
+                                        speed_mode=self.speed_mode,
+                                        timeout_seconds=TIMEOUT_CONFIG.TRANSCRIPTION_TIMEOUT,
+                                    )
+                                else:
+                                    logger.info(f"Transcribing audio via worker: {self.audio_path}")
+                                    result = self.transcription_service.transcribe(
+                                        audio_path=self.audio_path,
+                                        language=self.language,
+                                        temperature=self.temperature,
+                                        speed_mode=self.speed_mode,
+                                        timeout_seconds=TIMEOUT_CONFIG.TRANSCRIPTION_TIMEOUT,
+                                    )
 
                                 if result is None:
                                     logger.error("Transcription worker request failed")
@@ -806,40 +1291,26 @@ class SpeechController:
                                     text = ""
                                 else:
                                     text = (result.get("text") or "").strip()
-                            else:
-                                logger.error("faster engine selected but transcription worker is unavailable")
-                                self._update_status("Transcription engine unavailable")
-                                text = ""
                         else:
                             # Use original openai-whisper API
-                            if self.speed_mode:
-                                transcribe_params = {
-                                    "fp16": True,
-                                    "temperature": self.temperature,
-                                    "compression_ratio_threshold": 2.4,
-                                    "no_speech_threshold": 0.6,
-                                    "condition_on_previous_text": False,
-                                    "initial_prompt": None,
-                                    "word_timestamps": False,
-                                    "prepend_punctuations": "",
-                                    "append_punctuations": ""
-                                }
-                            else:
-                                # Standard parameters for better accuracy
-                                transcribe_params = {
-                                    "fp16": False,
-                                    "temperature": self.temperature,
-                                    "condition_on_previous_text": True,
-                                    "word_timestamps": False
-                                }
+                            template = _OPENAI_SPEED_PARAMS if self.speed_mode else _OPENAI_ACCURATE_PARAMS
+                            transcribe_params = dict(template, temperature=self.temperature)
+                            # FP16 is always the right choice once weights live on the GPU
+                            if getattr(getattr(self.model, "device", None), "type", None) == "cuda":
+                                transcribe_params["fp16"] = True
                             # Only set language if it's not auto-detection
                             if self.language and self.language != "auto":
                                 transcribe_params["language"] = self.language
                             
                             logger.debug(f"Calling openai-whisper with params: {transcribe_params}")
-                            logger.info(f"Transcribing audio file: {self.audio_path}")
-                            logger.info(f"File exists before transcription: {os.path.exists(self.audio_path)}")
-                            result = self.model.transcribe(self.audio_path, **transcribe_params)
+                            if send_samples:
+                                # openai-whisper accepts 16 kHz float32 arrays, skipping its ffmpeg decode
+                                logger.info(f"Transcribing {samples.size / self.RATE:.2f}s of audio in memory")
+                                audio_input = samples
+                            else:
+                                logger.info(f"Transcribing audio file: {self.audio_path} ({file_size} bytes)")
+                                audio_input = self.audio_path
+                            result = self.model.transcribe(audio_input, **transcribe_params)
                             logger.debug(f"openai-whisper returned result: {type(result)}")
                             
                             # Handle case where result might be None or missing text
@@ -851,11 +1322,8 @@ class SpeechController:
                                 if not text:
                                     logger.debug("openai-whisper returned empty text")
                     except Exception as e:
-                        # Log full traceback for debugging
-                        import traceback
-                        logger.error(f"Transcription exception: {e}")
-                        logger.error(f"Exception type: {type(e).__name__}")
-                        logger.error(f"Full traceback:\n{traceback.format_exc()}")
+                        # logger.exception attaches the traceback only when a handler emits it
+                        logger.exception(f"Transcription exception ({type(e).__name__}): {e}")
                         
                         # Classify the exception and provide specific error handling
                         transcription_exception = classify_exception(e)
@@ -879,23 +1347,24 @@ class SpeechController:
                     logger.info(f"Recognized: {text}")
                     
                     # Add to transcript history
-                    timestamp = datetime.now().strftime("%m/%d %H:%M")
-                    transcript_entry = {
+                    timestamp = self._transcript_timestamp()
+                    transcript_entry: TranscriptEntry = {
                         "timestamp": timestamp,
                         "text": text
                     }
-                    self.transcript_log.insert(0, transcript_entry)  # Newest at top
-                    
-                    # Notify UI of new transcript
-                    if self.transcript_callback:
-                        self.transcript_callback()
+                    self.transcript_log.appendleft(transcript_entry)  # Newest at top
                     
+                    # Paste first: it is the latency the user is waiting on
                     if self.auto_paste:
                         try:
-                            pyautogui.write(text + " ")
+                            self._paste_text(text + " ")
                         except Exception as paste_error:
                             logger.warning(f"Auto-paste failed: {paste_error}")
                             # Continue without crashing the app
+                    
+                    # Notify UI of new transcript
+                    if self.transcript_callback:
+                        self.transcript_callback()
                 else:
                     logger.info("No speech detected")
             except Exception as e:
@@ -903,12 +1372,76 @@ class SpeechController:
         except Exception as e:
             logger.error(f"Error processing recorded audio: {e}")
         finally:
-            self.recording_frames = []
-            self._update_status("Idle")
+            self._update_status(STATUS_IDLE)
+
+    def _paste_text(self, text: str):
+        """
+        Paste text into the focused window.
+        
+        Uses a single clipboard paste shortcut instead of typing every character,
+        restoring the previous clipboard content afterwards. Falls back to
+        pyautogui.write if the clipboard is unavailable.
+        """
+        gui = _get_pyautogui()
+        if self._clipboard_paste_available:
+            try:
+                import pyperclip
+                with self._clipboard_lock:
+                    # Only the first paste of a burst saves the clipboard; until its
+                    # restore runs, the clipboard holds our own earlier text.
+                    # Saving is best effort: non-text clipboard content (images,
+                    # files) can't be read back, but pasting still works
+                    if not self._clipboard_restore_pending:
+                        try:
+                            self._saved_clipboard = pyperclip.paste()
+                        except Exception as e:
+                            logger.debug(f"Could not save clipboard before paste: {e}")
+                            self._saved_clipboard = None
+                        self._clipboard_restore_pending = True
+                    pyperclip.copy(text)
+                    self._paste_generation += 1
+                    generation = self._paste_generation
+                self._clipboard_pool.submit(self._restore_clipboard, generation)
+                gui.hotkey('command' if sys.platform == 'darwin' else 'ctrl', 'v')
+                return
+            except Exception as e:
+                logger.warning(f"Clipboard paste failed, falling back to typing: {e}")
+                self._clipboard_paste_available = False
+        
+        gui.write(text)
 
-    def get_transcripts(self) -> List[Dict]:
-        """Get the list of transcript history entries"""
-        return self.transcript_log.copy()
+    def _restore_clipboard(self, generation: int):
+        """Put back the clipboard content saved before a burst of auto-pastes."""
+        # Give the target application time to read the clipboard before restoring it
+        time.sleep(0.5)
+        with self._clipboard_lock:
+            if generation != self._paste_generation:
+                return  # A newer paste queued its own restore
+            previous_clipboard, self._saved_clipboard = self._saved_clipboard, None
+            self._clipboard_restore_pending = False
+            if previous_clipboard is None:
+                return
+            try:
+                import pyperclip
+                pyperclip.copy(previous_clipboard)
+            except Exception as e:
+                logger.debug(f"Could not restore clipboard: {e}")
+
+    def get_transcripts(self) -> Tuple[TranscriptEntry, ...]:
+        """
+        Get the transcript history entries, newest first.
+        
+        Returns an immutable snapshot that is reused until a new entry arrives,
+        so repeated UI refreshes do not copy the whole history each time.
+        """
+        log = self.transcript_log
+        # Entries are only ever added at the front, so the size and the newest
+        # entry identify the contents; the cached snapshot keeps that entry alive
+        key = (len(log), id(log[0]) if log else None)
+        if key != self._transcripts_snapshot_key:
+            self._transcripts_snapshot = tuple(log)
+            self._transcripts_snapshot_key = key
+        return self._transcripts_snapshot
     
     def get_feature_status(self) -> Dict[str, Any]:
         """Get current feature availability status"""
@@ -923,17 +1456,28 @@ class SpeechController:
 
     def set_auto_paste(self, enabled: bool):
         """Enable or disable auto-paste functionality"""
+        if self.auto_paste == enabled:
+            return  # No change needed
         self.auto_paste = enabled
         logger.info(f"Auto-paste {'enabled' if enabled else 'disabled'}")
 
     def set_language(self, lang_code: str):
-        """Set the language for transcription"""
+        """Set the language for transcription (applied per request; no model reload)"""
+        if self.language == lang_code:
+            return  # No change needed
         self.language = lang_code
         logger.info(f"Language set to: {lang_code}")
 
     def set_temperature(self, temperature: float):
-        """Set the temperature for transcription (0.0 = deterministic, higher = more random)"""
-        self.temperature = max(0.0, min(1.0, temperature))  # Clamp between 0.0 and 1.0
+        """
+        Set the temperature for transcription (0.0 = deterministic, higher = more random).
+        
+        Like the language, this is sent with each request, so the loaded model is kept.
+        """
+        temperature = max(0.0, min(1.0, temperature))  # Clamp between 0.0 and 1.0
+        if temperature == self.temperature:
+            return  # No change needed
+        self.temperature = temperature
         logger.info(f"Temperature set to: {self.temperature}")
     
     def set_model(self, model_size: str):
@@ -941,28 +1485,73 @@ class SpeechController:
         if model_size != self.model_size:
             logger.info(f"Changing model from {self.model_size} to {model_size}...")
             self.model_size = model_size
-            self.model = whisper.load_model(model_size)
-            logger.info(f"Model changed to {model_size} successfully!")
+            
+            if self.engine == "faster":
+                self._restart_faster_model()
+            else:
+                # Load off the caller's (UI) thread; the current model serves until then
+                self._load_pool.submit(self._switch_openai_model, model_size)
+    
+    def _switch_openai_model(self, model_size: str):
+        """Load an openai-whisper model on the load worker and swap it in"""
+        if model_size != self.model_size:
+            return  # Superseded by a later set_model call
+        try:
+            model = _load_openai_model(model_size)
+        except Exception as e:
+            logger.error(f"Error changing model to {model_size}: {e}")
+            self._update_status(f"Error loading model: {e}")
+            return
+        if model_size != self.model_size:
+            return
+        self.model = model
+        self._schedule_model_warmup()
+        logger.info(f"Model changed to {model_size} successfully!")
+    
+    def _restart_faster_model(self):
+        """Restart the faster-whisper worker process with the current model size in the background"""
+        with self._model_condition:
+            if self.model_loading:
+                # The running load uses the old size; restart once it finishes
+                self._model_reload_pending = True
+                logger.info(f"Model is loading; reloading as {self.model_size} once it finishes")
+                return
+            self._model_reload_pending = False
+            if self.transcription_service:
+                self.transcription_service.stop()
+                self.transcription_service = None
+            self.model_loaded = False
+            self.model_load_error = None
+        self.preload_model()
     
     def set_speed_mode(self, enabled: bool):
         """Enable or disable speed optimizations"""
+        if self.speed_mode == enabled:
+            return  # No change needed
         self.speed_mode = enabled
         logger.info(f"Speed mode {'enabled' if enabled else 'disabled'}")
 
     def set_toggle_mode(self, enabled: bool):
         """Enable or disable toggle mode"""
+        if self.toggle_mode == enabled:
+            return  # No change needed; avoid re-registering hotkeys
         self.toggle_mode = enabled
         
-        # Update hotkey manager mode
+        # Update hotkey manager mode. The listener reads the mode on every key
+        # event, so a running listener does not need to be re-registered.
         if self.hotkey_manager.is_available():
             mode = HotkeyMode.TOGGLE if enabled else HotkeyMode.HOLD
             self.hotkey_manager.set_mode(mode)
-            self.register_hotkeys()
+            if not self.hotkey_manager.is_listening:
+                self.register_hotkeys()
         
         logger.info(f"Toggle mode {'enabled' if enabled else 'disabled'}")
 
     def set_visual_indicator(self, enabled: bool, position: str):
         """Enable or disable visual recording indicator"""
+        if (self.visual_indicator_enabled == enabled
+                and self.visual_indicator_position == position):
+            return  # No change needed
         self.visual_indicator_enabled = enabled
         self.visual_indicator_position = position
         logger.info(f"Visual indicator {'enabled' if enabled else 'disabled'} at position: {position}")
@@ -998,61 +1587,50 @@ class SpeechController:
             logger.error(f"Error during cleanup: {e}")
             return False
     
-    def _cleanup_audio_manager(self) -> bool:
-        """Clean up audio manager resources"""
+    def _cleanup_resource_manager(self, attr: str) -> bool:
+        """Clean up the audio or hotkey manager stored in ``attr``"""
         try:
-            if hasattr(self, 'audio_manager') and self.audio_manager:
-                self.audio_manager.cleanup()
-                logger.debug("Audio manager cleaned up")
+            manager = getattr(self, attr)
+            if manager is not None:
+                manager.cleanup()
+                logger.debug(f"{attr} cleaned up")
             return True
         except Exception as e:
-            logger.error(f"Error cleaning up audio manager: {e}")
+            logger.error(f"Error cleaning up {attr}: {e}")
             return False
     
-    def _verify_audio_cleanup(self) -> bool:
-        """Verify audio manager cleanup"""
+    def _verify_resource_manager_idle(self, attr: str, busy_flag: str) -> bool:
+        """Verify the manager stored in ``attr`` no longer reports ``busy_flag``"""
         try:
-            # Check if audio manager is properly cleaned up
-            if hasattr(self, 'audio_manager') and self.audio_manager:
-                return not self.audio_manager.is_recording
+            manager = getattr(self, attr)
+            if manager is not None:
+                return not getattr(manager, busy_flag)
             return True
         except Exception as e:
-            logger.error(f"Error verifying audio cleanup: {e}")
-            return False
-    
-    def _cleanup_hotkey_manager(self) -> bool:
-        """Clean up hotkey manager resources"""
-        try:
-            if hasattr(self, 'hotkey_manager') and self.hotkey_manager:
-                self.hotkey_manager.cleanup()
-                logger.debug("Hotkey manager cleaned up")
-            return True
-        except Exception as e:
-            logger.error(f"Error cleaning up hotkey manager: {e}")
-            return False
-    
-    def _verify_hotkey_cleanup(self) -> bool:
-        """Verify hotkey manager cleanup"""
-        try:
-            # Check if hotkey manager is properly cleaned up
-            if hasattr(self, 'hotkey_manager') and self.hotkey_manager:
-                return not hasattr(self.hotkey_manager, 'is_active') or not self.hotkey_manager.is_active
-            return True
-        except Exception as e:
-            logger.error(f"Error verifying hotkey cleanup: {e}")
+            logger.error(f"Error verifying {attr} cleanup: {e}")
             return False
     
     def _cleanup_model(self) -> bool:
         """Clean up Whisper model resources"""
         try:
-            if hasattr(self, 'transcription_service') and self.transcription_service:
+            # Drop queued transcriptions and loads; in-flight ones run on daemon
+            # threads, so they never hold the process open at exit
+            self._transcribe_pool.shutdown(wait=False, cancel_futures=True)
+            self._load_pool.shutdown(wait=False, cancel_futures=True)
+            self._notify_pool.shutdown(wait=False, cancel_futures=True)
+            # A queued clipboard restore still runs so the user's content comes back
+            self._clipboard_pool.shutdown(wait=False)
+            
+            if self.transcription_service is not None:
                 self.transcription_service.stop()
                 self.transcription_service = None
 
-            if hasattr(self, 'model') and self.model:
+            if self.model is not None:
                 # Clear model reference to free memory
                 self.model = None
                 logger.debug("Whisper model cleaned up")
+            # The module cache would otherwise keep the last model alive
+            _openai_model_cache.clear()
             
             # Reset model state
             self.model_loaded = False
@@ -1067,7 +1645,7 @@ class SpeechController:
     def _verify_model_cleanup(self) -> bool:
         """Verify model cleanup"""
         try:
-            worker_stopped = not getattr(self, 'transcription_service', None)
+            worker_stopped = self.transcription_service is None
             return not self.model_loaded and not self.model_loading and worker_stopped
         except Exception as e:
             logger.error(f"Error verifying model cleanup: {e}")
@@ -1077,12 +1655,12 @@ class SpeechController:
         """Clean up temporary files"""
         try:
             # Clean up temporary audio file
-            if hasattr(self, 'audio_path') and self.audio_path and os.path.exists(self.audio_path):
+            if self.audio_path and os.path.exists(self.audio_path):
                 os.remove(self.audio_path)
                 logger.debug(f"Temporary audio file removed: {self.audio_path}")
             
             # Clean up temporary directory if empty
-            if hasattr(self, 'temp_dir') and self.temp_dir and os.path.exists(self.temp_dir):
+            if self.temp_dir and os.path.exists(self.temp_dir):
                 try:
                     os.rmdir(self.temp_dir)
                     logger.debug(f"Temporary directory removed: {self.temp_dir}")
@@ -1099,7 +1677,7 @@ class SpeechController:
         """Verify file cleanup"""
         try:
             # Check if temporary files are cleaned up
-            audio_file_cleaned = not (hasattr(self, 'audio_path') and self.audio_path and os.path.exists(self.audio_path))
+            audio_file_cleaned = not (self.audio_path and os.path.exists(self.audio_path))
             return audio_file_cleaned
         except Exception as e:
             logger.error(f"Error verifying file cleanup: {e}")
@@ -1,15 +1,16 @@
 import sys
 import time
 import os
+from types import MappingProxyType
+from typing import Optional, Protocol, Tuple
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QComboBox, QCheckBox, 
                              QLineEdit, QLabel, QGroupBox, QMessageBox, QTabWidget,
                              QScrollArea, QTextEdit, QFrame, QSlider, QFormLayout, QDesktopWidget,
                              QSizePolicy, QDialog)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QMetaObject, QPoint, QRectF, QUrl
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QMetaObject, QPoint, QRectF
 from PyQt5.QtGui import QFont, QPalette, QColor, QPixmap, QCursor, QPainter, QPen, QLinearGradient
-from PyQt5.QtMultimedia import QSoundEffect
-from speech_controller import SpeechController
+from speech_controller import STATUS_RECORDING, STATUS_PROCESSING, STATUS_IDLE
 from waveform_widget import WaveformWidget  # Import the dedicated widget
 from ui.main_window import MainWindow
 from ui.visual_indicator import VisualIndicatorWidget
@@ -24,18 +25,96 @@ from core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Footer display names for language codes
+_LANGUAGE_NAMES = MappingProxyType({
+    "en": "English", "de": "German", "es": "Spanish",
+    "sv": "Swedish", "fi": "Finnish", "pt": "Portuguese", "fr": "French"
+})
+
+# Status updates arriving within this many milliseconds are applied once, as the latest
+STATUS_COALESCE_MS = 16
+
+
+class SpeechControllerProtocol(Protocol):
+    """The controller surface SpeechApp relies on, so it can call it without probing"""
+    hotkey: str
+    model_size: str
+    language: str
+    temperature: float
+    speed_mode: bool
+    auto_paste: bool
+    toggle_mode: bool
+    visual_indicator_enabled: bool
+    visual_indicator_position: str
+
+    def _ensure_initialized(self) -> bool: ...
+    def preload_model(self) -> bool: ...
+    def get_model_status(self) -> str: ...
+    def start_recording(self) -> None: ...
+    def stop_recording(self) -> None: ...
+    def set_model(self, model_size: str) -> None: ...
+    def set_language(self, lang_code: str) -> None: ...
+    def set_temperature(self, temperature: float) -> None: ...
+    def set_speed_mode(self, enabled: bool) -> None: ...
+    def set_auto_paste(self, enabled: bool) -> None: ...
+    def set_toggle_mode(self, enabled: bool) -> None: ...
+    def set_hotkey(self, new_hotkey: str) -> None: ...
+    def set_visual_indicator(self, enabled: bool, position: str) -> None: ...
+    def cleanup(self) -> bool: ...
+
+
+# (settings key, controller attribute, controller setter, change label, refreshes hotkey instruction)
+_CONTROLLER_SETTINGS: Tuple[Tuple[str, str, str, str, bool], ...] = (
+    ("whisper/model_name", "model_size", "set_model", "model", False),
+    # Language and temperature are per-call decode options; the loaded model is kept
+    ("whisper/language", "language", "set_language", "language", False),
+    ("whisper/temperature", "temperature", "set_temperature", "temperature", False),
+    ("whisper/speed_mode", "speed_mode", "set_speed_mode", "speed mode", False),
+    ("behavior/auto_paste", "auto_paste", "set_auto_paste", "auto-paste", False),
+    ("behavior/toggle_mode", "toggle_mode", "set_toggle_mode", "toggle mode", True),
+    ("behavior/hotkey", "hotkey", "set_hotkey", "hotkey", True),
+)
+
+
+class ModelLoaderThread(QThread):
+    """
+    Finish controller initialization and kick off the model preload off the GUI thread.
+    
+    Signals:
+        loading_started(bool): Emitted when done; True if this call started a model load
+    """
+    
+    loading_started = pyqtSignal(bool)
+    
+    def __init__(self, controller: SpeechControllerProtocol, parent=None):
+        super().__init__(parent)
+        self.controller = controller
+    
+    def run(self):
+        started = False
+        try:
+            # Lazily constructed controllers finish initializing first
+            if not self.controller._ensure_initialized():
+                logger.warning("Failed to initialize controller for model loading")
+            else:
+                started = self.controller.preload_model()
+        except Exception as e:
+            logger.error(f"Error starting background model loading: {e}")
+        self.loading_started.emit(started)
+
 
 class SpeechApp(MainWindow):
     # Define signals for thread-safe communication
     transcript_updated = pyqtSignal()
     status_updated = pyqtSignal(str)
     
-    def __init__(self, controller: SpeechController, settings_manager: SettingsManager):
+    def __init__(self, controller: SpeechControllerProtocol, settings_manager: SettingsManager):
         super().__init__(settings_manager)
         self.controller = controller
         
         # Track initialization state to prevent sounds during startup
         self._is_initializing = True
+        self._model_loader: Optional[ModelLoaderThread] = None
         
         # Initialize lifecycle manager
         self.lifecycle_manager = WidgetLifecycleManager(self)
@@ -56,11 +135,21 @@ class SpeechApp(MainWindow):
         # Register UI cleanup tasks
         self._register_ui_cleanup_tasks()
         
+        # Status display state; bursts of updates are coalesced into one refresh
+        self._last_status: Optional[str] = None
+        self._last_footer_text: Optional[str] = None
+        self._pending_status: Optional[str] = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(STATUS_COALESCE_MS)
+        self._status_timer.timeout.connect(self._apply_pending_status)
+        
         # Connect signals to slots
-        self.status_updated.connect(self._update_status_safe)
+        self.status_updated.connect(self._queue_status, Qt.QueuedConnection)
         
-        # Connect MainWindow signals
-        self.settings_changed.connect(self.on_settings_changed)
+        # Settings edits need no wiring here: MainWindow.open_preferences connects the
+        # dialog's settings_changed to self.on_settings_changed, which is the override
+        # below, and the dialog emits it on the GUI thread
         
         # Set up callbacks
         self.controller.set_status_callback(self.update_status)
@@ -85,15 +174,10 @@ class SpeechApp(MainWindow):
         # Activate visual indicator
         self.lifecycle_manager.activate_widget("visual_indicator")
         
-        # DISABLED: This was overriding our responsive window sizing
-        # QTimer.singleShot(100, self.adjustSize)
-        
-        # Load model after UI is ready (on main thread with Qt event processing)
-        # This prevents PyQt/ONNX crashes while allowing UI to remain responsive
-        QTimer.singleShot(500, self.start_background_model_loading)
-        
-        # Mark initialization as complete after a short delay
-        QTimer.singleShot(1000, self._mark_initialization_complete)
+        # Once the event loop runs, make sure a model load is underway (a no-op when
+        # the controller was created with preload=True); sounds are enabled when the
+        # loader reports back, see _on_model_loading_started
+        QTimer.singleShot(0, self.start_background_model_loading)
     
     def _register_ui_cleanup_tasks(self):
         """Register UI cleanup tasks"""
@@ -122,7 +206,7 @@ class SpeechApp(MainWindow):
     def _cleanup_widget_lifecycle(self) -> bool:
         """Clean up widget lifecycle manager"""
         try:
-            if hasattr(self, 'lifecycle_manager') and self.lifecycle_manager:
+            if self.lifecycle_manager is not None:
                 self.lifecycle_manager.cleanup_all_widgets()
                 logger.debug("Widget lifecycle manager cleaned up")
             return True
@@ -134,9 +218,7 @@ class SpeechApp(MainWindow):
         """Verify widget cleanup"""
         try:
             # Check if visual indicator is properly cleaned up
-            if hasattr(self, 'visual_indicator'):
-                return self.visual_indicator is None or not self.visual_indicator.isVisible()
-            return True
+            return self.visual_indicator is None or not self.visual_indicator.isVisible()
         except Exception as e:
             logger.error(f"Error verifying widget cleanup: {e}")
             return False
@@ -144,7 +226,7 @@ class SpeechApp(MainWindow):
     def _cleanup_system_tray(self) -> bool:
         """Clean up system tray"""
         try:
-            if hasattr(self, 'system_tray') and self.system_tray:
+            if self.system_tray is not None:
                 self.system_tray.hide()
                 self.system_tray = None
                 logger.debug("System tray cleaned up")
@@ -156,7 +238,7 @@ class SpeechApp(MainWindow):
     def _verify_system_tray_cleanup(self) -> bool:
         """Verify system tray cleanup"""
         try:
-            return not hasattr(self, 'system_tray') or self.system_tray is None
+            return self.system_tray is None
         except Exception as e:
             logger.error(f"Error verifying system tray cleanup: {e}")
             return False
@@ -164,9 +246,11 @@ class SpeechApp(MainWindow):
     def _cleanup_visual_indicator(self):
         """Cleanup method for visual indicator widget"""
         try:
-            if hasattr(self, 'visual_indicator') and self.visual_indicator is not None:
+            if self.visual_indicator is not None:
                 self.visual_indicator.hide_recording()
                 self.visual_indicator.deleteLater()
+                # Cleared rather than deleted so every reader can test it for None
+                self.visual_indicator = None
                 logger.debug("Visual indicator cleaned up")
         except Exception as e:
             logger.error(f"Error cleaning up visual indicator: {e}")
@@ -175,48 +259,6 @@ class SpeechApp(MainWindow):
         """Mark initialization as complete to enable sounds"""
         self._is_initializing = False
     
-    def play_start_sound(self):
-        """Play start recording sound"""
-        try:
-            # Check if sound effects are enabled
-            if not self.settings_manager.get("audio/effects_enabled", True):
-                return
-            
-            # Get sound file path from settings
-            sound_file = self.settings_manager.get("audio/start_tone", "assets/sound_start_v9.wav")
-            
-            # Play sound using QSoundEffect
-            from PyQt5.QtMultimedia import QSoundEffect
-            from PyQt5.QtCore import QUrl
-            
-            sound_effect = QSoundEffect()
-            sound_effect.setSource(QUrl.fromLocalFile(sound_file))
-            sound_effect.play()
-            
-        except Exception as e:
-            logger.debug(f"Could not play start sound: {e}")
-    
-    def play_stop_sound(self):
-        """Play stop recording sound"""
-        try:
-            # Check if sound effects are enabled
-            if not self.settings_manager.get("audio/effects_enabled", True):
-                return
-            
-            # Get sound file path from settings
-            sound_file = self.settings_manager.get("audio/stop_tone", "assets/sound_end_v9.wav")
-            
-            # Play sound using QSoundEffect
-            from PyQt5.QtMultimedia import QSoundEffect
-            from PyQt5.QtCore import QUrl
-            
-            sound_effect = QSoundEffect()
-            sound_effect.setSource(QUrl.fromLocalFile(sound_file))
-            sound_effect.play()
-            
-        except Exception as e:
-            logger.debug(f"Could not play stop sound: {e}")
-        
     def init_app_ui(self):
         """Initialize application-specific UI components"""
         # Create tabs
@@ -224,9 +266,10 @@ class SpeechApp(MainWindow):
         self.record_tab = RecordTab(self)
         self.add_tab(self.record_tab, "Record")
         
-        # Create Transcripts tab second (rightmost position)
-        self.transcripts_tab = TranscriptsTab(self)
-        self.add_tab(self.transcripts_tab, "Transcripts")
+        # Transcripts tab second (rightmost position); a placeholder until first opened
+        self.transcripts_tab: Optional[TranscriptsTab] = None
+        self._transcripts_placeholder = QWidget()
+        self.add_tab(self._transcripts_placeholder, "Transcripts")
         
         # Connect tab change signal for dynamic resizing
         self.connect_tab_changed(self.on_tab_changed)
@@ -235,36 +278,38 @@ class SpeechApp(MainWindow):
         self.update_hotkey_instruction()
     
     def start_background_model_loading(self):
-        """Start loading the Whisper model in the background"""
-        # Check if controller is lazy-loaded and needs initialization first
-        if hasattr(self.controller, '_ensure_initialized'):
-            # This is a LazySpeechController, ensure it's initialized
-            if not self.controller._ensure_initialized():
-                logger.warning("Failed to initialize controller for model loading")
-                return
-        
-        if self.controller.preload_model():
+        """Start loading the Whisper model without blocking the GUI thread"""
+        if self._model_loader is not None and self._model_loader.isRunning():
+            return
+        # Keep a reference so the thread is not collected while it runs
+        self._model_loader = ModelLoaderThread(self.controller, self)
+        self._model_loader.loading_started.connect(self._on_model_loading_started)
+        self._model_loader.start()
+    
+    def _on_model_loading_started(self, started: bool):
+        """Reflect the preload outcome reported by ModelLoaderThread and finish startup"""
+        if started:
             logger.info("Started background model loading...")
-            # Update status to show loading
-            self.update_status("Idle")  # This will show "Model: Loading..."
+            # Apply "Idle" right away, before sounds are enabled, so startup stays silent
+            self._update_status_safe(STATUS_IDLE)  # This will show "Model: Loading..."
         else:
             logger.info("Model already loaded or loading")
+        self._mark_initialization_complete()
         
     def start_recording(self):
         """Start recording via GUI button"""
         # Ensure controller is initialized before recording
-        if hasattr(self.controller, '_ensure_initialized'):
-            if not self.controller._ensure_initialized():
-                QMessageBox.warning(
-                    self,
-                    "Recording Error",
-                    "Audio system is not ready. Please check your microphone and try again."
-                )
-                return
+        if not self.controller._ensure_initialized():
+            QMessageBox.warning(
+                self,
+                "Recording Error",
+                "Whiz is not ready to record. Please check your microphone and the "
+                "model status, then try again."
+            )
+            return
         
         self.controller.start_recording()
-        self.record_tab.start_button.setEnabled(False)
-        self.record_tab.stop_button.setEnabled(True)
+        self._set_record_buttons(False, True)
         
         # Play start sound (only after initialization)
         if not self._is_initializing:
@@ -273,38 +318,49 @@ class SpeechApp(MainWindow):
     def stop_recording(self):
         """Stop recording via GUI button"""
         self.controller.stop_recording()
-        self.record_tab.start_button.setEnabled(True)
-        self.record_tab.stop_button.setEnabled(False)
+        self._set_record_buttons(True, False)
         
         # Play stop sound (only after initialization)
         if not self._is_initializing:
             self.play_stop_sound()
         
-        # Refresh transcript log after recording
-        # Find the transcripts tab and refresh it
-        self.transcripts_tab.refresh_transcript_log()
+        # Refresh transcript log after recording (built on first visit; it loads
+        # the current history itself then)
+        if self.transcripts_tab is not None:
+            self.transcripts_tab.refresh_transcript_log()
         
     def on_new_transcript(self):
         """Handle new transcript added - emit signal for thread-safe update"""
         self.transcript_updated.emit()
         
     def update_status(self, status: str):
-        """Update the status display - emit signal for thread-safe update"""
-        self.status_updated.emit(status)
+        """Update the status display, posting through a queued signal only when called off the GUI thread"""
+        if QThread.currentThread() is self.thread():
+            self._queue_status(status)
+        else:
+            self.status_updated.emit(status)
+    
+    def _queue_status(self, status: str):
+        """Remember the latest status and refresh the display once the burst settles"""
+        self._pending_status = status
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+    
+    def _apply_pending_status(self):
+        """Apply the most recent status queued by _queue_status"""
+        status, self._pending_status = self._pending_status, None
+        if status is not None:
+            self._update_status_safe(status)
     
     def _update_status_safe(self, status: str):
         """Thread-safe status update"""
         # Get current language from controller
-        if hasattr(self.controller, 'language') and self.controller.language:
+        if self.controller.language:
             if self.controller.language == "auto":
                 current_language = "Auto"
             else:
                 # Convert language code to display name
-                lang_map = {
-                    "en": "English", "de": "German", "es": "Spanish", 
-                    "sv": "Swedish", "fi": "Finnish", "pt": "Portuguese", "fr": "French"
-                }
-                current_language = lang_map.get(self.controller.language, self.controller.language)
+                current_language = _LANGUAGE_NAMES.get(self.controller.language, self.controller.language)
         else:
             current_language = "Auto"
         
@@ -323,53 +379,75 @@ class SpeechApp(MainWindow):
         footer_text = f"{status} | {model_info}"
         
         # Update footer with combined information
-        self.update_footer(footer_text)
+        if footer_text != self._last_footer_text:
+            self._last_footer_text = footer_text
+            self.update_footer(footer_text)
+        
+        if status == self._last_status:
+            return  # Buttons, indicator and sounds already reflect this status
+        self._last_status = status
         
         # Clear main status area (no text displayed)
         self.record_tab.update_status("")
         
-        # Update waveform widget state
-        if status == "Recording...":
-            self.waveform_widget.set_state("recording")
-        elif status == "Processing...":
-            self.waveform_widget.set_state("transcribing")
-        else:  # Idle or any other status
-            self.waveform_widget.set_state("idle")
-        
-        # Update button states based on status
-        if status == "Recording...":
-            self.record_tab.start_button.setEnabled(False)
-            self.record_tab.stop_button.setEnabled(True)
-            # Show visual indicator if enabled
-            if (self.controller.visual_indicator_enabled and 
-                self.lifecycle_manager.is_widget_active("visual_indicator")):
-                visual_indicator = self.lifecycle_manager.get_widget("visual_indicator")
-                if visual_indicator is not None:
-                    visual_indicator.show_recording()
-            # Play start sound for hotkey-triggered recording (only after initialization)
-            if not self._is_initializing:
-                self.play_start_sound()
-        elif status == "Idle":
-            self.record_tab.start_button.setEnabled(True)
-            self.record_tab.stop_button.setEnabled(False)
-            # Hide visual indicator
-            if hasattr(self, 'visual_indicator') and self.visual_indicator is not None:
-                try:
-                    self.visual_indicator.hide_recording()
-                except RuntimeError:
-                    # Widget has been deleted, ignore the error
-                    self.visual_indicator = None
-            # Play stop sound for hotkey-triggered recording (only after initialization)
-            if not self._is_initializing:
-                self.play_stop_sound()
-        elif status == "Processing...":
-            self.record_tab.start_button.setEnabled(False)
-            self.record_tab.stop_button.setEnabled(False)
-            # Hide visual indicator during processing
-            if self.lifecycle_manager.is_widget_active("visual_indicator"):
-                visual_indicator = self.lifecycle_manager.get_widget("visual_indicator")
-                if visual_indicator is not None:
-                    visual_indicator.hide_recording()
+        # Dispatch on the status; unknown statuses only reset the waveform
+        handler, waveform_state = self._STATUS_HANDLERS.get(status, (None, "idle"))
+        self.waveform_widget.set_state(waveform_state)
+        if handler is not None:
+            handler(self)
+    
+    def _enter_recording(self):
+        """Update buttons, indicator and sound for the "Recording..." status"""
+        self._set_record_buttons(False, True)
+        # Show visual indicator if enabled
+        if self.controller.visual_indicator_enabled:
+            self._show_indicator_recording(True)
+        # Play start sound for hotkey-triggered recording (only after initialization)
+        if not self._is_initializing:
+            self.play_start_sound()
+    
+    def _enter_idle(self):
+        """Update buttons, indicator and sound for the "Idle" status"""
+        self._set_record_buttons(True, False)
+        # Hide visual indicator
+        self._show_indicator_recording(False)
+        # Play stop sound for hotkey-triggered recording (only after initialization)
+        if not self._is_initializing:
+            self.play_stop_sound()
+    
+    def _enter_processing(self):
+        """Update buttons and indicator for the "Processing..." status"""
+        self._set_record_buttons(False, False)
+        # Hide visual indicator during processing
+        self._show_indicator_recording(False)
+    
+    def _set_record_buttons(self, start_enabled: bool, stop_enabled: bool):
+        """Enable/disable the record buttons, skipping ones already in the wanted state"""
+        for button, enabled in ((self.record_tab.start_button, start_enabled),
+                                (self.record_tab.stop_button, stop_enabled)):
+            # WA_ForceDisabled is the button's own flag, independent of its parents
+            if button.testAttribute(Qt.WA_ForceDisabled) == enabled:
+                button.setEnabled(enabled)
+    
+    def _show_indicator_recording(self, recording: bool):
+        """Show or hide the visual indicator through the reference held since __init__"""
+        if self.visual_indicator is None:
+            return
+        try:
+            if recording:
+                self.visual_indicator.show_recording()
+            else:
+                self.visual_indicator.hide_recording()
+        except RuntimeError:
+            # Widget has been deleted by lifecycle cleanup, stop using it
+            self.visual_indicator = None
+    
+    # status -> (handler, waveform state)
+    _STATUS_HANDLERS = {
+        STATUS_RECORDING: (_enter_recording, "recording"),
+        STATUS_IDLE: (_enter_idle, "idle"),
+        STATUS_PROCESSING: (_enter_processing, "transcribing"),
+    }
             
     def update_hotkey_instruction(self):
         """Update the hotkey instruction label in the Record tab"""
@@ -388,74 +466,74 @@ class SpeechApp(MainWindow):
         self.open_preferences()
             
     def on_tab_changed(self, index: int):
-        """Handle tab change - maintain responsive window sizing"""
+        """Handle tab change - build the Transcripts tab on first visit, keep responsive sizing"""
+        if self.transcripts_tab is None and self.tab_widget.widget(index) is self._transcripts_placeholder:
+            self._build_transcripts_tab(index)
         # DISABLED: This was overriding our responsive window sizing
         # Let the responsive system maintain the proper window size
         # self.adjustSize()
         
     
+    def _build_transcripts_tab(self, index: int):
+        """Replace the Transcripts placeholder at ``index`` with the real tab"""
+        self.transcripts_tab = TranscriptsTab(self)  # Loads the transcript history
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, self.transcripts_tab, "Transcripts")
+            self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+        self._transcripts_placeholder.deleteLater()
+        self._transcripts_placeholder = None
+    
     def on_settings_changed(self, settings: dict):
-        """Handle settings changes from MainWindow"""
+        """Handle settings changes from MainWindow
+
+        The preferences dialog emits the full settings dict on every edit, so
+        only values that differ from the controller's current state are applied.
+        """
         try:
-            # Update UI elements that might have changed
-            if "hotkey/combo" in settings:
-                self.update_hotkey_instruction()
-            
-            # Handle Whisper settings changes
-            if "whisper/model_name" in settings:
-                new_model = settings["whisper/model_name"]
-                if hasattr(self.controller, 'set_model'):
-                    self.controller.set_model(new_model)
-                    self.update_status(f"Model changed to: {new_model}")
-            
-            if "whisper/temperature" in settings:
-                new_temperature = settings["whisper/temperature"]
-                if hasattr(self.controller, 'temperature'):
-                    self.controller.temperature = new_temperature
-                    self.update_status(f"Temperature updated to: {new_temperature}")
+            # This override replaces MainWindow.on_settings_changed, so sync the
+            # cached start/stop sound effects here too
+            self._apply_sound_settings(settings)
             
-            if "whisper/speed_mode" in settings:
-                new_speed_mode = settings["whisper/speed_mode"]
-                if hasattr(self.controller, 'speed_mode'):
-                    self.controller.speed_mode = new_speed_mode
-                    self.update_status(f"Speed mode updated to: {new_speed_mode}")
+            # Collect changes so one dialog commit gives one status and one hotkey refresh
+            changes = []
+            needs_hotkey_refresh = "hotkey/combo" in settings
             
-            # Handle behavior settings changes
-            if "behavior/auto_paste" in settings:
-                new_auto_paste = settings["behavior/auto_paste"]
-                if hasattr(self.controller, 'set_auto_paste'):
-                    self.controller.set_auto_paste(new_auto_paste)
-                    self.update_status(f"Auto-paste updated to: {new_auto_paste}")
-            
-            if "behavior/toggle_mode" in settings:
-                new_toggle_mode = settings["behavior/toggle_mode"]
-                if hasattr(self.controller, 'set_toggle_mode'):
-                    self.controller.set_toggle_mode(new_toggle_mode)
-                    self.update_hotkey_instruction()
-                    self.update_status(f"Toggle mode updated to: {new_toggle_mode}")
-            
-            if "behavior/hotkey" in settings:
-                new_hotkey = settings["behavior/hotkey"]
-                if hasattr(self.controller, 'set_hotkey'):
-                    self.controller.set_hotkey(new_hotkey)
-                    self.update_hotkey_instruction()
-                    self.update_status(f"Hotkey updated to: {new_hotkey}")
+            # Controller settings share one apply path
+            for key, attr, setter, label, refreshes_hotkey in _CONTROLLER_SETTINGS:
+                if key not in settings:
+                    continue
+                value = settings[key]
+                if value != getattr(self.controller, attr):
+                    getattr(self.controller, setter)(value)
+                    needs_hotkey_refresh = needs_hotkey_refresh or refreshes_hotkey
+                    changes.append(f"{label}={value}")
             
             if "behavior/minimize_to_tray" in settings:
                 new_minimize_to_tray = settings["behavior/minimize_to_tray"]
-                self.set_minimize_to_tray(new_minimize_to_tray)
-                self.update_status(f"Minimize to tray updated to: {new_minimize_to_tray}")
+                if new_minimize_to_tray != self.minimize_to_tray_enabled:
+                    self.set_minimize_to_tray(new_minimize_to_tray)
+                    changes.append(f"minimize to tray={new_minimize_to_tray}")
             
             if "behavior/visual_indicator" in settings or "behavior/indicator_position" in settings:
                 new_visual_indicator = settings.get("behavior/visual_indicator", True)
                 new_indicator_position = settings.get("behavior/indicator_position", "Bottom Center")
-                if hasattr(self.controller, 'set_visual_indicator'):
+                if (new_visual_indicator != self.controller.visual_indicator_enabled
+                        or new_indicator_position != self.controller.visual_indicator_position):
                     self.controller.set_visual_indicator(new_visual_indicator, new_indicator_position)
                     if self.lifecycle_manager.is_widget_active("visual_indicator"):
                         visual_indicator = self.lifecycle_manager.get_widget("visual_indicator")
                         if visual_indicator is not None:
                             visual_indicator.update_position(new_indicator_position)
-                    self.update_status(f"Visual indicator updated: {new_visual_indicator} at {new_indicator_position}")
+                    changes.append(f"visual indicator={new_visual_indicator} at {new_indicator_position}")
+            
+            if needs_hotkey_refresh:
+                self.update_hotkey_instruction()
+            if changes:
+                self.update_status("Settings updated: " + ", ".join(changes))
             
         except Exception as e:
             logger.error(f"Error applying settings changes: {e}")
@@ -463,7 +541,7 @@ class SpeechApp(MainWindow):
     def closeEvent(self, event):
         """Handle application close - override MainWindow's closeEvent"""
         try:
-            print(f"SpeechApp closeEvent called - minimize_to_tray_enabled: {self.minimize_to_tray_enabled}, system_tray: {self.system_tray is not None}")
+            logger.debug(f"SpeechApp closeEvent called - minimize_to_tray_enabled: {self.minimize_to_tray_enabled}, system_tray: {self.system_tray is not None}")
             
             # Clean up all managed widgets
             self.lifecycle_manager.cleanup_all_widgets()
@@ -473,13 +551,13 @@ class SpeechApp(MainWindow):
             
             # Only cleanup controller if we're actually quitting (not minimizing to tray)
             if event.isAccepted() and not (self.minimize_to_tray_enabled and self.system_tray):
-                print("SpeechApp: Actually quitting, cleaning up controller...")
+                logger.debug("SpeechApp: Actually quitting, cleaning up controller...")
                 self.controller.cleanup()
                 
                 # Single instance lock cleanup is handled by CleanupManager
                 # No need to manually release lock here
             else:
-                print("SpeechApp: Minimizing to tray or event ignored, skipping controller cleanup...")
+                logger.debug("SpeechApp: Minimizing to tray or event ignored, skipping controller cleanup...")
                 # Note: Single instance lock should NOT be released when minimizing to tray
             
         except Exception as e:
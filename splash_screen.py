@@ -33,23 +33,90 @@ Author: Whiz Development Team
 Last Updated: October 10, 2025
 """
 
+import concurrent.futures
 import sys
 import traceback
-import time
 import os
+from dataclasses import dataclass
 from PyQt5.QtWidgets import QApplication, QMessageBox, QWidget, QVBoxLayout, QLabel, QTextEdit, QDesktopWidget
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve
-from PyQt5.QtGui import QFont
+from PyQt5.QtGui import QFont, QTextCursor
 
 # Import core modules
 from core.logging_config import get_logger
-from core.settings_manager import SettingsManager
-from core.performance_monitor import get_performance_monitor
-from core.config import WHISPER_CONFIG
-# SpeechController and SpeechApp imported lazily to avoid heavy dependencies at startup
+# Settings, config, performance monitoring, SpeechController and SpeechApp are
+# imported lazily so nothing beyond Qt and logging sits in front of the first paint
 
 logger = get_logger(__name__)
 
+# Progress lines are written to the log view in batches of this size (and
+# always on the final tick) so the text document is laid out once per batch
+LOG_FLUSH_EVERY = 3
+
+# Splash widget stylesheets, kept here so init_ui reads as layout code; the
+# literals were already code-object constants, so this has no runtime effect
+_TITLE_QSS = """
+    QLabel {
+        color: #00C6FF;
+        font-weight: bold;
+        text-shadow: 0 0 10px rgba(0, 198, 255, 0.5);
+    }
+"""
+
+_STATUS_CONTAINER_QSS = """
+    QWidget {
+        background-color: rgba(0, 0, 0, 0.4);
+        border: 2px solid rgba(0, 198, 255, 0.6);
+        border-radius: 12px;
+        padding: 20px;
+    }
+"""
+
+_STATUS_LABEL_QSS = """
+    QLabel {
+        color: #FFFFFF;
+        font-weight: bold;
+        padding: 20px 0;
+    }
+"""
+
+_LOG_QSS = """
+    QTextEdit {
+        background-color: rgba(0, 0, 0, 0.3);
+        border: 1px solid rgba(0, 198, 255, 0.4);
+        border-radius: 6px;
+        color: #FFFFFF;
+        padding: 8px;
+        font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+    }
+    QScrollBar:vertical {
+        background: rgba(0, 0, 0, 0.3);
+        width: 8px;
+        border-radius: 4px;
+    }
+    QScrollBar::handle:vertical {
+        background: #00C6FF;
+        border-radius: 4px;
+        min-height: 20px;
+    }
+"""
+
+_ROOT_QSS = """
+    QWidget {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(0, 78, 146, 0.5), stop:1 rgba(0, 4, 40, 0.5));
+        border-radius: 20px;
+        border: 2px solid rgba(0, 198, 255, 0.6);
+    }
+"""
+
+
+@dataclass(frozen=True)
+class InitResult:
+    """Objects handed from the initialization worker to the splash screen."""
+    controller: object
+    settings_manager: object
+
 
 class InitializationWorker(QThread):
     """
@@ -61,12 +128,12 @@ class InitializationWorker(QThread):
     
     Signals:
         progress_updated(int, str): Emitted when progress updates (progress%, message)
-        initialization_complete(object, object): Emitted when done (controller, settings_manager)
+        initialization_complete(InitResult): Emitted when done (controller, settings_manager)
         initialization_failed(str): Emitted on error (error_message)
     """
     
     progress_updated = pyqtSignal(int, str)  # progress, message
-    initialization_complete = pyqtSignal(object, object)  # controller, settings_manager
+    initialization_complete = pyqtSignal(object)  # InitResult
     initialization_failed = pyqtSignal(str)  # error message
     
     def __init__(self):
@@ -98,72 +165,102 @@ class InitializationWorker(QThread):
         """
         try:
             # Step 1: Initialize logging system and performance monitoring
-            self.progress_updated.emit(5, "Initializing logging system...")
+            self._emit_progress(5, "Initializing logging system...")
             logger.info("Splash screen initialization started")
             
             # Start performance monitoring
+            from core.performance_monitor import get_performance_monitor
             performance_monitor = get_performance_monitor()
             performance_monitor.start_monitoring(interval=2.0)  # Monitor every 2 seconds
             
             # Step 2: Initialize settings manager
-            self.progress_updated.emit(15, "Loading settings manager...")
+            if self._cancelled():
+                return
+            self._emit_progress(15, "Loading settings manager...")
+            from core.settings_manager import SettingsManager
             settings_manager = SettingsManager()
             settings = settings_manager.load_all()
             logger.info(f"Settings manager loaded {len(settings)} settings")
             
-            # Step 3: Platform detection
-            self.progress_updated.emit(25, "Detecting platform features...")
+            # Steps 3-5: the hotkey probe runs alongside the audio probes and
+            # each step is reported in order as it finishes. Platform detection
+            # and the audio manager both query PortAudio, whose initialization
+            # and device enumeration are not thread-safe, so they share a worker
+            if self._cancelled():
+                return
             from core.platform_features import PlatformFeatures
-            platform_features = PlatformFeatures()
-            features = platform_features.detect_all_features()
-            logger.info(f"Platform features detected: {features}")
-            
-            # Step 4: Initialize audio manager
-            self.progress_updated.emit(35, "Initializing audio manager...")
             from core.audio_manager import AudioManager
-            audio_manager = AudioManager(sample_rate=16000, channels=1, chunk_size=1024)  # Use optimized chunk size
-            logger.info(f"Audio manager initialized. Available: {audio_manager.is_available()}")
-            
-            # Step 5: Initialize hotkey manager
-            self.progress_updated.emit(45, "Initializing hotkey manager...")
             from core.hotkey_manager import HotkeyManager
-            hotkey_manager = HotkeyManager()
-            logger.info(f"Hotkey manager initialized. Available: {hotkey_manager.is_available()}")
             
-            # Step 6: Prepare speech controller (lazy model loading)
-            self.progress_updated.emit(50, "Preparing speech controller...")
+            def probe_audio():
+                features = PlatformFeatures().detect_all_features()
+                audio_manager = AudioManager(
+                    sample_rate=16000, channels=1, chunk_size=1024  # Use optimized chunk size
+                )
+                return features, audio_manager
+            
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="whiz-init"
+            ) as executor:
+                audio_future = executor.submit(probe_audio)
+                hotkey_future = executor.submit(HotkeyManager)
+                
+                # Step 3: Platform detection
+                self._emit_progress(25, "Detecting platform features...")
+                features, audio_manager = audio_future.result()
+                logger.info(f"Platform features detected: {features}")
+                
+                # Step 4: Initialize audio manager
+                self._emit_progress(35, "Initializing audio manager...")
+                logger.info(f"Audio manager initialized. Available: {audio_manager.is_available()}")
+                
+                # Step 5: Initialize hotkey manager
+                self._emit_progress(45, "Initializing hotkey manager...")
+                hotkey_manager = hotkey_future.result()
+                logger.info(f"Hotkey manager initialized. Available: {hotkey_manager.is_available()}")
+            
+            # Step 6: Prepare speech controller (model preloads in background)
+            if self._cancelled():
+                return
+            self._emit_progress(50, "Preparing speech controller...")
             # Import SpeechController here to avoid heavy dependencies at module level
             from speech_controller import SpeechController
+            from core.config import WHISPER_CONFIG
+            get_setting = settings.get
             controller = SpeechController(
-                hotkey=settings.get("behavior/hotkey", "alt gr"),  # Use saved hotkey or default
-                model_size=settings.get("whisper/model_name", "tiny"),
-                auto_paste=settings.get("behavior/auto_paste", True),
-                language=settings.get("whisper/language", None),
-                temperature=settings.get("whisper/temperature", 0.0),
-                engine=settings.get("whisper/engine", WHISPER_CONFIG.DEFAULT_ENGINE)
+                hotkey=get_setting("behavior/hotkey", "alt gr"),  # Use saved hotkey or default
+                model_size=get_setting("whisper/model_name", "tiny"),
+                auto_paste=get_setting("behavior/auto_paste", True),
+                language=get_setting("whisper/language", None),
+                temperature=get_setting("whisper/temperature", 0.0),
+                engine=get_setting("whisper/engine", WHISPER_CONFIG.DEFAULT_ENGINE),
+                preload=True  # Load the model while the window opens
             )
             logger.info("Speech controller initialized successfully")
             
             # Step 7: Show window early! (was at 100%)
-            self.progress_updated.emit(40, "Opening window...")
-            time.sleep(0.05)  # Brief pause for visual feedback
+            if self._cancelled():
+                controller.cleanup()
+                return
+            self._emit_progress(55, "Opening window...")
             
             # Emit success NOW instead of waiting
-            self.initialization_complete.emit(controller, settings_manager)
+            self.initialization_complete.emit(InitResult(controller, settings_manager))
             
             # Continue with remaining initialization in background
-            self.progress_updated.emit(60, "Finalizing setup...")
+            self._emit_progress(60, "Finalizing setup...")
             
-            # Step 7: Model will load on first use (lazy loading)
-            self.progress_updated.emit(80, "Ready for transcription...")
-            logger.info("Application ready - model will load on first transcription")
+            # Step 7: The model is pre-warmed on the controller's load pool
+            # (preload=True above), so the first recording doesn't pay for it
+            self._emit_progress(80, "Ready for transcription...")
+            logger.info(f"Application ready - model status: {controller.get_model_status()}")
             
             # Step 8: Finalize initialization
-            self.progress_updated.emit(95, "Finalizing initialization...")
+            self._emit_progress(95, "Finalizing initialization...")
             logger.info("Initialization completed successfully")
             
             # Step 9: Ready
-            self.progress_updated.emit(100, "Ready!")
+            self._emit_progress(100, "Ready!")
             
             # Record startup time for performance monitoring
             performance_monitor.record_startup_time()
@@ -173,6 +270,27 @@ class InitializationWorker(QThread):
             logger.error(error_msg)
             logger.error(traceback.format_exc())
             self.initialization_failed.emit(error_msg)
+    
+    def _cancelled(self):
+        """Check whether cleanup() asked this worker to stop between steps."""
+        if self.isInterruptionRequested():
+            logger.info("Initialization cancelled")
+            return True
+        return False
+    
+    def _emit_progress(self, progress, message):
+        """
+        Emit a progress update.
+        
+        Every tick is sent: there are only about a dozen per startup, and a
+        dropped tick would leave the previous label up through the next
+        (possibly slow) step.
+        
+        Args:
+            progress (int): Progress percentage (0-100)
+            message (str): Progress message to display
+        """
+        self.progress_updated.emit(progress, message)
 
 
 class SplashScreen(QWidget):
@@ -203,6 +321,10 @@ class SplashScreen(QWidget):
         self.controller = None
         self.settings_manager = None
         self.main_window = None
+        self._log_lines = []
+        
+        # Screen geometry is read once and shared by the sizing/positioning code
+        self._screen_geom = QDesktopWidget().screenGeometry()
         
         # Initialize UI
         self.init_ui()
@@ -236,27 +358,14 @@ class SplashScreen(QWidget):
         self.title_label = QLabel("Whiz")
         self.title_label.setAlignment(Qt.AlignCenter)
         self.title_label.setFont(QFont("Segoe UI", 36, QFont.Bold))
-        self.title_label.setStyleSheet("""
-            QLabel {
-                color: #00C6FF;
-                font-weight: bold;
-                text-shadow: 0 0 10px rgba(0, 198, 255, 0.5);
-            }
-        """)
+        self.title_label.setStyleSheet(_TITLE_QSS)
         
         header_layout.addWidget(self.title_label)
         main_layout.addLayout(header_layout)
         
         # Status container
         status_container = QWidget()
-        status_container.setStyleSheet("""
-            QWidget {
-                background-color: rgba(0, 0, 0, 0.4);
-                border: 2px solid rgba(0, 198, 255, 0.6);
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
+        status_container.setStyleSheet(_STATUS_CONTAINER_QSS)
         status_layout = QVBoxLayout(status_container)
         status_layout.setSpacing(15)
         status_layout.setContentsMargins(30, 20, 30, 20)
@@ -265,13 +374,7 @@ class SplashScreen(QWidget):
         self.status_label = QLabel("Preparing something spectacular...")
         self.status_label.setAlignment(Qt.AlignCenter)
         self.status_label.setFont(QFont("Segoe UI", 16, QFont.Bold))
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: #FFFFFF;
-                font-weight: bold;
-                padding: 20px 0;
-            }
-        """)
+        self.status_label.setStyleSheet(_STATUS_LABEL_QSS)
         
         status_layout.addWidget(self.status_label)
         
@@ -280,39 +383,13 @@ class SplashScreen(QWidget):
         self.log_text.setFixedHeight(120)
         self.log_text.setFont(QFont("Consolas", 10))
         self.log_text.setReadOnly(True)
-        self.log_text.setStyleSheet("""
-            QTextEdit {
-                background-color: rgba(0, 0, 0, 0.3);
-                border: 1px solid rgba(0, 198, 255, 0.4);
-                border-radius: 6px;
-                color: #FFFFFF;
-                padding: 8px;
-                font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-            }
-            QScrollBar:vertical {
-                background: rgba(0, 0, 0, 0.3);
-                width: 8px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical {
-                background: #00C6FF;
-                border-radius: 4px;
-                min-height: 20px;
-            }
-        """)
+        self.log_text.setStyleSheet(_LOG_QSS)
         
         status_layout.addWidget(self.log_text)
         main_layout.addWidget(status_container)
         
         # Apply main styling
-        self.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(0, 78, 146, 0.5), stop:1 rgba(0, 4, 40, 0.5));
-                border-radius: 20px;
-                border: 2px solid rgba(0, 198, 255, 0.6);
-            }
-        """)
+        self.setStyleSheet(_ROOT_QSS)
         
     def center_window(self):
         """
@@ -321,7 +398,7 @@ class SplashScreen(QWidget):
         Calculates the center position based on screen geometry and
         moves the window to that position.
         """
-        screen = QDesktopWidget().screenGeometry()
+        screen = self._screen_geom
         size = self.geometry()
         x = (screen.width() - size.width()) // 2
         y = (screen.height() - size.height()) // 2
@@ -361,80 +438,32 @@ class SplashScreen(QWidget):
         self.status_label.setText(message)
         
         # Add to log display
-        self.log_text.append(f"[{progress}%] {message}")
+        self._log_lines.append(f"[{progress}%] {message}")
+        if progress >= 100 or len(self._log_lines) % LOG_FLUSH_EVERY == 0:
+            self._flush_log()
         
-        # Scroll to bottom
-        self.log_text.verticalScrollBar().setValue(
-            self.log_text.verticalScrollBar().maximum()
-        )
+        # Paint the status line now; the queued signal already returns to the
+        # event loop, so there's no need to drain it with processEvents()
+        self.status_label.repaint()
         
-        # Process events to update UI
-        self.app.processEvents()
+    def _flush_log(self):
+        """Write the buffered progress lines to the log view and scroll to the end."""
+        self.log_text.setPlainText("\n".join(self._log_lines))
+        self.log_text.moveCursor(QTextCursor.End)
         
-    def center_window(self):
-        """
-        Center the splash screen window on the screen.
-        
-        Calculates the center position based on screen geometry and
-        moves the window to that position.
-        """
-        # Get screen geometry
-        screen = QDesktopWidget().screenGeometry()
-        screen_width = screen.width()
-        screen_height = screen.height()
-        
-        # Get window size
-        window_size = self.size()
-        window_width = window_size.width()
-        window_height = window_size.height()
-        
-        # Calculate center position
-        x = (screen_width - window_width) // 2
-        y = (screen_height - window_height) // 2
-        
-        # Move window to center
-        self.move(x, y)
-    
-    def setup_responsive_geometry(self):
-        """
-        Setup responsive geometry for the splash screen.
-        
-        This method handles responsive sizing and positioning
-        for different screen resolutions and DPI settings.
-        """
-        # Get screen geometry
-        screen = QDesktopWidget().screenGeometry()
-        
-        # Calculate responsive size based on screen size
-        base_width = 500
-        base_height = 400
-        
-        # Scale based on screen size (minimum 80% of screen, maximum base size)
-        scale_factor = min(0.8, max(0.4, min(screen.width() / 1920, screen.height() / 1080)))
-        
-        responsive_width = int(base_width * scale_factor)
-        responsive_height = int(base_height * scale_factor)
-        
-        # Set responsive size
-        self.setFixedSize(responsive_width, responsive_height)
-        
-        # Center the window
-        self.center_window()
-        
-    def on_initialization_complete(self, controller, settings_manager):
+    def on_initialization_complete(self, result):
         """
         Handle successful initialization completion.
         
         Args:
-            controller (SpeechController): Initialized speech controller
-            settings_manager (SettingsManager): Initialized settings manager
+            result (InitResult): Initialized speech controller and settings manager
         """
         logger.info("Initialization completed successfully!")
         self.status_label.setText("Ready!")
         
         # Store initialized objects
-        self.controller = controller
-        self.settings_manager = settings_manager
+        self.controller = result.controller
+        self.settings_manager = result.settings_manager
         
         # Start fade out animation
         QTimer.singleShot(1000, self.fade_out)
@@ -447,6 +476,7 @@ class SplashScreen(QWidget):
             error_message (str): Error message describing the failure
         """
         logger.error(f"Initialization failed: {error_message}")
+        self._flush_log()
         self.status_label.setText("Initialization Failed!")
         self.status_label.setStyleSheet("""
             QLabel {
@@ -513,7 +543,7 @@ class SplashScreen(QWidget):
                 self.main_window.single_instance_manager = self.single_instance_manager
             
             # Position window
-            screen = QDesktopWidget().screenGeometry()
+            screen = self._screen_geom
             window_size = self.main_window.size()
             x = 100
             y = 100
@@ -528,6 +558,10 @@ class SplashScreen(QWidget):
             self.main_window.activateWindow()
             self.main_window.setFocus()
             
+            # No import warm-up is needed here: the controller's preload has
+            # already imported the engine on its load pool (faster-whisper in
+            # its own worker process), and numpy came in with speech_controller
+            
             # Close splash screen
             self.close()
             
@@ -554,7 +588,7 @@ class SplashScreen(QWidget):
             # No need to manually release lock here
             
             # Clean up worker thread
-            if hasattr(self, 'worker') and self.worker.isRunning():
+            if self.worker.isRunning():
                 self.worker.quit()
                 self.worker.wait(3000)  # Wait up to 3 seconds
                 
@@ -567,9 +601,12 @@ class SplashScreen(QWidget):
         """
         Clean up splash screen resources.
         
-        Terminates the worker thread if still running and performs
-        any necessary cleanup operations.
+        Asks a still-running worker to stop at its next step boundary and
+        only terminates it if it doesn't finish within 3 seconds.
         """
-        if hasattr(self, 'worker') and self.worker.isRunning():
-            self.worker.terminate()
-            self.worker.wait()
\ No newline at end of file
+        if self.worker.isRunning():
+            self.worker.requestInterruption()
+            if not self.worker.wait(3000):
+                logger.warning("Initialization worker did not stop in time, terminating")
+                self.worker.terminate()
+                self.worker.wait()
\ No newline at end of file
@@ -3,10 +3,49 @@ pytest configuration file
 Automatically configures test environment for all tests
 """
 
+import functools
 import os
+import re
 import sys
 from pathlib import Path
 
+# Node-id fragments that select the integration / e2e markers, matched in one pass
+_MARKER_RE = re.compile(r"Integration|RealAudioWorkflow")
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_bin_path():
+    """Return the bundled FFmpeg bin directory, or None if it isn't there."""
+    ffmpeg_bin = Path(__file__).parent.parent / "ffmpeg" / "bin"
+    return ffmpeg_bin if ffmpeg_bin.is_dir() else None
+
+
+@functools.lru_cache(maxsize=1)
+def _cleanup_reset_hook():
+    """
+    Resolve core.cleanup_manager.reset_cleanup_manager once per session.
+    
+    Resolved lazily rather than at import time because the project root is
+    only put on sys.path in pytest_configure.
+    """
+    try:
+        from core.cleanup_manager import reset_cleanup_manager
+    except Exception:
+        return None  # Not available in all test contexts
+    return reset_cleanup_manager
+
+
+def _reset_cleanup_manager():
+    """Reset the global cleanup manager if it's importable in this context."""
+    reset_cleanup_manager = _cleanup_reset_hook()
+    if reset_cleanup_manager is None:
+        return
+    try:
+        reset_cleanup_manager()
+    except Exception:
+        pass
+
+
 def pytest_configure(config):
     """
     Configure pytest before test collection.
@@ -14,18 +53,25 @@ def pytest_configure(config):
     """
     # Add project root to Python path
     project_root = Path(__file__).parent.parent
-    sys.path.insert(0, str(project_root))
+    if str(project_root) not in sys.path:
+        sys.path.insert(0, str(project_root))
     
     # Add FFmpeg to PATH if it exists locally
-    ffmpeg_bin = project_root / "ffmpeg" / "bin"
-    if ffmpeg_bin.exists():
+    ffmpeg_bin = _ffmpeg_bin_path()
+    if ffmpeg_bin is not None:
         current_path = os.environ.get("PATH", "")
-        if str(ffmpeg_bin) not in current_path:
+        if str(ffmpeg_bin) not in current_path.split(os.pathsep):
             os.environ["PATH"] = f"{ffmpeg_bin}{os.pathsep}{current_path}"
             print(f"[PYTEST] Added FFmpeg to PATH: {ffmpeg_bin}")
     else:
-        print(f"[PYTEST] FFmpeg not found at: {ffmpeg_bin}")
+        print(f"[PYTEST] FFmpeg not found at: {project_root / 'ffmpeg' / 'bin'}")
         print("[PYTEST] E2E tests requiring FFmpeg will be skipped")
+    
+    # Registered here too so the marker is known when pytest-xdist isn't installed
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run the marked tests on the same worker under --dist loadgroup",
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -35,16 +81,19 @@ def pytest_collection_modifyitems(config, items):
     import pytest
     
     for item in items:
+        found = set(_MARKER_RE.findall(item.nodeid))
+        is_integration = "Integration" in found
+        
         # Add integration marker to integration test classes
-        if "Integration" in item.nodeid:
+        if is_integration:
             item.add_marker(pytest.mark.integration)
         
         # Add e2e marker to end-to-end tests
-        if "RealAudioWorkflow" in item.nodeid:
+        if "RealAudioWorkflow" in found:
             item.add_marker(pytest.mark.e2e)
         
         # Add unit marker to non-integration tests
-        if "Integration" not in item.nodeid and "e2e" not in item.keywords:
+        if not is_integration and "e2e" not in item.keywords:
             item.add_marker(pytest.mark.unit)
 
 
@@ -54,11 +103,7 @@ def pytest_runtest_setup(item):
     This ensures tests don't interfere with each other.
     """
     # Reset the global cleanup manager before each test to allow re-registration
-    try:
-        from core.cleanup_manager import reset_cleanup_manager
-        reset_cleanup_manager()
-    except (ImportError, Exception):
-        pass  # Not available in all test contexts
+    _reset_cleanup_manager()
 
 
 def pytest_runtest_teardown(item, nextitem):
@@ -66,10 +111,6 @@ def pytest_runtest_teardown(item, nextitem):
     Clean up after each test run.
     """
     # Reset cleanup manager after test completion too
-    try:
-        from core.cleanup_manager import reset_cleanup_manager
-        reset_cleanup_manager()
-    except (ImportError, Exception):
-        pass  # Not available in all test contexts
+    _reset_cleanup_manager()
 
 
@@ -1,7 +1,10 @@
 import os
 import tempfile
+from contextlib import contextmanager
 from unittest.mock import Mock, patch
 
+import numpy as np
+
 from PyQt5.QtWidgets import QApplication
 
 from speech_controller import SpeechController
@@ -10,6 +13,10 @@ from core.cleanup_manager import reset_cleanup_manager
 
 
 class FakeTranscriptionService:
+    @staticmethod
+    def available():
+        return True
+
     def __init__(self, model_name, device, compute_type):
         self.model_name = model_name
         self.device = device
@@ -17,6 +24,7 @@ class FakeTranscriptionService:
         self.is_ready = False
         self.started = False
         self.stopped = False
+        self.array_calls = []
 
     def start(self, timeout_seconds=30.0):
         self.started = True
@@ -34,12 +42,26 @@ class FakeTranscriptionService:
             },
         }
 
+    def transcribe_array(self, samples, language, temperature, speed_mode, timeout_seconds=60.0):
+        self.array_calls.append(samples)
+        return {
+            "text": "array transcript",
+            "metadata": {
+                "engine": "faster",
+                "language": language,
+                "temperature": temperature,
+                "speed_mode": speed_mode,
+            },
+        }
+
     def stop(self):
         self.stopped = True
         self.is_ready = False
 
 
-def test_faster_engine_uses_process_service_smoke():
+@contextmanager
+def _faster_controller():
+    """Yield a faster-engine SpeechController backed by FakeTranscriptionService."""
     # Reset cleanup manager for test isolation
     reset_cleanup_manager()
     
@@ -79,13 +101,24 @@ def test_faster_engine_uses_process_service_smoke():
             assert controller._ensure_model_loaded(timeout_seconds=5.0) is True
             assert controller.transcription_service is not None
             assert controller.transcription_service.is_ready is True
+            yield controller
+        finally:
+            if hasattr(controller, "cleanup"):
+                controller.cleanup()
+            # Reset for next test
+            reset_cleanup_manager()
 
+
+def test_faster_engine_uses_process_service_smoke():
+    with _faster_controller() as controller:
+        try:
             # Prepare a valid audio file because process_recorded_audio validates path + size
             with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_audio:
                 temp_audio.write(b"0" * 4096)
                 audio_path = temp_audio.name
 
             controller.audio_path = audio_path
+            # Not a whole number of float32 samples, so the WAV fallback is taken
             controller.recording_frames = [b"dummy-frame"]
             controller.save_audio_to_file = Mock(return_value=True)
 
@@ -94,10 +127,20 @@ def test_faster_engine_uses_process_service_smoke():
             assert len(controller.transcript_log) > 0
             assert controller.transcript_log[0]["text"] == "integration transcript"
         finally:
-            if hasattr(controller, "cleanup"):
-                controller.cleanup()
             if "audio_path" in locals() and os.path.exists(audio_path):
                 os.unlink(audio_path)
-            # Reset for next test
-            reset_cleanup_manager()
 
+
+def test_faster_engine_sends_samples_without_saving_wav_smoke():
+    with _faster_controller() as controller:
+        tone = (0.1 * np.sin(np.linspace(0, 2 * np.pi * 440, controller.RATE))).astype(np.float32)
+        controller.recording_frames = [tone[:8000].tobytes(), tone[8000:].tobytes()]
+        controller.save_audio_to_file = Mock(return_value=True)
+
+        controller.process_recorded_audio()
+
+        controller.save_audio_to_file.assert_not_called()
+        array_calls = controller.transcription_service.array_calls
+        assert len(array_calls) == 1
+        np.testing.assert_array_equal(array_calls[0], tone)
+        assert controller.transcript_log[0]["text"] == "array transcript"
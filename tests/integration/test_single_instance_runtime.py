@@ -7,8 +7,6 @@ to start multiple instances and verifying only one can run.
 """
 
 import sys
-import time
-import subprocess
 import os
 from pathlib import Path
 
@@ -33,7 +31,7 @@ def test_single_instance_runtime():
         success1, message1 = manager1.try_acquire_lock()
         print(f"✓ First instance: success={success1}, message={message1}")
         print(f"✓ Lock acquired: {manager1.lock_acquired}")
-        print(f"✓ Lock file exists: {manager1.lock_file_path.exists()}")
+        print(f"✓ Lock file exists: {manager1.get_status()['lock_file_exists']}")
         
         if manager1.shared_memory:
             print(f"✓ Qt shared memory attached: {manager1.shared_memory.isAttached()}")
@@ -74,11 +72,12 @@ def test_single_instance_runtime():
         result = manager1.release_lock()
         print(f"✓ Release result: {result}")
         print(f"✓ Lock acquired after release: {manager1.lock_acquired}")
-        print(f"✓ Lock file exists after release: {manager1.lock_file_path.exists()}")
+        lock_file_exists = manager1.get_status()['lock_file_exists']
+        print(f"✓ Lock file exists after release: {lock_file_exists}")
         
         assert result == True, "Release should succeed"
         assert manager1.lock_acquired == False, "Lock should be released"
-        assert not manager1.lock_file_path.exists(), "Lock file should be removed"
+        assert not lock_file_exists, "Lock file should be removed"
         print("✓ PASSED\n")
         
         # Now second instance should be able to acquire
@@ -113,9 +112,7 @@ def test_single_instance_runtime():
         print(f"✓ PID: {status['pid']}")
         print(f"✓ Qt available: {status['qt_available']}")
         
-        assert 'lock_acquired' in status
-        assert 'pid' in status
-        assert 'qt_available' in status
+        assert {'lock_acquired', 'pid', 'qt_available'} <= status.keys()
         assert status['pid'] == os.getpid()
         print("✓ PASSED\n")
         
@@ -20,7 +20,8 @@ class TestAudioSettings(unittest.TestCase):
     
     def setUp(self):
         """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp_dir.name
         self.settings_file = os.path.join(self.temp_dir, "audio_test_settings.ini")
         self.settings_manager = SettingsManager("AudioTest", "TestApp")
         self.settings_manager.settings = QSettings(self.settings_file, QSettings.IniFormat)
@@ -28,13 +29,7 @@ class TestAudioSettings(unittest.TestCase):
     def tearDown(self):
         """Clean up test environment."""
         try:
-            if os.path.exists(self.settings_file):
-                os.unlink(self.settings_file)
-            for file in os.listdir(self.temp_dir):
-                file_path = os.path.join(self.temp_dir, file)
-                if os.path.isfile(file_path):
-                    os.unlink(file_path)
-            os.rmdir(self.temp_dir)
+            self._temp_dir.cleanup()
         except OSError:
             pass
     
@@ -54,6 +49,36 @@ class TestAudioSettings(unittest.TestCase):
         self.settings_manager.set("audio/effects_enabled", "no")
         self.assertFalse(self.settings_manager.get("audio/effects_enabled"))
     
+    def test_live_sound_settings_reach_speech_app(self):
+        """Test Preferences edits update SpeechApp's cached sound effects."""
+        app = QApplication.instance()
+        if app is None:
+            app = QApplication([])
+        
+        from unittest.mock import Mock
+        from PyQt5.QtCore import QUrl
+        from PyQt5.QtMultimedia import QSoundEffect
+        from speech_ui import SpeechApp
+        from ui.main_window import MainWindow
+        
+        # SpeechApp.on_settings_changed only touches these attributes for audio keys
+        window = Mock()
+        window.sound_enabled = True
+        window.sound_start = QSoundEffect()
+        window.sound_end = QSoundEffect()
+        window._apply_sound_settings = MainWindow._apply_sound_settings.__get__(window)
+        
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        new_tone = os.path.join(project_root, "assets", "sound_start_v1.wav")
+        
+        SpeechApp.on_settings_changed(window, {
+            "audio/effects_enabled": False,
+            "audio/start_tone": new_tone,
+        })
+        
+        self.assertFalse(window.sound_enabled)
+        self.assertEqual(window.sound_start.source(), QUrl.fromLocalFile(new_tone))
+    
     def test_tone_file_paths(self):
         """Test tone file path settings."""
         # Test with existing file
@@ -28,6 +28,11 @@ from core.cleanup_manager import get_cleanup_manager
 class TestFullWorkflowIntegration(unittest.TestCase):
     """Integration tests for complete user workflows"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Look up the global cleanup manager once for the class"""
+        cls.cleanup_manager = get_cleanup_manager()
+    
     def setUp(self):
         """Set up test environment"""
         self.app = QApplication.instance()
@@ -35,10 +40,7 @@ class TestFullWorkflowIntegration(unittest.TestCase):
             self.app = QApplication([])
         
         # Reset cleanup manager
-        cleanup_mgr = get_cleanup_manager()
-        cleanup_mgr._cleanup_started = False
-        cleanup_mgr._cleanup_completed = False
-        cleanup_mgr.tasks = {}
+        self.cleanup_manager.reset()
         
         # Ensure sandbox exists
         sandbox = get_sandbox()
@@ -82,11 +84,11 @@ class TestFullWorkflowIntegration(unittest.TestCase):
             self.skipTest("Model loading failed")
         
         # Track callbacks
-        status_updates = []
+        status_updates = set()
         transcripts = []
         
         def capture_status(status):
-            status_updates.append(status)
+            status_updates.add(status)
         
         def capture_transcript():
             if len(self.controller.transcript_log) > 0:
@@ -116,7 +118,8 @@ class TestFullWorkflowIntegration(unittest.TestCase):
         time.sleep(2)  # Wait for transcription
         
         # Verify status updates occurred
-        self.assertGreater(len(status_updates), 0, "Should have status updates")
+        self.assertIn("Recording...", status_updates)
+        self.assertIn("Processing...", status_updates)
         
         # Verify recording frames were captured
         self.assertIsNotNone(self.controller.recording_frames)
@@ -143,6 +146,8 @@ class TestFullWorkflowIntegration(unittest.TestCase):
         # Mock the model
         self.controller.model = Mock()
         self.controller.model_loaded = True
+        # Exercise the keystroke fallback rather than the clipboard paste
+        self.controller._clipboard_paste_available = False
         
         # Create fake audio file
         sandbox = get_sandbox()
@@ -150,12 +155,11 @@ class TestFullWorkflowIntegration(unittest.TestCase):
         
         # Write minimal WAV file
         import numpy as np
-        audio_data = np.zeros(16000, dtype=np.int16)  # 1 second silence
         with wave.open(test_audio, 'wb') as wf:
             wf.setnchannels(1)
             wf.setsampwidth(2)
             wf.setframerate(16000)
-            wf.writeframes(audio_data.tobytes())
+            wf.writeframes(bytes(2 * 16000))  # 1 second of int16 silence
         
         self.controller.audio_path = test_audio
         
@@ -165,8 +169,9 @@ class TestFullWorkflowIntegration(unittest.TestCase):
             mock_transcribe.return_value = {'text': test_text}
             
             # Simulate recording frames
-            with wave.open(test_audio, 'rb') as wf:
-                audio_bytes = wf.readframes(wf.getnframes())
+            # (float32 like the audio manager delivers; silence would be skipped)
+            t = np.arange(16000) / 16000
+            audio_bytes = (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32).tobytes()
             self.controller.recording_frames = [audio_bytes]
             
             # Process audio (should trigger auto-paste)
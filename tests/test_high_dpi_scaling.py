@@ -205,12 +205,8 @@ class TestDPIScalingIntegration(unittest.TestCase):
     
     def test_splash_screen_scaling(self):
         """Test that splash screens also handle DPI scaling correctly"""
-        # Check splash_screen.py has responsive geometry method
-        with open('splash_screen.py', 'r') as f:
-            content = f.read()
-        
-        self.assertIn('setup_responsive_geometry', content)
-        
+        # The splash keeps a fixed logical size (its layout doesn't fit a
+        # smaller box); Qt's high-DPI scaling handles physical pixels.
         # Check main_with_splash.py has DPI support
         with open('main_with_splash.py', 'r') as f:
             content = f.read()
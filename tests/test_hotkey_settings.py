@@ -19,7 +19,8 @@ class TestHotkeySettings(unittest.TestCase):
     
     def setUp(self):
         """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp_dir.name
         self.settings_file = os.path.join(self.temp_dir, "hotkey_test_settings.ini")
         self.settings_manager = SettingsManager("HotkeyTest", "TestApp")
         self.settings_manager.settings = QSettings(self.settings_file, QSettings.IniFormat)
@@ -27,13 +28,7 @@ class TestHotkeySettings(unittest.TestCase):
     def tearDown(self):
         """Clean up test environment."""
         try:
-            if os.path.exists(self.settings_file):
-                os.unlink(self.settings_file)
-            for file in os.listdir(self.temp_dir):
-                file_path = os.path.join(self.temp_dir, file)
-                if os.path.isfile(file_path):
-                    os.unlink(file_path)
-            os.rmdir(self.temp_dir)
+            self._temp_dir.cleanup()
         except OSError:
             pass
     
@@ -7,9 +7,11 @@ Tests the full workflow from audio capture to transcription without mocking.
 import unittest
 import tempfile
 import os
+import struct
 import time
 import wave
 import numpy as np
+import pytest
 from unittest.mock import Mock, patch, MagicMock
 from PyQt5.QtWidgets import QApplication
 from pathlib import Path
@@ -23,6 +25,17 @@ from core.path_validation import get_sandbox
 from core.cleanup_manager import get_cleanup_manager
 
 
+def _write_wav(filename, pcm_bytes, sample_rate):
+    """Write mono 16-bit PCM with a precomputed 44-byte header in one write."""
+    data_size = len(pcm_bytes)
+    header = struct.pack('<4sI4s4sIHHIIHH4sI',
+                         b'RIFF', 36 + data_size, b'WAVE',
+                         b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+                         b'data', data_size)
+    with open(filename, 'wb') as f:
+        f.write(header + pcm_bytes)
+
+
 def create_test_audio_file(filename, duration_seconds=2, sample_rate=16000, frequency=440):
     """
     Create a test WAV file with a sine wave tone.
@@ -40,25 +53,19 @@ def create_test_audio_file(filename, duration_seconds=2, sample_rate=16000, freq
     # Convert to int16
     audio_int16 = (audio_data * 32767).astype(np.int16)
     
-    # Write WAV file
-    with wave.open(filename, 'wb') as wf:
-        wf.setnchannels(1)  # Mono
-        wf.setsampwidth(2)  # 2 bytes per sample (int16)
-        wf.setframerate(sample_rate)
-        wf.writeframes(audio_int16.tobytes())
+    # Write WAV file (mono, 2 bytes per sample)
+    _write_wav(filename, audio_int16.tobytes(), sample_rate)
 
 
 def create_silent_audio_file(filename, duration_seconds=2, sample_rate=16000):
     """Create a silent WAV file."""
-    audio_data = np.zeros(int(sample_rate * duration_seconds), dtype=np.int16)
-    
-    with wave.open(filename, 'wb') as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)
-        wf.setframerate(sample_rate)
-        wf.writeframes(audio_data.tobytes())
+    # Zeroed int16 PCM; no array needs to be built just to serialise it
+    audio_bytes = bytes(2 * int(sample_rate * duration_seconds))
+    _write_wav(filename, audio_bytes, sample_rate)
 
 
+# setUpClass writes the shared WAV fixtures; keep the class on one xdist worker
+@pytest.mark.xdist_group(name="real_audio")
 class TestRealAudioWorkflow(unittest.TestCase):
     """End-to-end tests with real audio files"""
     
@@ -68,6 +75,7 @@ class TestRealAudioWorkflow(unittest.TestCase):
         cls.app = QApplication.instance()
         if cls.app is None:
             cls.app = QApplication([])
+        cls.cleanup_manager = get_cleanup_manager()
         
         # Create temp directory for test audio files
         cls.test_audio_dir = tempfile.mkdtemp(prefix='whiz_test_audio_')
@@ -78,8 +86,15 @@ class TestRealAudioWorkflow(unittest.TestCase):
         cls.silent_audio_file = os.path.join(cls.test_audio_dir, 'test_silent.wav')
         
         create_test_audio_file(cls.short_audio_file, duration_seconds=2)
-        create_test_audio_file(cls.long_audio_file, duration_seconds=30)
         create_silent_audio_file(cls.silent_audio_file, duration_seconds=2)
+        # The 30 s file is only needed by the slow test; see _long_audio_file()
+    
+    @classmethod
+    def _long_audio_file(cls):
+        """Write the 30-second tone on first use and reuse it afterwards."""
+        if not os.path.exists(cls.long_audio_file):
+            create_test_audio_file(cls.long_audio_file, duration_seconds=30)
+        return cls.long_audio_file
     
     @classmethod
     def tearDownClass(cls):
@@ -91,10 +106,7 @@ class TestRealAudioWorkflow(unittest.TestCase):
     def setUp(self):
         """Set up for each test"""
         # Reset cleanup manager state for clean test environment
-        cleanup_mgr = get_cleanup_manager()
-        cleanup_mgr._cleanup_started = False
-        cleanup_mgr._cleanup_completed = False
-        cleanup_mgr.tasks = {}  # Dict, not list
+        self.cleanup_manager.reset()
         
         # Ensure sandbox temp directory exists
         sandbox = get_sandbox()
@@ -182,10 +194,11 @@ class TestRealAudioWorkflow(unittest.TestCase):
             self.skipTest("Model loading failed")
         
         # Copy long audio file
-        shutil.copy(self.long_audio_file, self.controller.audio_path)
+        long_audio_file = self._long_audio_file()
+        shutil.copy(long_audio_file, self.controller.audio_path)
         
         # Load audio data
-        with wave.open(self.long_audio_file, 'rb') as wf:
+        with wave.open(long_audio_file, 'rb') as wf:
             audio_bytes = wf.readframes(wf.getnframes())
         
         self.controller.recording_frames = [audio_bytes[i:i+4096] for i in range(0, len(audio_bytes), 4096)]
@@ -240,6 +253,11 @@ class TestRealAudioWorkflow(unittest.TestCase):
 class TestAutoPasteIntegration(unittest.TestCase):
     """Tests for auto-paste functionality"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Look up the global cleanup manager once for the class"""
+        cls.cleanup_manager = get_cleanup_manager()
+    
     def setUp(self):
         """Set up for each test"""
         self.app = QApplication.instance()
@@ -247,10 +265,7 @@ class TestAutoPasteIntegration(unittest.TestCase):
             self.app = QApplication([])
         
         # Reset cleanup manager state for clean test environment
-        cleanup_mgr = get_cleanup_manager()
-        cleanup_mgr._cleanup_started = False
-        cleanup_mgr._cleanup_completed = False
-        cleanup_mgr.tasks = {}  # Dict, not list
+        self.cleanup_manager.reset()
         
         # Ensure sandbox temp directory exists
         sandbox = get_sandbox()
@@ -291,11 +306,13 @@ class TestAutoPasteIntegration(unittest.TestCase):
         """Test that auto-paste actually calls pyautogui.write()"""
         # Set up transcript
         test_text = "Test transcription text"
-        self.controller.transcript_log = [{'text': test_text, 'timestamp': time.time()}]
+        self.controller.transcript_log.appendleft({'text': test_text, 'timestamp': time.time()})
         
         # Simulate having model loaded
         self.controller.model = Mock()
         self.controller.model_loaded = True
+        # Exercise the keystroke fallback rather than the clipboard paste
+        self.controller._clipboard_paste_available = False
         
         # Create a fake audio file
         sandbox = get_sandbox()
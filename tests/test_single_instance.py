@@ -27,6 +27,9 @@ from PyQt5.QtCore import QSharedMemory, QSystemSemaphore
 
 from core.single_instance_manager import SingleInstanceManager, QT_AVAILABLE
 
+# Keys every get_status() report must carry
+_STATUS_KEYS = frozenset({"lock_acquired", "lock_file_path", "pid", "timeout_seconds", "qt_available"})
+
 
 class TestSingleInstanceManager:
     """Test suite for SingleInstanceManager."""
@@ -46,6 +49,11 @@ class TestSingleInstanceManager:
         except:
             pass
     
+    def assert_status_shape(self, status):
+        """Assert a get_status() report has every expected key and our PID."""
+        assert _STATUS_KEYS.issubset(status), f"missing keys: {sorted(_STATUS_KEYS - status.keys())}"
+        assert status["pid"] == os.getpid()
+    
     def test_initialization(self):
         """Test that SingleInstanceManager initializes correctly."""
         assert self.manager.app_name == self.test_app_name
@@ -148,12 +156,7 @@ class TestSingleInstanceManager:
         """Test status reporting."""
         status = self.manager.get_status()
         
-        assert "lock_acquired" in status
-        assert "lock_file_path" in status
-        assert "pid" in status
-        assert "timeout_seconds" in status
-        assert "qt_available" in status
-        assert status["pid"] == os.getpid()
+        self.assert_status_shape(status)
     
     def test_fallback_to_file_lock(self):
         """Test fallback to file lock when Qt is not available."""
@@ -166,6 +169,21 @@ class TestSingleInstanceManager:
             assert success == True
             assert manager.lock_acquired == True
     
+    def test_use_qt_false_skips_shared_memory(self):
+        """Test use_qt=False takes the file lock without touching Qt primitives."""
+        manager = SingleInstanceManager(app_name=self.test_app_name, use_qt=False)
+        try:
+            with patch.object(manager, '_try_acquire_qt_lock') as qt_lock:
+                success, message = manager.try_acquire_lock()
+            
+            qt_lock.assert_not_called()
+            assert success == True
+            assert manager.lock_acquired == True
+            assert manager.shared_memory is None
+            assert manager.lock_file_path.exists()
+        finally:
+            manager.release_lock()
+    
     @pytest.mark.skipif(sys.platform == "win32", reason="Signal handlers not supported on Windows")
     def test_signal_handler_registration(self):
         """Test that signal handlers are registered."""
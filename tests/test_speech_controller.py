@@ -30,6 +30,7 @@ if 'whisper' not in sys.modules:
     sys.modules['whisper'] = whisper_stub
 
 from speech_controller import SpeechController
+from core.hotkey_manager import HotkeyMode
 from core.path_validation import get_sandbox
 
 
@@ -65,12 +66,12 @@ class TestSpeechController(unittest.TestCase):
         self.mock_sounddevice = patch('core.audio_manager.sd')
         self.mock_pynput = patch('core.hotkey_manager.keyboard')
         self.mock_transcription_service = patch('speech_controller.TranscriptionService')
-        self.mock_faster_whisper = patch('faster_whisper.WhisperModel')
+        self.mock_openai_model_cache = patch.dict('speech_controller._openai_model_cache', clear=True)
         
+        self.mock_openai_model_cache.start()
         self.mock_sd = self.mock_sounddevice.start()
         self.mock_keyboard = self.mock_pynput.start()
         self.mock_service_class = self.mock_transcription_service.start()
-        self.mock_whisper = self.mock_faster_whisper.start()
         
         # Configure sounddevice mock
         self.mock_sd.query_devices.return_value = [
@@ -85,10 +86,6 @@ class TestSpeechController(unittest.TestCase):
         mock_listener = Mock()
         self.mock_keyboard.Listener.return_value = mock_listener
         
-        # Configure faster_whisper mock (only used for openai/fallback path)
-        mock_model = create_mock_faster_whisper_model()
-        self.mock_whisper.return_value = mock_model
-        
         # Create the controller with mocked dependencies
         self.controller = SpeechController(
             hotkey="alt gr",
@@ -104,7 +101,7 @@ class TestSpeechController(unittest.TestCase):
         self.mock_sounddevice.stop()
         self.mock_pynput.stop()
         self.mock_transcription_service.stop()
-        self.mock_faster_whisper.stop()
+        self.mock_openai_model_cache.stop()
         
         # Clean up controller resources
         if hasattr(self, 'controller'):
@@ -158,6 +155,26 @@ class TestSpeechController(unittest.TestCase):
             # Should be either loading or loaded (both are valid states)
             self.assertTrue(self.controller.model_loading or self.controller.model_loaded)
     
+    def test_preload_flag_starts_loading_at_construction(self):
+        """Test preload=True kicks off a background load from __init__"""
+        with patch.object(SpeechController, 'preload_model') as mock_preload:
+            SpeechController(hotkey="alt gr", model_size="tiny", preload=True)
+            mock_preload.assert_called_once()
+
+            mock_preload.reset_mock()
+            SpeechController(hotkey="alt gr", model_size="tiny")
+            mock_preload.assert_not_called()
+
+    def test_preload_model_uses_shared_load_thread(self):
+        """Test preloading runs on the controller's reusable load executor"""
+        self.controller._load_pool = Mock()
+
+        self.assertTrue(self.controller.preload_model())
+
+        self.controller._load_pool.submit.assert_called_once_with(
+            self.controller._background_load_model
+        )
+
     def test_preload_model_already_loaded(self):
         """Test preload_model when model is already loaded"""
         # Manually set model as loaded
@@ -220,6 +237,22 @@ class TestSpeechController(unittest.TestCase):
                 self.assertFalse(self.controller.model_loading)
                 self.assertIsNotNone(self.controller.model_load_error)
     
+    def test_broken_faster_whisper_install_falls_back_to_openai(self):
+        """Test a faster-whisper that is installed but fails to import still falls back"""
+        self.controller.engine = "faster"
+        fallback_model = Mock()
+        with patch('speech_controller.TranscriptionService') as mock_service_class, \
+             patch('speech_controller._load_openai_model', return_value=fallback_model):
+            # The spec check passes, but the worker's import fails during the handshake
+            mock_service_class.available.return_value = True
+            mock_service_class.return_value.start.return_value = False
+            
+            self.assertTrue(self.controller._ensure_model_loaded())
+        
+        self.assertEqual(self.controller.engine, "openai")
+        self.assertIs(self.controller.model, fallback_model)
+        self.assertIsNone(self.controller.transcription_service)
+    
     def test_ensure_model_loaded_already_loaded(self):
         """Test _ensure_model_loaded when model is already loaded"""
         # Manually set model as loaded
@@ -286,6 +319,18 @@ class TestSpeechController(unittest.TestCase):
         
         self.assertFalse(self.controller.is_model_ready())
     
+    def test_ensure_initialized_reflects_audio_and_model_state(self):
+        """Test readiness fails without audio capture or after a model load error"""
+        with patch.object(self.controller.audio_manager, 'is_available', return_value=True):
+            self.assertTrue(self.controller._ensure_initialized())
+            
+            self.controller.model_load_error = "Test error"
+            self.assertFalse(self.controller._ensure_initialized())
+        
+        self.controller.model_load_error = None
+        with patch.object(self.controller.audio_manager, 'is_available', return_value=False):
+            self.assertFalse(self.controller._ensure_initialized())
+    
     def test_status_callback_setting(self):
         """Test setting status callback"""
         callback = Mock()
@@ -301,6 +346,34 @@ class TestSpeechController(unittest.TestCase):
         self.controller._update_status("Test status")
         
         callback.assert_called_once_with("Test status")
+
+    def test_repeated_status_is_not_renotified(self):
+        """Test identical consecutive statuses only reach the UI once"""
+        callback = Mock()
+        self.controller.set_status_callback(callback)
+
+        with patch('speech_controller.STATUS_COALESCE_SECONDS', 0.0):
+            self.controller._update_status("Idle")
+            self.controller._update_status("Idle")
+            self.controller._update_status("Recording...")
+            self.controller._update_status("Idle")
+
+        self.assertEqual([c.args[0] for c in callback.call_args_list],
+                         ["Idle", "Recording...", "Idle"])
+
+    def test_status_bursts_are_coalesced_to_latest(self):
+        """Test rapid status updates send the first at once and then only the latest"""
+        callback = Mock()
+        self.controller.set_status_callback(callback)
+
+        self.controller._update_status("Processing...")
+        self.controller._update_status("No speech detected")
+        self.controller._update_status("Transcribing")
+        self.assertEqual([c.args[0] for c in callback.call_args_list], ["Processing..."])
+
+        time.sleep(0.2)
+        self.assertEqual([c.args[0] for c in callback.call_args_list],
+                         ["Processing...", "Transcribing"])
     
     def test_transcript_callback_setting(self):
         """Test setting transcript callback"""
@@ -367,6 +440,400 @@ class TestSpeechController(unittest.TestCase):
             if os.path.exists(audio_path):
                 os.unlink(audio_path)
 
+    def test_transcript_timestamp_is_reused_within_a_minute(self):
+        """Test the transcript timestamp is formatted once per minute."""
+        from datetime import datetime as real_datetime
+        with patch('speech_controller.datetime') as mock_datetime:
+            mock_datetime.now.return_value = real_datetime(2024, 3, 7, 9, 5, 1)
+            first = self.controller._transcript_timestamp()
+            mock_datetime.now.return_value = real_datetime(2024, 3, 7, 9, 5, 59)
+            second = self.controller._transcript_timestamp()
+            mock_datetime.now.return_value = real_datetime(2024, 3, 7, 9, 6, 0)
+            third = self.controller._transcript_timestamp()
+
+        self.assertEqual(first, "03/07 09:05")
+        self.assertIs(second, first)
+        self.assertEqual(third, "03/07 09:06")
+
+    def test_transcript_history_is_bounded_newest_first(self):
+        """Test transcript history keeps only the newest entries, newest first."""
+        maxlen = self.controller.transcript_log.maxlen
+        for i in range(maxlen + 5):
+            self.controller.transcript_log.appendleft({"timestamp": "", "text": str(i)})
+
+        transcripts = self.controller.get_transcripts()
+        self.assertIsInstance(transcripts, tuple)
+        self.assertEqual(len(transcripts), maxlen)
+        self.assertEqual(transcripts[0]["text"], str(maxlen + 4))
+
+    def test_get_transcripts_reuses_snapshot_until_history_changes(self):
+        """Test repeated reads share one snapshot and a new entry refreshes it."""
+        self.controller.transcript_log.appendleft({"timestamp": "", "text": "first"})
+        first = self.controller.get_transcripts()
+        self.assertIs(self.controller.get_transcripts(), first)
+
+        self.controller.transcript_log.appendleft({"timestamp": "", "text": "second"})
+        second = self.controller.get_transcripts()
+        self.assertIsNot(second, first)
+        self.assertEqual([t["text"] for t in second], ["second", "first"])
+
+    def test_stop_recording_submits_frames_to_transcription_worker(self):
+        """Test stop_recording hands frames to the worker without blocking."""
+        self.controller.listening = True
+        self.controller.audio_manager.stop_recording = Mock(return_value=[b"frame"])
+        self.controller._transcribe_pool = Mock()
+
+        self.controller.stop_recording()
+
+        self.controller._transcribe_pool.submit.assert_called_once_with(
+            self.controller._process_pending_recordings
+        )
+        self.assertEqual(list(self.controller._pending_recordings), [[b"frame"]])
+        self.assertEqual(self.controller.recording_frames, [])
+
+    def test_failed_recording_start_resets_recording_state(self):
+        """Test the UI is told recording stopped when the audio stream fails to open."""
+        states = []
+        self.controller.set_recording_state_callback(states.append)
+        self.controller.audio_manager.start_recording = Mock(return_value=False)
+
+        with patch.object(self.controller.platform_features, 'is_feature_available', return_value=True):
+            self.controller.start_recording()
+        self.controller._notify_pool.submit(lambda: None).result(timeout=5)
+
+        self.assertEqual(states, [True, False])
+        self.assertFalse(self.controller.listening)
+
+    def test_worker_threads_never_block_interpreter_exit(self):
+        """Test background work runs on daemon threads and late submits don't raise."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_load():
+            started.set()
+            release.wait(5)
+
+        self.controller._load_pool.submit(slow_load)
+        self.assertTrue(started.wait(5))
+        queued = self.controller._load_pool.submit(lambda: None)
+        loader = next(t for t in threading.enumerate() if t.name == "whiz-load")
+        self.assertTrue(loader.daemon)
+
+        self.controller._load_pool.shutdown(wait=False, cancel_futures=True)
+        self.assertTrue(queued.cancelled())
+        # e.g. a hotkey press racing with shutdown
+        self.assertTrue(self.controller._load_pool.submit(lambda: None).cancelled())
+        release.set()
+
+    def test_recording_state_callback_failure_is_isolated(self):
+        """Test a failing state callback neither reaches the caller nor stops later notifications."""
+        states = []
+
+        def flaky_callback(is_recording):
+            states.append(is_recording)
+            if is_recording:
+                raise RuntimeError("ui went away")
+
+        self.controller.set_recording_state_callback(flaky_callback)
+        self.controller._notify_recording_state(True)
+        self.controller._notify_recording_state(False)
+        self.controller._notify_pool.submit(lambda: None).result(timeout=5)
+
+        self.assertEqual(states, [True, False])
+
+    def test_backlogged_recordings_share_one_transcription(self):
+        """Test recordings queued behind a busy worker are transcribed together."""
+        self.controller.process_recorded_audio = Mock()
+        first = np.full(100, 0.1, dtype=np.float32).tobytes()
+        second = np.full(50, 0.2, dtype=np.float32).tobytes()
+        self.controller._pending_recordings.extend([[first], [second]])
+
+        self.controller._process_pending_recordings()
+        self.controller._process_pending_recordings()  # Later task finds nothing left
+
+        self.controller.process_recorded_audio.assert_called_once()
+        frames = self.controller.process_recorded_audio.call_args[0][0]
+        self.assertEqual(frames[0], first)
+        self.assertEqual(frames[-1], second)
+        gap = np.frombuffer(frames[1], dtype=np.float32)
+        self.assertTrue(np.all(gap == 0))
+
+    def test_silent_backlogged_recordings_are_left_out_of_merge(self):
+        """Test silent taps in the backlog don't lengthen the merged transcription."""
+        self.controller.process_recorded_audio = Mock()
+        speech = np.full(100, 0.1, dtype=np.float32).tobytes()
+        silence = np.zeros(100, dtype=np.float32).tobytes()
+        self.controller._pending_recordings.extend([[silence], [speech], [silence]])
+
+        self.controller._process_pending_recordings()
+
+        self.controller.process_recorded_audio.assert_called_once_with([speech])
+
+    def test_pyautogui_is_imported_on_first_use(self):
+        """Test pyautogui is only imported when needed, with the fail-safe disabled."""
+        import speech_controller
+        fake_pyautogui = types.ModuleType('pyautogui')
+        fake_pyautogui.FAILSAFE = True
+
+        with patch.object(speech_controller, 'pyautogui', None), \
+             patch.dict(sys.modules, {'pyautogui': fake_pyautogui}):
+            self.assertIs(speech_controller._get_pyautogui(), fake_pyautogui)
+            self.assertIs(speech_controller.pyautogui, fake_pyautogui)
+            self.assertFalse(fake_pyautogui.FAILSAFE)
+
+    def test_paste_text_uses_clipboard_shortcut(self):
+        """Test auto-paste sends one paste shortcut instead of typing the text."""
+        self.controller._clipboard_paste_available = True
+        mock_pyperclip = Mock()
+        mock_pyperclip.paste.return_value = "previous"
+
+        with patch.dict(sys.modules, {'pyperclip': mock_pyperclip}), \
+             patch('speech_controller.pyautogui') as mock_pyautogui, \
+             patch('speech_controller.time.sleep'):
+            self.controller._paste_text("hello ")
+            # The restore runs on its own worker, never on the transcription one
+            self.controller._clipboard_pool.submit(lambda: None).result(timeout=5)
+
+        mock_pyautogui.hotkey.assert_called_once()
+        mock_pyautogui.write.assert_not_called()
+        self.assertEqual([c.args for c in mock_pyperclip.copy.call_args_list],
+                         [("hello ",), ("previous",)])
+
+    def test_paste_text_falls_back_to_typing(self):
+        """Test auto-paste types the text once clipboard paste has failed."""
+        self.controller._clipboard_paste_available = True
+        mock_pyperclip = Mock()
+        mock_pyperclip.copy.side_effect = RuntimeError("no clipboard")
+
+        with patch.dict(sys.modules, {'pyperclip': mock_pyperclip}), \
+             patch('speech_controller.pyautogui') as mock_pyautogui:
+            self.controller._paste_text("hello ")
+
+        mock_pyautogui.write.assert_called_once_with("hello ")
+        self.assertFalse(self.controller._clipboard_paste_available)
+
+    def test_paste_text_survives_unreadable_clipboard(self):
+        """Test non-text clipboard content doesn't disable clipboard paste."""
+        self.controller._clipboard_paste_available = True
+        mock_pyperclip = Mock()
+        mock_pyperclip.paste.side_effect = RuntimeError("clipboard holds an image")
+
+        with patch.dict(sys.modules, {'pyperclip': mock_pyperclip}), \
+             patch('speech_controller.pyautogui') as mock_pyautogui, \
+             patch('speech_controller.time.sleep'):
+            self.controller._paste_text("hello ")
+            self.controller._clipboard_pool.submit(lambda: None).result(timeout=5)
+
+        # Nothing was saved, so the restore leaves our text in place
+        mock_pyperclip.copy.assert_called_once_with("hello ")
+        mock_pyautogui.hotkey.assert_called_once()
+        mock_pyautogui.write.assert_not_called()
+        self.assertTrue(self.controller._clipboard_paste_available)
+
+    def test_paste_burst_restores_original_clipboard_once(self):
+        """Test back-to-back pastes save the user's clipboard once and restore it once."""
+        self.controller._clipboard_paste_available = True
+        self.controller._clipboard_pool = Mock()
+        mock_pyperclip = Mock()
+        mock_pyperclip.paste.return_value = "original"
+
+        with patch.dict(sys.modules, {'pyperclip': mock_pyperclip}), \
+             patch('speech_controller.pyautogui'), \
+             patch('speech_controller.time.sleep'):
+            self.controller._paste_text("first ")
+            self.controller._paste_text("second ")
+            # Run the queued restores in order, as the clipboard worker would
+            for call in self.controller._clipboard_pool.submit.call_args_list:
+                call.args[0](*call.args[1:])
+
+        mock_pyperclip.paste.assert_called_once()
+        self.assertEqual([c.args for c in mock_pyperclip.copy.call_args_list],
+                         [("first ",), ("second ",), ("original",)])
+
+    def test_language_and_temperature_changes_keep_loaded_worker(self):
+        """Test decode-option changes never restart the transcription worker."""
+        service = Mock()
+        self.controller.transcription_service = service
+        self.controller.model_loaded = True
+
+        self.controller.set_language("de")
+        self.controller.set_temperature(0.4)
+
+        service.stop.assert_not_called()
+        self.assertIs(self.controller.transcription_service, service)
+        self.assertTrue(self.controller.model_loaded)
+        self.assertEqual(self.controller.language, "de")
+        self.assertEqual(self.controller.temperature, 0.4)
+
+    def test_unchanged_toggle_mode_does_not_reregister_hotkeys(self):
+        """Test re-applying the current toggle mode leaves hotkeys alone."""
+        with patch.object(self.controller, 'register_hotkeys') as mock_register, \
+             patch.object(self.controller.hotkey_manager, 'is_available', return_value=True), \
+             patch.object(self.controller.hotkey_manager, 'set_mode') as mock_set_mode:
+            self.controller.set_toggle_mode(self.controller.toggle_mode)
+            mock_register.assert_not_called()
+            mock_set_mode.assert_not_called()
+
+            self.controller.hotkey_manager.is_listening = False
+            self.controller.set_toggle_mode(not self.controller.toggle_mode)
+            mock_register.assert_called_once()
+
+    def test_toggle_mode_change_keeps_running_listener(self):
+        """Test switching modes does not restart an active hotkey listener."""
+        with patch.object(self.controller, 'register_hotkeys') as mock_register, \
+             patch.object(self.controller.hotkey_manager, 'is_available', return_value=True):
+            self.controller.hotkey_manager.is_listening = True
+            self.controller.set_toggle_mode(not self.controller.toggle_mode)
+
+        mock_register.assert_not_called()
+        expected = HotkeyMode.TOGGLE if self.controller.toggle_mode else HotkeyMode.HOLD
+        self.assertEqual(self.controller.hotkey_manager.mode, expected)
+
+    def test_set_model_keeps_one_openai_model_resident(self):
+        """Test a size switch loads on the load worker and evicts the previous model."""
+        import speech_controller
+        self.controller.engine = "openai"
+
+        with patch.dict('speech_controller._openai_model_cache', clear=True), \
+             patch('whisper.load_model') as mock_load_model:
+            mock_load_model.side_effect = lambda size, device: Mock(name=size)
+
+            self.controller.set_model("base")
+            self.controller._load_pool.submit(lambda: None).result(timeout=5)
+            base_model = self.controller.model
+            self.controller.set_model("tiny")
+            self.controller._load_pool.submit(lambda: None).result(timeout=5)
+
+            self.assertIsNot(self.controller.model, base_model)
+            self.assertEqual(len(speech_controller._openai_model_cache), 1)
+            self.assertEqual(mock_load_model.call_args_list[-1].args, ("tiny",))
+
+            self.controller._cleanup_model()
+            self.assertEqual(speech_controller._openai_model_cache, {})
+
+    def test_set_model_during_faster_load_reloads_once_load_finishes(self):
+        """Test a model size picked mid-load restarts the worker after that load completes."""
+        self.controller.engine = "faster"
+        self.controller.model_loading = True
+        self.controller.transcription_service = None
+        load_calls = []
+
+        def fake_load():
+            load_calls.append(self.controller.model_size)
+            return True
+
+        with patch.object(self.controller, '_load_model_implementation', side_effect=fake_load), \
+             patch('speech_controller._get_pyautogui'):
+            self.controller.set_model("base")
+            self.assertEqual(load_calls, [])
+
+            # The in-flight load finishes, then the restart and its load run on the load worker
+            self.controller._background_load_model()
+            for _ in range(2):
+                self.controller._load_pool.submit(lambda: None).result(timeout=5)
+
+        self.assertEqual(len(load_calls), 2)
+        self.assertTrue(self.controller.model_loaded)
+        self.assertFalse(self.controller._model_reload_pending)
+
+    def test_gpu_openai_model_is_warmed_up_once(self):
+        """Test a freshly loaded CUDA model gets exactly one warmup decode."""
+        self.controller.engine = "openai"
+        gpu_model = Mock()
+        gpu_model.device.type = "cuda"
+
+        with patch('speech_controller._load_openai_model', return_value=gpu_model):
+            self.controller.set_model("base")
+            self.controller.set_model("base")
+            self.controller._load_pool.submit(lambda: None).result(timeout=5)
+        self.controller._transcribe_pool.submit(lambda: None).result(timeout=5)
+
+        gpu_model.transcribe.assert_called_once()
+        warmup_audio = gpu_model.transcribe.call_args[0][0]
+        self.assertEqual(warmup_audio.shape, (self.controller.RATE,))
+
+    def test_faster_engine_sends_samples_without_writing_wav(self):
+        """Test the faster worker receives float32 samples and no WAV file is written."""
+        self.controller.engine = "faster"
+        self.controller.model_loaded = True
+        self.controller._ensure_model_loaded = Mock(return_value=True)
+        self.controller.save_audio_to_file = Mock(return_value=True)
+        self.controller.transcription_service = Mock()
+        self.controller.transcription_service.transcribe_array.return_value = {
+            "text": "from samples",
+            "metadata": {"engine": "faster"}
+        }
+
+        t = np.arange(self.controller.RATE) / self.controller.RATE
+        tone = (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+        self.controller.process_recorded_audio([tone.tobytes()])
+
+        self.controller.save_audio_to_file.assert_not_called()
+        self.controller.transcription_service.transcribe.assert_not_called()
+        sent = self.controller.transcription_service.transcribe_array.call_args[0][0]
+        np.testing.assert_array_equal(sent, tone)
+        self.assertEqual(self.controller.transcript_log[0]["text"], "from samples")
+
+    def test_openai_engine_transcribes_samples_without_writing_wav(self):
+        """Test openai-whisper gets the in-memory samples instead of a WAV path."""
+        self.controller.engine = "openai"
+        self.controller._ensure_model_loaded = Mock(return_value=True)
+        self.controller.save_audio_to_file = Mock(return_value=True)
+        self.controller.model = Mock()
+        self.controller.model.transcribe.return_value = {"text": "from memory"}
+
+        tone = np.full(self.controller.RATE, 0.2, dtype=np.float32)
+        self.controller.process_recorded_audio([tone.tobytes()])
+
+        self.controller.save_audio_to_file.assert_not_called()
+        sent = self.controller.model.transcribe.call_args[0][0]
+        np.testing.assert_array_equal(sent, tone)
+        self.assertEqual(self.controller.transcript_log[0]["text"], "from memory")
+
+    def test_sample_scratch_buffer_is_reused_across_recordings(self):
+        """Test back-to-back recordings share one float32 buffer instead of reallocating."""
+        first = np.full(self.controller.RATE, 0.2, dtype=np.float32)
+        second = np.full(self.controller.RATE // 2, -0.1, dtype=np.float32)
+        frames = [second[:1000].tobytes(), second[1000:].tobytes()]
+
+        samples = self.controller._frames_to_samples([first.tobytes()], first.nbytes)
+        scratch = self.controller._audio_scratch
+        samples = self.controller._frames_to_samples(frames, second.nbytes)
+
+        self.assertIs(self.controller._audio_scratch, scratch)
+        np.testing.assert_array_equal(samples, second)
+        self.assertIsNone(self.controller._frames_to_samples([b"odd"], 3))
+
+    def test_auto_paste_happens_before_transcript_notification(self):
+        """Test the paste is not delayed behind the UI transcript notification."""
+        events = []
+        self.controller.engine = "faster"
+        self.controller._ensure_model_loaded = Mock(return_value=True)
+        self.controller.transcription_service = Mock()
+        self.controller.transcription_service.transcribe_array.return_value = {"text": "hello"}
+        self.controller._paste_text = Mock(side_effect=lambda text: events.append("paste"))
+        self.controller.set_transcript_callback(lambda: events.append("notify"))
+
+        tone = np.full(self.controller.RATE, 0.2, dtype=np.float32)
+        self.controller.process_recorded_audio([tone.tobytes()])
+
+        self.assertEqual(events, ["paste", "notify"])
+
+    def test_silent_or_short_recording_skips_transcription(self):
+        """Test silent and too-short recordings never reach the transcription engine."""
+        self.controller.save_audio_to_file = Mock(return_value=True)
+        self.controller._ensure_model_loaded = Mock(return_value=True)
+
+        silence = np.zeros(self.controller.RATE * 2, dtype=np.float32).tobytes()
+        blip = np.full(self.controller.RATE // 10, 0.5, dtype=np.float32).tobytes()
+
+        for frames in ([silence], [blip]):
+            self.controller.process_recorded_audio(frames)
+
+        self.controller.save_audio_to_file.assert_not_called()
+        self.controller._ensure_model_loaded.assert_not_called()
+        self.assertEqual(len(self.controller.transcript_log), 0)
+
     def test_cleanup_model_stops_transcription_service(self):
         """Test model cleanup also stops transcription worker service."""
         mock_service = Mock()
@@ -379,6 +846,21 @@ class TestSpeechController(unittest.TestCase):
         self.assertIsNone(self.controller.transcription_service)
         self.assertTrue(self.controller._verify_model_cleanup())
 
+    def test_cleanup_handlers_tolerate_failed_construction(self):
+        """Test cleanup handlers run safely when __init__ raised before setting up managers."""
+        partial = SpeechController.__new__(SpeechController)
+        with patch('speech_controller.get_performance_monitor', side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                partial.__init__(hotkey="alt gr", model_size="tiny")
+
+        self.assertTrue(partial._cleanup_resource_manager("audio_manager"))
+        self.assertTrue(partial._verify_resource_manager_idle("audio_manager", "is_recording"))
+        self.assertTrue(partial._cleanup_resource_manager("hotkey_manager"))
+        self.assertTrue(partial._verify_resource_manager_idle("hotkey_manager", "is_listening"))
+        self.assertTrue(partial._cleanup_files())
+        self.assertTrue(partial._verify_file_cleanup())
+        partial._on_audio_level(0.5)
+
 
 class TestSpeechControllerIntegration(unittest.TestCase):
     """Integration tests for SpeechController with mocked dependencies"""
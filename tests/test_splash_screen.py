@@ -21,6 +21,7 @@ Last Updated: October 10, 2025
 
 import unittest
 import sys
+import threading
 import time
 from unittest.mock import Mock, patch, MagicMock
 from PyQt5.QtWidgets import QApplication
@@ -28,7 +29,7 @@ from PyQt5.QtCore import QTimer
 
 # Import the modules to test
 try:
-    from splash_screen import SplashScreen, InitializationWorker
+    from splash_screen import SplashScreen, InitializationWorker, InitResult
     SPLASH_AVAILABLE = True
 except ImportError:
     SPLASH_AVAILABLE = False
@@ -105,10 +106,12 @@ class TestSplashScreen(unittest.TestCase):
         # Check status label updated
         self.assertEqual(self.splash.status_label.text(), "Testing progress")
         
-        # Check log text updated
+        # Check log text updated once the batch is flushed by the final tick
+        self.splash.update_progress(100, "Ready!")
         log_content = self.splash.log_text.toPlainText()
         self.assertIn("Testing progress", log_content)
         self.assertIn("50%", log_content)
+        self.assertIn("[100%] Ready!", log_content)
 
 
 @unittest.skipUnless(SPLASH_AVAILABLE, "Splash screen module not available")
@@ -158,11 +161,30 @@ class TestInitializationWorker(unittest.TestCase):
         self.assertTrue(hasattr(self.worker, 'initialization_complete'))
         self.assertTrue(hasattr(self.worker, 'initialization_failed'))
         
-    @patch('splash_screen.SettingsManager')
+    def test_worker_sends_back_to_back_progress_ticks(self):
+        """Test ticks emitted in quick succession all arrive, so no step label is skipped"""
+        self.worker = InitializationWorker()
+        
+        progress_calls = []
+        self.worker.progress_updated.connect(
+            lambda progress, message: progress_calls.append((progress, message))
+        )
+        
+        self.worker._emit_progress(45, "Initializing hotkey manager...")
+        self.worker._emit_progress(50, "Preparing speech controller...")
+        self.worker._emit_progress(100, "Ready!")
+        
+        self.assertEqual(progress_calls, [
+            (45, "Initializing hotkey manager..."),
+            (50, "Preparing speech controller..."),
+            (100, "Ready!"),
+        ])
+        
+    @patch('core.settings_manager.SettingsManager')
     @patch('core.platform_features.PlatformFeatures')
     @patch('core.audio_manager.AudioManager')
     @patch('core.hotkey_manager.HotkeyManager')
-    @patch('splash_screen.SpeechController')
+    @patch('speech_controller.SpeechController')
     def test_worker_initialization_success(self, mock_controller, mock_hotkey, 
                                         mock_audio, mock_features, mock_settings):
         """Test worker initialization succeeds with mocked dependencies"""
@@ -181,8 +203,8 @@ class TestInitializationWorker(unittest.TestCase):
         def mock_progress(progress, message):
             progress_calls.append((progress, message))
             
-        def mock_complete(controller, settings):
-            complete_calls.append((controller, settings))
+        def mock_complete(result):
+            complete_calls.append(result)
             
         self.worker.progress_updated.connect(mock_progress)
         self.worker.initialization_complete.connect(mock_complete)
@@ -195,6 +217,53 @@ class TestInitializationWorker(unittest.TestCase):
         
         # Check completion was signaled
         self.assertEqual(len(complete_calls), 1)
+        self.assertIsInstance(complete_calls[0], InitResult)
+        
+    @patch('core.settings_manager.SettingsManager')
+    @patch('core.platform_features.PlatformFeatures')
+    @patch('core.audio_manager.AudioManager')
+    @patch('core.hotkey_manager.HotkeyManager')
+    @patch('speech_controller.SpeechController')
+    def test_worker_probes_portaudio_on_one_thread(self, mock_controller, mock_hotkey,
+                                                   mock_audio, mock_features, mock_settings):
+        """Test platform detection and the audio manager never query PortAudio concurrently"""
+        mock_settings.return_value.load_all.return_value = {}
+        calls = []
+        
+        def detect_features():
+            time.sleep(0.05)
+            calls.append(("features", threading.current_thread().name))
+            return {}
+        
+        def make_audio_manager(**kwargs):
+            calls.append(("audio", threading.current_thread().name))
+            return Mock()
+        
+        mock_features.return_value.detect_all_features.side_effect = detect_features
+        mock_audio.side_effect = make_audio_manager
+        
+        self.worker = InitializationWorker()
+        self.worker.run()
+        
+        self.assertEqual([name for name, _ in calls], ["features", "audio"])
+        self.assertEqual(calls[0][1], calls[1][1])
+        
+    @patch('core.settings_manager.SettingsManager')
+    def test_worker_stops_when_interruption_requested(self, mock_settings):
+        """Test worker returns at the next step boundary once cancelled"""
+        self.worker = InitializationWorker()
+        
+        complete_calls = []
+        failure_calls = []
+        self.worker.initialization_complete.connect(complete_calls.append)
+        self.worker.initialization_failed.connect(failure_calls.append)
+        
+        with patch.object(self.worker, 'isInterruptionRequested', return_value=True):
+            self.worker.run()
+        
+        mock_settings.assert_not_called()
+        self.assertEqual(complete_calls, [])
+        self.assertEqual(failure_calls, [])
         
     def test_worker_initialization_failure(self):
         """Test worker handles initialization failures"""
@@ -209,7 +278,7 @@ class TestInitializationWorker(unittest.TestCase):
         self.worker.initialization_failed.connect(mock_failure)
         
         # Mock a failure by patching SettingsManager to raise exception
-        with patch('splash_screen.SettingsManager', side_effect=Exception("Test error")):
+        with patch('core.settings_manager.SettingsManager', side_effect=Exception("Test error")):
             self.worker.run()
             
         # Check failure was signaled
@@ -235,7 +304,7 @@ class TestSplashScreenIntegration(unittest.TestCase):
             self.splash = None
             
     @patch('speech_ui.SpeechApp')  # SpeechApp is in speech_ui.py, not splash_screen.py
-    @patch('splash_screen.SettingsManager')
+    @patch('core.settings_manager.SettingsManager')
     @patch('core.platform_features.PlatformFeatures')
     @patch('core.audio_manager.AudioManager')
     @patch('core.hotkey_manager.HotkeyManager')
@@ -259,7 +328,9 @@ class TestSplashScreenIntegration(unittest.TestCase):
         # Mock QTimer to avoid actual delay
         with patch('splash_screen.QTimer') as mock_timer:
             # Simulate initialization completion
-            self.splash.on_initialization_complete(mock_controller_instance, mock_settings_instance)
+            self.splash.on_initialization_complete(
+                InitResult(mock_controller_instance, mock_settings_instance)
+            )
             
             # Check that QTimer.singleShot was called to schedule fade out
             mock_timer.singleShot.assert_called_once()
@@ -150,6 +150,24 @@ class TestTranscriptsTab(unittest.TestCase):
         # (Exact count verification depends on implementation details)
         self.assertIsNotNone(self.transcripts_tab.transcript_layout)
     
+    def test_refresh_only_adds_new_transcripts(self):
+        """Test a new transcript is prepended and evicted entries are removed"""
+        first = {'timestamp': '01/01 12:00', 'text': 'First'}
+        second = {'timestamp': '01/01 12:01', 'text': 'Second'}
+        third = {'timestamp': '01/01 12:02', 'text': 'Third'}
+        layout = self.transcripts_tab.transcript_layout
+
+        self.parent_app.controller.get_transcripts.return_value = [second, first]
+        self.transcripts_tab.refresh_transcript_log()
+        second_widget = layout.itemAt(0).widget()
+
+        # Newest first; the oldest entry fell off the bounded history
+        self.parent_app.controller.get_transcripts.return_value = [third, second]
+        self.transcripts_tab.refresh_transcript_log()
+
+        self.assertEqual(layout.count(), 3)  # two entries plus the stretch
+        self.assertIs(layout.itemAt(1).widget(), second_widget)
+
     def test_scroll_area_configuration(self):
         """Test that scroll area is properly configured"""
         scroll_area = self.transcripts_tab.transcript_scroll_area
@@ -287,7 +305,9 @@ class TestTranscriptsTabIntegration(unittest.TestCase):
         transcripts_tab = TranscriptsTab(parent_app)
         
         # Should have attempted to connect the signal
-        parent_app.transcript_updated.connect.assert_called_once_with(transcripts_tab.refresh_transcript_log)
+        parent_app.transcript_updated.connect.assert_called_once_with(
+            transcripts_tab.refresh_transcript_log, Qt.QueuedConnection
+        )
         
         # Clean up
         transcripts_tab.close()
@@ -28,7 +28,8 @@ class TestVisualIndicatorWidget(unittest.TestCase):
             self.app = QApplication([])
         
         # Create temporary settings for testing
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp_dir.name
         self.settings_file = os.path.join(self.temp_dir, "visual_test_settings.ini")
         self.settings_manager = SettingsManager("VisualTest", "TestApp")
         self.settings_manager.settings = Mock()
@@ -36,13 +37,7 @@ class TestVisualIndicatorWidget(unittest.TestCase):
     def tearDown(self):
         """Clean up test environment."""
         try:
-            if os.path.exists(self.settings_file):
-                os.unlink(self.settings_file)
-            for file in os.listdir(self.temp_dir):
-                file_path = os.path.join(self.temp_dir, file)
-                if os.path.isfile(file_path):
-                    os.unlink(file_path)
-            os.rmdir(self.temp_dir)
+            self._temp_dir.cleanup()
         except OSError:
             pass
     
@@ -212,16 +207,13 @@ class TestVisualIndicatorIntegration(unittest.TestCase):
         if self.app is None:
             self.app = QApplication([])
         
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp_dir.name
     
     def tearDown(self):
         """Clean up integration test environment."""
         try:
-            for file in os.listdir(self.temp_dir):
-                file_path = os.path.join(self.temp_dir, file)
-                if os.path.isfile(file_path):
-                    os.unlink(file_path)
-            os.rmdir(self.temp_dir)
+            self._temp_dir.cleanup()
         except OSError:
             pass
     
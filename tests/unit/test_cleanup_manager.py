@@ -0,0 +1,65 @@
+import threading
+import time
+
+from core.cleanup_manager import CleanupManager, CleanupPhase, CleanupStatus
+
+
+def test_independent_phases_clean_up_concurrently():
+    manager = CleanupManager(global_timeout=10.0)
+    barrier = threading.Barrier(3, timeout=2.0)
+
+    def meet_others():
+        barrier.wait()
+        return True
+
+    manager.register_simple_task("audio", CleanupPhase.AUDIO_RESOURCES, meet_others)
+    manager.register_simple_task("hotkey", CleanupPhase.HOTKEY_RESOURCES, meet_others)
+    manager.register_simple_task("model", CleanupPhase.MODEL_RESOURCES, meet_others)
+
+    results = manager.cleanup_all()
+
+    assert all(r.status == CleanupStatus.COMPLETED for r in results.values())
+
+
+def test_file_cleanup_waits_for_model_teardown():
+    manager = CleanupManager(global_timeout=10.0)
+    order = []
+
+    def slow_model():
+        time.sleep(0.1)
+        order.append("model")
+        return True
+
+    def files():
+        order.append("files")
+        return True
+
+    manager.register_simple_task("files", CleanupPhase.FILE_RESOURCES, files)
+    manager.register_simple_task("model", CleanupPhase.MODEL_RESOURCES, slow_model)
+
+    manager.cleanup_all()
+
+    assert order == ["model", "files"]
+
+
+def test_summary_is_cached_after_cleanup_and_dropped_on_register():
+    manager = CleanupManager(global_timeout=10.0)
+    manager.register_simple_task("audio", CleanupPhase.AUDIO_RESOURCES, lambda: True)
+    manager.register_simple_task("files", CleanupPhase.FILE_RESOURCES, lambda: False)
+
+    assert manager.get_cleanup_summary()['completed_tasks'] == 0
+
+    manager.cleanup_all()
+    summary = manager.get_cleanup_summary()
+
+    assert summary['completed_tasks'] == 1
+    assert summary['failed_tasks'] == 1
+    assert summary['cleanup_completed'] is True
+    assert manager._summary_cache == summary
+
+    summary['completed_tasks'] = 99
+    assert manager.get_cleanup_summary()['completed_tasks'] == 1
+
+    manager.reset()
+    assert manager._summary_cache is None
+    assert manager.get_cleanup_summary()['total_tasks'] == 0
@@ -1,7 +1,10 @@
 import time
 from queue import Empty
+from unittest.mock import patch
 
-from core.transcription_service import TranscriptionService
+import numpy as np
+
+from core.transcription_service import TranscriptionService, _warmup_model
 
 
 def ready_and_echo_worker(request_queue, response_queue, _config):
@@ -37,10 +40,37 @@ def ready_but_no_response_worker(request_queue, response_queue, _config):
             break
 
 
+def sample_count_worker(request_queue, response_queue, _config):
+    response_queue.put({"type": "ready"})
+    while True:
+        try:
+            req = request_queue.get(timeout=0.2)
+        except Empty:
+            continue
+        if req is None:
+            break
+        response_queue.put(
+            {
+                "type": "result",
+                "request_id": req.get("request_id"),
+                "text": f"{len(req['audio'])} samples",
+                "metadata": {"has_path": req.get("audio_path") is not None},
+            }
+        )
+
+
 def error_on_start_worker(_request_queue, response_queue, _config):
     response_queue.put({"type": "error", "error": "intentional init failure"})
 
 
+def broken_install_worker(_request_queue, response_queue, _config):
+    # What the real worker reports when faster-whisper has a spec but won't import
+    try:
+        raise ImportError("libctranslate2.so: cannot open shared object file")
+    except Exception as exc:
+        response_queue.put({"type": "error", "error": f"Model init failed: {exc}"})
+
+
 def test_service_start_and_stop_with_ready_worker():
     service = TranscriptionService(
         model_name="tiny",
@@ -83,6 +113,30 @@ def test_service_transcribe_returns_result_payload():
         service.stop()
 
 
+def test_service_transcribe_array_sends_samples_without_path():
+    service = TranscriptionService(
+        model_name="tiny",
+        device="cpu",
+        compute_type="int8",
+        worker_target=sample_count_worker,
+    )
+    try:
+        assert service.start(timeout_seconds=2.0)
+        result = service.transcribe_array(
+            np.zeros(1600, dtype=np.float32),
+            language=None,
+            temperature=0.0,
+            speed_mode=True,
+            timeout_seconds=2.0,
+        )
+
+        assert result is not None
+        assert result["text"] == "1600 samples"
+        assert result["metadata"]["has_path"] is False
+    finally:
+        service.stop()
+
+
 def test_service_transcribe_timeout_returns_none():
     service = TranscriptionService(
         model_name="tiny",
@@ -119,3 +173,55 @@ def test_service_start_failure_returns_false():
     assert not service.start(timeout_seconds=2.0)
     assert not service.is_ready
     service.stop()
+
+
+def test_service_start_fails_when_installed_package_cannot_import():
+    service = TranscriptionService(
+        model_name="tiny",
+        device="cpu",
+        compute_type="int8",
+        worker_target=broken_install_worker,
+    )
+
+    assert not service.start(timeout_seconds=2.0)
+    assert not service.is_ready
+    service.stop()
+
+
+def test_service_available_reflects_faster_whisper_install():
+    with patch.object(TranscriptionService, "_faster_whisper_found", False):
+        with patch("core.transcription_service.importlib.util.find_spec", return_value=None):
+            assert not TranscriptionService.available()
+
+        with patch("core.transcription_service.importlib.util.find_spec", return_value=object()):
+            assert TranscriptionService.available()
+
+
+def test_service_available_caches_positive_probe_only():
+    with patch.object(TranscriptionService, "_faster_whisper_found", False):
+        with patch("core.transcription_service.importlib.util.find_spec", return_value=None) as find_spec:
+            assert not TranscriptionService.available()
+            assert not TranscriptionService.available()
+        assert find_spec.call_count == 2
+
+        with patch("core.transcription_service.importlib.util.find_spec", return_value=object()) as find_spec:
+            assert TranscriptionService.available()
+            assert TranscriptionService.available()
+        assert find_spec.call_count == 1
+
+
+def test_warmup_decodes_silence_and_swallows_errors():
+    decoded = []
+
+    class FakeModel:
+        def transcribe(self, audio, **_params):
+            return (decoded.append(len(audio)) for _ in range(1)), None
+
+    _warmup_model(FakeModel())
+    assert decoded == [16000]
+
+    class BrokenModel:
+        def transcribe(self, audio, **_params):
+            raise RuntimeError("no GPU")
+
+    _warmup_model(BrokenModel())
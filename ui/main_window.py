@@ -47,7 +47,10 @@ class MainWindow(QMainWindow):
         self.app_icon = IconManager.get_app_icon()
         self.setWindowIcon(self.app_icon)
         
-        # Initialize sound effects
+        # Initialize sound effects. Sources are decoded once here; play() only
+        # queues the preloaded sample for the audio backend's own thread, so the
+        # effects stay on the GUI thread (QSoundEffect is not safe to drive from
+        # a worker thread)
         self.sound_start = QSoundEffect()
         self.sound_start.setSource(QUrl.fromLocalFile("assets/sound_start_v9.wav"))
         self.sound_start.setVolume(0.385)
@@ -56,6 +59,10 @@ class MainWindow(QMainWindow):
         self.sound_end.setSource(QUrl.fromLocalFile("assets/sound_end_v9.wav"))
         self.sound_end.setVolume(0.385)
         
+        # Report tones that fail to load instead of failing silently on play
+        self.sound_start.statusChanged.connect(self._on_sound_status_changed)
+        self.sound_end.statusChanged.connect(self._on_sound_status_changed)
+        
         # Sound effects enabled by default
         self.sound_enabled = True
         
@@ -368,18 +375,7 @@ class MainWindow(QMainWindow):
             self.settings_manager.apply_all(self)
             
             # Update sound settings
-            if "audio/effects_enabled" in settings:
-                self.sound_enabled = settings["audio/effects_enabled"]
-            
-            if "audio/start_tone" in settings:
-                start_tone = settings["audio/start_tone"]
-                if os.path.exists(start_tone):
-                    self.sound_start.setSource(QUrl.fromLocalFile(start_tone))
-            
-            if "audio/stop_tone" in settings:
-                stop_tone = settings["audio/stop_tone"]
-                if os.path.exists(stop_tone):
-                    self.sound_end.setSource(QUrl.fromLocalFile(stop_tone))
+            self._apply_sound_settings(settings)
             
             # Emit signal for SpeechApp to handle other settings
             self.settings_changed.emit(settings)
@@ -387,6 +383,20 @@ class MainWindow(QMainWindow):
         except Exception as e:
             print(f"Error applying settings changes: {e}")
     
+    def _apply_sound_settings(self, settings: dict):
+        """Sync the cached sound effects and the enabled flag with changed settings"""
+        if "audio/effects_enabled" in settings:
+            self.sound_enabled = settings["audio/effects_enabled"]
+        
+        for key, effect in (("audio/start_tone", self.sound_start),
+                            ("audio/stop_tone", self.sound_end)):
+            if key not in settings:
+                continue
+            tone = settings[key]
+            # The dialog sends every setting on each edit; only re-decode a new tone
+            if os.path.exists(tone) and effect.source() != QUrl.fromLocalFile(tone):
+                effect.setSource(QUrl.fromLocalFile(tone))
+    
     def apply_theme(self, theme: str):
         """Apply theme to the application"""
         try:
@@ -403,14 +413,20 @@ class MainWindow(QMainWindow):
         except Exception as e:
             print(f"Error applying theme '{theme}': {e}")
     
+    def _on_sound_status_changed(self):
+        """Log a sound effect whose source could not be loaded"""
+        effect = self.sender()
+        if effect is not None and effect.status() == QSoundEffect.Error:
+            logger.warning(f"Could not load sound effect: {effect.source().toLocalFile()}")
+    
     def play_start_sound(self):
-        """Play start recording sound"""
-        if self.sound_enabled and self.sound_start.isLoaded():
+        """Play start recording sound (queued by Qt if the tone is still loading)"""
+        if self.sound_enabled:
             self.sound_start.play()
     
     def play_stop_sound(self):
-        """Play stop recording sound"""
-        if self.sound_enabled and self.sound_end.isLoaded():
+        """Play stop recording sound (queued by Qt if the tone is still loading)"""
+        if self.sound_enabled:
             self.sound_end.play()
     
     def init_system_tray(self):
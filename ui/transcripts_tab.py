@@ -13,10 +13,11 @@ class TranscriptsTab(BaseTab):
     def __init__(self, parent_app):
         super().__init__(parent_app)
         self.parent_app = parent_app  # Reference to the main application for callbacks
+        self._shown_transcripts = []  # Entries currently rendered, newest first
         
-        # Connect to parent's transcript update signal
+        # Connect to parent's transcript update signal (emitted from the transcription thread)
         if hasattr(parent_app, 'transcript_updated'):
-            parent_app.transcript_updated.connect(self.refresh_transcript_log)
+            parent_app.transcript_updated.connect(self.refresh_transcript_log, Qt.QueuedConnection)
         
         # Initial load of transcripts
         self.refresh_transcript_log()
@@ -50,15 +51,35 @@ class TranscriptsTab(BaseTab):
     
     def refresh_transcript_log(self):
         """Refresh the transcript history display"""
-        # Clear existing transcript widgets
-        for i in reversed(range(self.transcript_layout.count() - 1)):  # Keep the stretch
-            widget = self.transcript_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
-        
         # Get transcripts from controller
         transcripts = self.parent_app.controller.get_transcripts()
         
+        # New transcripts only arrive at the top and the oldest fall off the bounded
+        # history, so add widgets for the new entries instead of rebuilding them all
+        if self._shown_transcripts and transcripts:
+            new_count = next(
+                (i for i, t in enumerate(transcripts) if t is self._shown_transcripts[0]), None
+            )
+            if new_count is not None and all(
+                a is b for a, b in zip(transcripts[new_count:], self._shown_transcripts)
+            ):
+                for transcript in reversed(transcripts[:new_count]):
+                    self.transcript_layout.insertWidget(0, self.create_transcript_widget(transcript))
+                
+                # Drop widgets for entries evicted from the history
+                for i in reversed(range(len(transcripts), self.transcript_layout.count() - 1)):
+                    self._remove_layout_item(i)
+                
+                self._shown_transcripts = list(transcripts)
+                if new_count:
+                    self.transcript_scroll_area.verticalScrollBar().setValue(0)
+                return
+        
+        # Clear existing transcript widgets
+        for i in reversed(range(self.transcript_layout.count() - 1)):  # Keep the stretch
+            self._remove_layout_item(i)
+        self._shown_transcripts = list(transcripts)
+        
         if not transcripts:
             # Show empty state
             empty_label = QLabel("No transcripts yet.\nStart recording to see your transcript history here.")
@@ -78,6 +99,13 @@ class TranscriptsTab(BaseTab):
         # Scroll to top to show newest transcripts
         self.transcript_scroll_area.verticalScrollBar().setValue(0)
     
+    def _remove_layout_item(self, index: int):
+        """Take a transcript widget out of the layout and schedule its deletion."""
+        item = self.transcript_layout.takeAt(index)
+        widget = item.widget() if item is not None else None
+        if widget:
+            widget.deleteLater()
+    
     def create_transcript_widget(self, transcript: dict) -> QWidget:
         """Create a widget for a single transcript entry using layout system."""
         widget = QFrame()
@@ -119,6 +119,8 @@ class WaveformWidget(QWidget):
         self.update()
 
     def update_level(self, level: float) -> None:
+        # Called straight from the audio thread: only store the value here and
+        # leave repainting to the animation timer, which caps the paint rate
         self._level = max(0.0, min(1.0, level))
 
     def set_neon_tint(self, rgb_tuple: tuple[int, int, int]) -> None: